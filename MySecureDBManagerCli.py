@@ -0,0 +1,520 @@
+#!/usr/bin/env python
+"""
+Headless command-line entry point of the User Management System.
+
+Runs the same database layer as the GUI without ever importing tkinter, so
+it can be used from cron jobs and scripts:
+
+    MySecureDBManagerCli.py -d mydb migrate
+    MySecureDBManagerCli.py -d mydb list --sort lastName --format csv
+    MySecureDBManagerCli.py -d mydb search smith
+    MySecureDBManagerCli.py -d mydb import users.csv
+    MySecureDBManagerCli.py -d mydb export users.jsonl.gz
+    MySecureDBManagerCli.py -d mydb bulk-update --set accessLevel=admin < ids.txt
+    MySecureDBManagerCli.py -d mydb bulk-delete ids.txt
+
+Rows are written as they are read from the server, so output starts at
+once and memory use does not depend on the table size. The password is
+taken from the MYSQL_PWD environment variable, or prompted for.
+Host, user and database default to the GUI's saved connection details.
+Only ``migrate`` changes the schema; the other commands refuse to run on a
+database that is not at the latest schema version.
+"""
+
+import argparse
+import csv
+import getpass
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+# Columns of listed users, in output order; also the possible sort columns
+USER_COLUMNS = ("userId", "firstName", "lastName", "email", "accessLevel")
+
+# Users fetched per query by list and search
+PAGE_SIZE = 1000
+
+# Seconds between progress reports on a terminal
+PROGRESS_INTERVAL = 1.0
+
+OUTPUT_FORMATS = ("tsv", "csv", "jsonl")
+
+
+class RowWriter:
+    """Write users to a stream as TSV, CSV or JSON Lines, one row at a time."""
+    
+    def __init__(self, stream, fmt: str = "tsv", header: bool = True):
+        """Initialize the writer and write the header row if wanted.
+        
+        Args:
+            stream: Text stream to write to
+            fmt: One of OUTPUT_FORMATS
+            header: Write the column names first (TSV and CSV only)
+        """
+        self.stream = stream
+        self.fmt = fmt
+        self.count = 0
+        if fmt == "jsonl":
+            self._writer = None
+        else:
+            self._writer = csv.writer(stream, delimiter="\t" if fmt == "tsv" else ",", lineterminator="\n")
+            if header:
+                self._writer.writerow(USER_COLUMNS)
+    
+    def write(self, user):
+        """Write one user.
+        
+        Args:
+            user: User record or dictionary
+        """
+        values = [user[column] for column in USER_COLUMNS]
+        if self._writer is None:
+            self.stream.write(json.dumps(dict(zip(USER_COLUMNS, values)), ensure_ascii=False, default=str) + "\n")
+        else:
+            self._writer.writerow(values)
+        self.count += 1
+
+
+class Progress:
+    """Throttled progress line on stderr, shown only when stderr is a terminal."""
+    
+    def __init__(self, label: str):
+        """Initialize the progress line.
+        
+        Args:
+            label: Text shown before the count
+        """
+        self.label = label
+        self.enabled = sys.stderr.isatty()
+        self._last = 0.0
+    
+    def __call__(self, done: int, *details):
+        """Report progress, at most once per PROGRESS_INTERVAL.
+        
+        Args:
+            done: Number of items processed so far
+            *details: Ignored extra values passed by some progress callbacks
+        """
+        now = time.monotonic()
+        if self.enabled and now - self._last >= PROGRESS_INTERVAL:
+            self._last = now
+            print(f"\r{self.label}: {done:,}", end="", file=sys.stderr, flush=True)
+    
+    def done(self):
+        """End the progress line."""
+        if self.enabled and self._last:
+            print(file=sys.stderr)
+
+
+def _fail(message: str) -> int:
+    """Print an error message and return the failure exit status.
+    
+    Args:
+        message: Error message
+    
+    Returns:
+        int: Exit status 1
+    """
+    print(f"error: {message}", file=sys.stderr)
+    return 1
+
+
+def _open_input(path: str):
+    """Open an input file, or standard input for '-'.
+    
+    Args:
+        path: File path or '-'
+    
+    Returns:
+        Text stream
+    """
+    return sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+
+
+def _input_lines(stream):
+    """Yield the non-empty lines of a stream that are not # comments.
+    
+    Args:
+        stream: Text stream
+    
+    Yields:
+        tuple: (line number, stripped line)
+    """
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield number, line
+
+
+def _read_ids(stream):
+    """Lazily read user IDs, one per line.
+    
+    Args:
+        stream: Text stream
+    
+    Yields:
+        int: User ID
+    
+    Raises:
+        ValueError: If a line is not a user ID
+    """
+    for number, line in _input_lines(stream):
+        if not line.isdigit():
+            raise ValueError(f"line {number}: expected a user ID, got {line!r}")
+        yield int(line)
+
+
+def _read_changes(stream, assignments: dict):
+    """Lazily read user updates, one per line.
+    
+    A line holds either a user ID, which receives the ``--set`` changes, or
+    a JSON object with ``userId`` and the columns to change, which override
+    the ``--set`` changes for that user.
+    
+    Args:
+        stream: Text stream
+        assignments: Changes given with --set
+    
+    Yields:
+        tuple: (user ID, {column: new value})
+    
+    Raises:
+        ValueError: If a line is neither a user ID nor a JSON object with one
+    """
+    for number, line in _input_lines(stream):
+        if line.isdigit():
+            user_id, change = int(line), {}
+        else:
+            try:
+                change = json.loads(line)
+                user_id = int(change.pop("userId"))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                raise ValueError(f"line {number}: expected a user ID or a JSON object with a userId") from None
+        change = {**assignments, **change}
+        if not change:
+            raise ValueError(f"line {number}: no changes for user {user_id}")
+        yield user_id, change
+
+
+def _connect(args):
+    """Connect to the server and open the database named on the command line.
+    
+    Args:
+        args: Parsed command-line arguments
+    
+    Returns:
+        tuple: (DatabaseManager, None), or (None, error message)
+    """
+    # The database layer is only loaded once the arguments are valid, so
+    # --help and usage errors return at once
+    from database.db_manager import DatabaseManager
+    
+    if not args.database:
+        return None, "no database given, use --database"
+    
+    password = os.environ.get("MYSQL_PWD")
+    if password is None:
+        if not sys.stdin.isatty():
+            # Set MYSQL_PWD to an empty string for accounts without a password
+            return None, "no password given, set MYSQL_PWD or run on a terminal"
+        password = getpass.getpass(f"MySQL password for {args.user}@{args.host}: ")
+    
+    db_manager = DatabaseManager(allow_local_infile=args.config.get("allow_local_infile", False))
+    result = db_manager.connect_to_mysql(args.host, args.user, password)
+    if isinstance(result, tuple) or not result:
+        reason = result[1] if isinstance(result, tuple) else "connection refused"
+        return None, f"failed to connect to MySQL: {reason}"
+    
+    if not db_manager.select_database(args.database):
+        db_manager.close_connection()
+        return None, f"failed to select database {args.database}"
+    return db_manager, None
+
+
+def _check_schema(db_manager, args) -> Optional[str]:
+    """Make sure the database is at the latest schema version.
+    
+    Args:
+        db_manager: Connected database manager
+        args: Parsed command-line arguments
+    
+    Returns:
+        str: Error message, or None if the schema is up to date
+    """
+    from database.migrations import LATEST_VERSION
+    
+    version = db_manager.schema_version()
+    if version is None:
+        return f"failed to read the schema version of database {args.database}"
+    if version < LATEST_VERSION:
+        return (f"database {args.database} is at schema version {version} of {LATEST_VERSION}; "
+                f"run the migrate command first")
+    return None
+
+
+def cmd_migrate(db_manager, args) -> int:
+    """Bring the database up to the latest schema version."""
+    before = db_manager.schema_version()
+    if not db_manager.create_tables():
+        return _fail(f"failed to migrate database {args.database}")
+    after = db_manager.schema_version()
+    if before == after:
+        print(f"Database {args.database} is up to date at schema version {after}")
+    else:
+        print(f"Migrated database {args.database} from schema version {before} to {after}")
+    return 0
+
+
+def cmd_list(db_manager, args) -> int:
+    """List users, optionally sorted, as they are read from the server."""
+    writer = RowWriter(sys.stdout, args.format, header=not args.no_header)
+    remaining = args.limit
+    
+    if args.sort == "userId" and not args.desc:
+        # One unbuffered query streams the whole table in primary key order
+        for user in db_manager.iter_users(batch_size=PAGE_SIZE):
+            if remaining is not None and writer.count >= remaining:
+                break
+            writer.write(user)
+        return 0
+    
+    cursor = None
+    while True:
+        limit = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining - writer.count)
+        if limit <= 0:
+            return 0
+        users, cursor = db_manager.select_users_sorted(args.sort, args.desc, cursor, limit)
+        for user in users:
+            writer.write(user)
+        if cursor is None:
+            return 0
+
+
+def cmd_search(db_manager, args) -> int:
+    """Search users, ranked by relevance, as the pages arrive."""
+    writer = RowWriter(sys.stdout, args.format, header=not args.no_header)
+    text = " ".join(args.text)
+    remaining = args.limit
+    
+    cursor = None
+    while True:
+        limit = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining - writer.count)
+        if limit <= 0:
+            return 0
+        users, cursor = db_manager.search_users(text, limit, cursor)
+        for user in users:
+            writer.write(user)
+        if cursor is None:
+            return 0
+
+
+def cmd_import(db_manager, args) -> int:
+    """Import users from a CSV or JSON Lines file."""
+    from database.importer import import_users
+    
+    progress = Progress("Imported users")
+    result = import_users(
+        db_manager,
+        args.file,
+        batch_size=args.config.get("import_batch_size", 1000),
+        commit_interval=args.config.get("import_commit_interval", 10000),
+        use_load_data=args.load_data,
+        rejected_path=args.rejected,
+        progress=lambda read, total, inserted, rejected: progress(inserted)
+    )
+    progress.done()
+    
+    print(f"Imported {result.inserted:,} users in {result.elapsed:.1f} s ({result.rate:,.0f}/s)")
+    if result.rejected:
+        print(f"Rejected {result.rejected:,} rows, see {result.rejected_path}")
+    if result.failed:
+        return _fail("import failed; users inserted since the last commit were rolled back")
+    return 0
+
+
+def cmd_export(db_manager, args) -> int:
+    """Export users to a CSV or JSON Lines file."""
+    import mysql.connector
+    from database.exporter import export_users
+    
+    progress = Progress("Exported users")
+    try:
+        result = export_users(
+            db_manager,
+            args.file,
+            fmt=args.export_format,
+            include_login=args.include_login,
+            progress=progress
+        )
+    except ValueError as e:
+        return _fail(str(e))
+    except mysql.connector.Error as e:
+        return _fail(f"export failed: {e}")
+    finally:
+        progress.done()
+    
+    print(f"Exported {result.exported:,} users to {result.path} in {result.elapsed:.1f} s")
+    return 0
+
+
+def cmd_bulk_update(db_manager, args) -> int:
+    """Apply updates read from a file or standard input in one transaction."""
+    assignments = {}
+    for assignment in args.set or ():
+        column, separator, value = assignment.partition("=")
+        if not separator:
+            return _fail(f"--set expects COLUMN=VALUE, got {assignment!r}")
+        assignments[column] = value
+    
+    progress = Progress("Processed users")
+    try:
+        # An invalid line stops the update before its commit; closing the
+        # connection then discards what was already written
+        with _open_input(args.file) as stream:
+            updated = db_manager.update_users_bulk(_read_changes(stream, assignments), progress=progress)
+    except ValueError as e:
+        return _fail(str(e))
+    finally:
+        progress.done()
+    
+    if updated < 0:
+        return _fail("update failed and was rolled back")
+    print(f"Updated {updated:,} users")
+    return 0
+
+
+def cmd_bulk_delete(db_manager, args) -> int:
+    """Delete the users listed in a file or standard input in one transaction."""
+    progress = Progress("Processed users")
+    try:
+        with _open_input(args.file) as stream:
+            if args.dry_run:
+                print(f"Would delete up to {sum(1 for _ in _read_ids(stream)):,} users")
+                return 0
+            # As with bulk-update, an invalid line leaves nothing deleted
+            deleted = db_manager.delete_users(_read_ids(stream), progress=progress)
+    except ValueError as e:
+        return _fail(str(e))
+    finally:
+        progress.done()
+    
+    if deleted < 0:
+        return _fail("deletion failed and was rolled back")
+    print(f"Deleted {deleted:,} users")
+    return 0
+
+
+def build_parser(config) -> argparse.ArgumentParser:
+    """Build the command-line parser.
+    
+    Args:
+        config: Application configuration, for the default connection details
+    
+    Returns:
+        argparse.ArgumentParser: The parser
+    """
+    parser = argparse.ArgumentParser(
+        description="User Management System, headless mode",
+        epilog="The password is read from MYSQL_PWD, or prompted for on a terminal."
+    )
+    parser.add_argument("-H", "--host", default=config.get("host", "localhost"), help="MySQL server host")
+    parser.add_argument("-u", "--user", default=config.get("user", "root"), help="MySQL user")
+    parser.add_argument("-d", "--database", default=config.get("last_database") or None,
+                        help="database to open (default: the last one opened in the GUI)")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+    
+    migrate_command = commands.add_parser("migrate", help="create or upgrade the tables of the database")
+    migrate_command.set_defaults(handler=cmd_migrate)
+    
+    def add_output_options(command):
+        command.add_argument("--format", choices=OUTPUT_FORMATS, default="tsv", help="output format (default: tsv)")
+        command.add_argument("--no-header", action="store_true", help="omit the header row of tsv and csv")
+        command.add_argument("--limit", type=int, help="stop after this many users")
+    
+    list_command = commands.add_parser("list", help="list users")
+    list_command.add_argument("--sort", choices=USER_COLUMNS, default="userId", help="column to sort by")
+    list_command.add_argument("--desc", action="store_true", help="sort in descending order")
+    add_output_options(list_command)
+    list_command.set_defaults(handler=cmd_list)
+    
+    search_command = commands.add_parser("search", help="search users by name, email, access level or ID")
+    search_command.add_argument("text", nargs="+", help="search words")
+    add_output_options(search_command)
+    search_command.set_defaults(handler=cmd_search)
+    
+    import_command = commands.add_parser("import", help="import users from a CSV or JSON Lines file")
+    import_command.add_argument("file", help="file to import, optionally gzip-compressed")
+    import_command.add_argument("--rejected", help="where to write rejected rows (default: FILE.rejected.csv)")
+    import_command.add_argument("--load-data", action="store_true",
+                                help="load with LOAD DATA LOCAL INFILE (needs allow_local_infile)")
+    import_command.set_defaults(handler=cmd_import)
+    
+    export_command = commands.add_parser("export", help="export users to a CSV or JSON Lines file")
+    export_command.add_argument("file", help="file to write; .gz compresses")
+    export_command.add_argument("--format", dest="export_format", choices=("csv", "jsonl"),
+                                help="file format (default: from the file name)")
+    export_command.add_argument("--include-login", action="store_true", help="add login ID and username")
+    export_command.set_defaults(handler=cmd_export)
+    
+    update_command = commands.add_parser(
+        "bulk-update",
+        help="update users in one transaction",
+        description="Read one user ID, or one JSON object such as "
+                    '{"userId": 7, "email": "a@example.com"}, per line and update those users.'
+    )
+    update_command.add_argument("file", nargs="?", default="-", help="input file (default: standard input)")
+    update_command.add_argument("--set", action="append", metavar="COLUMN=VALUE",
+                                help="change applied to every listed user; may be repeated")
+    update_command.set_defaults(handler=cmd_bulk_update)
+    
+    delete_command = commands.add_parser("bulk-delete", help="delete users in one transaction",
+                                         description="Read one user ID per line and delete those users.")
+    delete_command.add_argument("file", nargs="?", default="-", help="input file (default: standard input)")
+    delete_command.add_argument("--dry-run", action="store_true", help="only count the IDs")
+    delete_command.set_defaults(handler=cmd_bulk_delete)
+    
+    return parser
+
+
+def main(argv=None) -> int:
+    """Parse the command line and run the command.
+    
+    Args:
+        argv: Arguments, defaults to sys.argv[1:]
+    
+    Returns:
+        int: Exit status
+    """
+    from utils.config import AppConfig
+    
+    config = AppConfig()
+    args = build_parser(config).parse_args(argv)
+    args.config = config
+    
+    db_manager, error = _connect(args)
+    if db_manager is None:
+        return _fail(error)
+    
+    try:
+        if args.handler is not cmd_migrate:
+            error = _check_schema(db_manager, args)
+            if error is not None:
+                return _fail(error)
+        
+        status = args.handler(db_manager, args)
+        sys.stdout.flush()
+        return status
+    except BrokenPipeError:
+        # The reader went away, e.g. "list | head"; stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        db_manager.close_connection()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,39 +1,74 @@
 #!/usr/bin/env python
 """
 Main entry point for the User Management System GUI application.
-"""
 
-import tkinter as tk
-from tkinter import messagebox
+Run with --profile-startup to print how long each startup phase and each
+imported module took once the login window is visible.
+"""
 
-from gui.login_screen import LoginScreen
-from utils.config import AppConfig
+import argparse
+from contextlib import nullcontext
 
 def main():
     """Initialize and run the application."""
+    parser = argparse.ArgumentParser(description="User Management System")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report import and construction times once the login window is shown")
+    args = parser.parse_args()
+    
+    profiler = None
+    if args.profile_startup:
+        from utils.startup_profile import StartupProfiler
+        profiler = StartupProfiler()
+        profiler.install()
+    phase = profiler.phase if profiler else lambda name: nullcontext()
+    
+    # The login screen only needs Tk; the database modules are loaded in
+    # the background once the window is up
+    with phase("import GUI modules"):
+        import tkinter as tk
+        from gui.login_screen import LoginScreen
+        from utils.background import BackgroundExecutor
+        from utils.config import AppConfig
+    
     # Create the main application window
-    root = tk.Tk()
-    root.title("User Management System")
-    root.geometry("800x600")
-    root.minsize(800, 600)
+    with phase("create main window"):
+        root = tk.Tk()
+        root.title("User Management System")
+        root.geometry("800x600")
+        root.minsize(800, 600)
     
     # Initialize app configuration
-    config = AppConfig()
+    with phase("load configuration"):
+        config = AppConfig()
 
     # Set app icon if available
     try:
         root.iconbitmap("assets/icon.ico")
     except tk.TclError:
         pass  # Icon file not found, continue without setting icon
-        
+    
     # Apply theme settings
-    style = config.apply_theme(root)
+    with phase("apply theme"):
+        style = config.apply_theme(root)
 
+    # Run database calls on worker threads so the window never freezes
+    with phase("start background workers"):
+        executor = BackgroundExecutor(root)
+        executor.add_busy_listener(lambda busy: root.config(cursor="watch" if busy else ""))
+    
     # Start with the login screen
-    app = LoginScreen(root, config)
+    with phase("build login screen"):
+        app = LoginScreen(root, config, executor)
+    
+    if profiler is not None:
+        root.wait_visibility(root)
+        profiler.mark("login window visible")
+        profiler.uninstall()
+        profiler.report()
     
     # Start the application main loop
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,341 @@
+"""
+Micro-benchmarks of DatabaseManager operations against a local MySQL server.
+
+Each run creates a throwaway database, grows the User table through the
+requested sizes and times every operation at each size. Results are
+written as JSON so that runs from different commits can be compared; the
+compare mode exits with status 1 when an operation became slower than the
+allowed threshold.
+
+Usage:
+    python benchmarks/db_benchmarks.py --user root --output results.json
+    python benchmarks/db_benchmarks.py --user root --sizes 10000 --compare baseline.json
+    python benchmarks/db_benchmarks.py --compare-only baseline.json results.json
+
+The password is read from the MYSQL_PWD environment variable, or prompted for.
+"""
+
+import argparse
+from datetime import datetime, timezone
+import getpass
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.db_manager import DatabaseManager, MIN_BCRYPT_ROUNDS
+
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+
+# Every benchmark user with an ID below this has a login
+LOGIN_COUNT = 10000
+
+# Number of timed calls per operation and size
+DEFAULT_REPEAT = 200
+
+# Whole-table operations are much slower, so they are timed fewer times
+FULL_SCAN_REPEAT = 3
+
+# Hashing is deliberately slow, so insert_login is timed fewer times
+HASH_REPEAT = 10
+
+SEED = 42
+
+
+def summarize(samples):
+    """Summarize latency samples.
+    
+    Args:
+        samples: Durations in seconds
+    
+    Returns:
+        dict: Count, mean, percentiles and throughput, latencies in milliseconds
+    """
+    ordered = sorted(samples)
+    
+    def percentile(percent):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))] * 1000
+    
+    total = sum(ordered)
+    return {
+        "count": len(ordered),
+        "mean_ms": total / len(ordered) * 1000,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "min_ms": ordered[0] * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "ops_per_s": len(ordered) / total if total else 0.0
+    }
+
+
+def timed(repeat, operation):
+    """Time repeated calls of an operation.
+    
+    Args:
+        repeat: Number of calls
+        operation: Callable receiving the call number
+    
+    Returns:
+        dict: Summary of the call durations
+    """
+    samples = []
+    for number in range(repeat):
+        started = time.perf_counter()
+        operation(number)
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def user_rows(start, count, rng):
+    """Generate reproducible user tuples.
+    
+    Args:
+        start: Number of the first user
+        count: Number of users
+        rng: Random number generator
+    
+    Yields:
+        tuple: (first_name, last_name, email, access_level)
+    """
+    for number in range(start, start + count):
+        yield (
+            f"First{rng.randrange(5000)}",
+            f"Last{rng.randrange(20000)}",
+            f"user{number}@example.com",
+            "admin" if rng.random() < 0.1 else "basic"
+        )
+
+
+def grow_users(db, size, rng):
+    """Insert users until the User table holds size rows.
+    
+    Args:
+        db: Connected DatabaseManager
+        size: Target row count
+        rng: Random number generator
+    """
+    current = db.count_users()
+    if current < size:
+        db.insert_users_bulk(user_rows(current, size - current, rng), batch_size=1000, commit_interval=50000)
+
+
+def seed_logins(db):
+    """Give the first LOGIN_COUNT users a login, sharing one precomputed hash.
+    
+    Args:
+        db: Connected DatabaseManager
+    
+    Returns:
+        list: IDs of the users with a login
+    """
+    hashed = db._encrypt_password("benchmark")
+    with db.session() as cursor:
+        cursor.execute("SELECT userId FROM User ORDER BY userId LIMIT %s", (LOGIN_COUNT,))
+        user_ids = [user_id for (user_id,) in cursor.fetchall()]
+        cursor.executemany(
+            "INSERT IGNORE INTO Login (userId, username, password) VALUES (%s, %s, %s)",
+            [(user_id, f"login{user_id}", hashed) for user_id in user_ids]
+        )
+        db.connection.commit()
+    return user_ids
+
+
+def id_range(db):
+    """Return the lowest and highest user ID."""
+    with db.session() as cursor:
+        cursor.execute("SELECT MIN(userId), MAX(userId) FROM User")
+        return cursor.fetchone()
+
+
+def run_size(db, size, repeat, rng):
+    """Benchmark every operation at one table size.
+    
+    Args:
+        db: Connected DatabaseManager with the benchmark database selected
+        size: Number of users in the table
+        repeat: Number of timed calls per point operation
+        rng: Random number generator
+    
+    Returns:
+        dict: Summary per operation name
+    """
+    low, high = id_range(db)
+    login_ids = seed_logins(db)
+    random_id = lambda: rng.randint(low, high)
+    results = {}
+    
+    def run(name, count, operation):
+        print(f"  {name:<28}", end="", flush=True)
+        results[name] = timed(count, operation)
+        print(f"p50 {results[name]['p50_ms']:9.3f} ms   p99 {results[name]['p99_ms']:9.3f} ms")
+    
+    run("select_user_by_id", repeat, lambda n: db.select_user_by_id(random_id()))
+    run("select_login_by_username", repeat,
+        lambda n: db.select_login_by_username(f"login{rng.choice(login_ids)}"))
+    run("authenticate", min(repeat, HASH_REPEAT),
+        lambda n: db.authenticate(f"login{rng.choice(login_ids)}", "benchmark"))
+    run("select_users_page", repeat, lambda n: db.select_users_page(random_id(), 200))
+    run("select_users_sorted", repeat,
+        lambda n: db.select_users_sorted("lastName", False, (f"Last{rng.randrange(20000)}", "", 0), 200))
+    run("search_users", repeat, lambda n: db.search_users(f"last{rng.randrange(20000)}"))
+    run("count_users", repeat, lambda n: db.count_users())
+    run("update_user", repeat, lambda n: db.update_user(random_id(), first_name=f"First{rng.randrange(5000)}"))
+    
+    new_ids = []
+    run("insert_user", repeat,
+        lambda n: new_ids.append(db.insert_user("Bench", "User", f"bench{size}_{n}@example.com", "basic")))
+    run("insert_login", min(repeat, HASH_REPEAT),
+        lambda n: db.insert_login(new_ids[n], f"bench{size}_{n}", "benchmark"))
+    run("delete_user", repeat, lambda n: db.delete_user(new_ids[n]))
+    
+    sample = rng.sample(range(low, high + 1), min(1000, high - low + 1))
+    run("update_users_bulk_1000", FULL_SCAN_REPEAT,
+        lambda n: db.update_users_bulk({user_id: {"accessLevel": "basic"} for user_id in sample}))
+    run("select_all_users", FULL_SCAN_REPEAT, lambda n: db.select_all_users())
+    run("select_all_users_columnar", FULL_SCAN_REPEAT, lambda n: db.select_all_users(columnar=True))
+    
+    _, last_id = id_range(db)
+    run("insert_users_bulk_1000", FULL_SCAN_REPEAT,
+        lambda n: db.insert_users_bulk(user_rows(size + n * 1000, 1000, rng)))
+    with db.session() as cursor:
+        cursor.execute("SELECT userId FROM User WHERE userId > %s ORDER BY userId", (last_id,))
+        bulk_ids = [user_id for (user_id,) in cursor.fetchall()]
+    run("delete_users_1000", FULL_SCAN_REPEAT,
+        lambda n: db.delete_users(bulk_ids[n * 1000:(n + 1) * 1000]))
+    
+    return results
+
+
+def git_commit():
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold):
+    """Print the change of every operation and collect regressions.
+    
+    Operations are compared on their median latency, which is the most
+    stable statistic across runs.
+    
+    Args:
+        baseline: Results of the reference run
+        current: Results of the new run
+        threshold: Allowed relative slowdown, e.g. 0.1 for 10%
+    
+    Returns:
+        list: (size, operation, ratio) of every regression
+    """
+    regressions = []
+    print(f"\n{'size':>9}  {'operation':<28}{'baseline':>12}{'current':>12}{'change':>9}")
+    for size, operations in current["results"].items():
+        for name, stats in operations.items():
+            reference = baseline["results"].get(size, {}).get(name)
+            if reference is None or not reference["p50_ms"]:
+                continue
+            ratio = stats["p50_ms"] / reference["p50_ms"]
+            flag = "  REGRESSION" if ratio > 1 + threshold else ""
+            print(
+                f"{int(size):>9,}  {name:<28}{reference['p50_ms']:>9.3f} ms"
+                f"{stats['p50_ms']:>9.3f} ms{(ratio - 1) * 100:>+8.1f}%{flag}"
+            )
+            if flag:
+                regressions.append((size, name, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--user", default="root")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated User table sizes (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="timed calls per point operation (default: %(default)s)")
+    parser.add_argument("--pool-size", type=int, default=0,
+                        help="connection pool size, 0 for a single connection (default: %(default)s)")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results with a previous JSON file")
+    parser.add_argument("--compare-only", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="compare two JSON files without running anything")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative p50 slowdown reported as a regression (default: %(default)s)")
+    parser.add_argument("--keep-database", action="store_true", help="do not drop the benchmark database")
+    args = parser.parse_args()
+    
+    if args.compare_only:
+        with open(args.compare_only[0]) as baseline_file, open(args.compare_only[1]) as current_file:
+            regressions = compare(json.load(baseline_file), json.load(current_file), args.threshold)
+        sys.exit(1 if regressions else 0)
+    
+    password = os.environ.get("MYSQL_PWD")
+    if password is None:
+        password = getpass.getpass(f"MySQL password for {args.user}@{args.host}: ")
+    
+    # Hash at the library default cost so insert_login results are comparable between hosts
+    db = DatabaseManager(pool_size=args.pool_size, bcrypt_rounds=MIN_BCRYPT_ROUNDS)
+    connected = db.connect_to_mysql(args.host, args.user, password)
+    if connected is not True:
+        sys.exit(f"Could not connect to MySQL: {connected[1]}")
+    
+    db_name = f"benchmark_{os.getpid()}_{int(time.time())}"
+    if not db.create_database(db_name) or not db.create_tables():
+        sys.exit(f"Could not create the benchmark database {db_name}")
+    
+    with db.session() as cursor:
+        cursor.execute("SELECT VERSION()")
+        (server_version,) = cursor.fetchone()
+    
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "server_version": server_version,
+            "pool_size": args.pool_size,
+            "repeat": args.repeat,
+            "seed": SEED
+        },
+        "results": {}
+    }
+    
+    rng = random.Random(SEED)
+    try:
+        for size in sorted(int(size) for size in args.sizes.split(",")):
+            print(f"Growing the User table to {size:,} rows...")
+            grow_users(db, size, rng)
+            print(f"Benchmarking at {size:,} rows")
+            report["results"][str(size)] = run_size(db, size, args.repeat, rng)
+    finally:
+        if not args.keep_database:
+            with db.session() as cursor:
+                cursor.execute(f"DROP DATABASE IF EXISTS {db_name}")
+        db.close_connection()
+    
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+        print(f"\nResults written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(json.load(baseline_file), report, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
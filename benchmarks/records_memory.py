@@ -0,0 +1,102 @@
+"""
+Memory benchmark for query result representations.
+
+Compares holding a large User result set as one dictionary per row (the
+previous representation), as UserRecord objects and as a ColumnarResult.
+Rows are generated the way the MySQL driver returns them, with a new
+string object for every value, so no database is needed.
+
+Usage:
+    python benchmarks/records_memory.py [--rows 1000000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.records import ColumnarResult, UserRecord, USER_FIELDS
+
+
+def driver_rows(count):
+    """Generate User rows shaped like cursor results.
+    
+    Args:
+        count: Number of rows
+    
+    Yields:
+        tuple: (userId, firstName, lastName, email, accessLevel)
+    """
+    levels = (b"basic", b"admin")
+    for user_id in range(1, count + 1):
+        yield (
+            user_id,
+            f"First{user_id % 5000}",
+            f"Last{user_id % 20000}",
+            f"user{user_id}@example.com",
+            # Decoding creates a new string per row, as the driver does
+            levels[user_id % 10 == 0].decode()
+        )
+
+
+def as_dicts(rows):
+    return [dict(zip(USER_FIELDS, row)) for row in rows]
+
+
+def as_records(rows):
+    return UserRecord.from_rows(rows)
+
+
+def as_columnar(rows):
+    result = ColumnarResult(UserRecord)
+    result.extend(rows)
+    return result
+
+
+def measure(build, count):
+    """Measure the memory held by a result set and the time to build it.
+    
+    Args:
+        build: Function turning a row iterator into a result set
+        count: Number of rows
+    
+    Returns:
+        tuple: (bytes held, seconds to build)
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build(driver_rows(count))
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    # Touch the result so the access path is exercised too
+    assert result[count - 1]["email"] == f"user{count}@example.com"
+    del result
+    return size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000, help="number of rows (default: 1,000,000)")
+    args = parser.parse_args()
+    
+    print(f"{args.rows:,} rows")
+    print(f"{'representation':<16}{'memory':>12}{'bytes/row':>12}{'build':>10}{'vs dict':>10}")
+    baseline = None
+    for name, build in (("dict", as_dicts), ("UserRecord", as_records), ("ColumnarResult", as_columnar)):
+        size, elapsed = measure(build, args.rows)
+        baseline = baseline or size
+        print(
+            f"{name:<16}{size / 2**20:>9.1f} MiB{size / args.rows:>12.0f}"
+            f"{elapsed:>9.2f}s{baseline / size:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
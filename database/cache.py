@@ -0,0 +1,205 @@
+"""
+Bounded read-through cache for point lookups.
+"""
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+
+class RecordCache:
+    """Thread-safe LRU cache with a time-to-live and tag-based invalidation.
+    
+    Entries are tagged with the rows they were read from, e.g.
+    ``("user", 42)``, so a write can drop every cached lookup that includes
+    the row without knowing the keys those lookups were cached under.
+    
+    A lookup that misses takes a token from ``begin_read`` before querying
+    and hands it to ``put``. If anything was invalidated in between, the
+    result may predate the write and is not cached.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize an empty cache.
+        
+        Args:
+            max_size: Maximum number of entries; the least recently used entry is evicted
+            ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+                Bounds staleness after changes made by other clients.
+            clock: Monotonic time source
+        """
+        self.max_size = max(1, int(max_size))
+        self.ttl = ttl
+        self._clock = clock
+        # Key -> (value, expiry time, tags)
+        self._entries = OrderedDict()
+        # Tag -> keys of the entries carrying it
+        self._tags = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable):
+        """Look up an entry.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, expires, _ = entry
+            if expires is not None and self._clock() >= expires:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def begin_read(self) -> int:
+        """Return a token to pass to put after reading from the database."""
+        with self._lock:
+            return self._version
+    
+    def put(self, key: Hashable, value, tags: Iterable[Hashable] = (), token: Optional[int] = None):
+        """Store an entry.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            tags: Rows the value was read from
+            token: Value of begin_read taken before the database read
+        """
+        with self._lock:
+            if token is not None and token != self._version:
+                # Something was written while the value was being read
+                return
+            
+            if key in self._entries:
+                self._remove(key)
+            tags = tuple(tags)
+            expires = self._clock() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (value, expires, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+    
+    def invalidate(self, tags: Iterable[Hashable]):
+        """Drop every entry carrying one of the tags.
+        
+        Args:
+            tags: Tags of the rows that were written
+        """
+        with self._lock:
+            self._version += 1
+            self._invalidate(tags)
+    
+    def write_through(self, key: Hashable, apply: Callable, tags: Iterable[Hashable], token: int):
+        """Invalidate the tags of a write but keep the written entry, updated.
+        
+        The entry under key is replaced with ``apply(value)``, so the next
+        lookup of the row just written is still served from memory. Other
+        entries carrying the tags are dropped as with invalidate.
+        
+        Args:
+            key: Cache key of the entry that was written
+            apply: Function returning the updated copy of the cached value
+            tags: Tags of the rows that were written
+            token: Value of begin_read taken before the write; if anything
+                else was invalidated since, the entry is dropped instead
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            current = token == self._version
+            self._version += 1
+            tags = tuple(tags)
+            self._invalidate(tags)
+            if entry is None or not current:
+                return
+            
+            value, expires, entry_tags = entry
+            if expires is not None and self._clock() >= expires:
+                return
+            self._entries[key] = (apply(value), expires, entry_tags)
+            for tag in entry_tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self.invalidations -= 1
+    
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._version += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tags.clear()
+    
+    def _invalidate(self, tags: Iterable[Hashable]):
+        """Drop every entry carrying one of the tags; the lock must be held.
+        
+        Args:
+            tags: Tags of the rows that were written
+        """
+        for tag in tags:
+            for key in tuple(self._tags.get(tag, ())):
+                self._remove(key)
+                self.invalidations += 1
+    
+    def _remove(self, key: Hashable):
+        """Remove an entry and its tag references; the lock must be held.
+        
+        Args:
+            key: Cache key of an existing entry
+        """
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+    
+    def stats(self) -> Dict:
+        """Return the cache counters.
+        
+        Returns:
+            Dict: Size, hits, misses, hit rate, evictions, expirations and invalidations
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+    
+    def reset_stats(self):
+        """Zero the counters without dropping entries."""
+        with self._lock:
+            self.hits = self.misses = 0
+            self.evictions = self.expirations = self.invalidations = 0
@@ -3,19 +3,358 @@ Database Manager module for handling all database operations.
 """
 
 import mysql.connector
+import mysql.connector.pooling
+from mysql.connector import errorcode
+from mysql.connector.constants import ClientFlag
 import bcrypt
-from typing import Dict, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+import itertools
+import os
 import re
+import threading
+import time
+import weakref
+
+from database.cache import RecordCache
+from database.instrumentation import Instrumentation, TimedCursor
+from database.migrations import (LATEST_VERSION, USER_CHANGE_COLUMN, USER_CHANGE_INDEXES,
+                                 USER_CHANGE_LOG_TABLE, USER_SEARCH_INDEXES, current_version, migrate)
+from database.records import ColumnarResult, LoginRecord, UserRecord
+from database.throttle import LoginThrottle
+
+
+# Pool names must be unique per process, so each pooled manager gets its own
+_pool_counter = itertools.count(1)
+
+# Words shorter than InnoDB's default innodb_ft_min_token_size are not in the
+# FULLTEXT index and are matched with LIKE instead
+FULLTEXT_MIN_WORD = 3
+
+# In the order of the accessLevel ENUM definition
+ACCESS_LEVELS = ('basic', 'admin')
+
+# User columns that update_user and update_users_bulk may change
+USER_UPDATE_FIELDS = ('firstName', 'lastName', 'email', 'accessLevel')
+
+# Orderings of select_users_sorted: sort column -> ORDER BY columns. Each ends
+# with the primary key so the order is total, and each is served by an index
+# (see USER_SORT_INDEXES)
+USER_SORT_KEYS = {
+    'userId': ('userId',),
+    'firstName': ('firstName', 'lastName', 'userId'),
+    'lastName': ('lastName', 'firstName', 'userId'),
+    'email': ('email', 'userId'),
+    'accessLevel': ('accessLevel', 'userId')
+}
+
+# Entries of the User change log are kept this long, and pruned by every
+# this many-th writer
+USER_CHANGE_LOG_RETENTION_HOURS = 24
+USER_CHANGE_LOG_PRUNE_EVERY = 1000
+
+# bcrypt cost bounds; the lower bound is the library default, so calibration
+# can make hashing slower on fast hardware but never weaker
+MIN_BCRYPT_ROUNDS = 12
+MAX_BCRYPT_ROUNDS = 20
+
+# Logins that may wait for a bcrypt worker, per worker, and seconds a login
+# waits for a place in that queue before it is turned away
+AUTH_QUEUE_PER_WORKER = 8
+AUTH_QUEUE_TIMEOUT = 5.0
+
+
+class AuthResult(NamedTuple):
+    """Outcome of DatabaseManager.authenticate."""
+    
+    # The login and its user if the credentials were accepted
+    login: Optional[LoginRecord]
+    # Seconds to wait before trying again when the attempt was refused
+    # without checking the password (throttled or overloaded), or when this
+    # failure locked the username
+    retry_after: float = 0.0
+    
+    @property
+    def authenticated(self) -> bool:
+        """Whether the credentials were accepted."""
+        return self.login is not None
+
+
+def hash_rounds(hashed_password: str) -> int:
+    """Read the cost factor from a bcrypt hash such as '$2b$12$...'.
+    
+    Args:
+        hashed_password: bcrypt hash
+    
+    Returns:
+        int: Cost factor, or 0 if the hash cannot be parsed
+    """
+    try:
+        return int(hashed_password.split('$')[2])
+    except (IndexError, ValueError):
+        return 0
+
+
+def _keyset_condition(columns: Tuple[str, ...], values: tuple, descending: bool,
+                      nullable: Tuple[str, ...] = ()) -> Tuple[str, list]:
+    """Build the WHERE condition selecting the rows after a keyset cursor.
+    
+    ``(a, b) > (x, y)`` is spelled out as ``a > x OR (a <=> x AND b > y)``
+    behind a redundant ``a >= x``, which MySQL turns into an index range scan.
+    NULL sorts first in ascending and last in descending order, as in ORDER BY.
+    
+    Args:
+        columns: ORDER BY columns
+        values: Values of the columns in the last row of the previous page
+        descending: Whether the columns are sorted in descending order
+        nullable: Columns that may hold NULL
+    
+    Returns:
+        Tuple[str, list]: SQL condition and its parameters
+    """
+    op = '<' if descending else '>'
+    
+    def after(column, value, inclusive=False):
+        if value is None:
+            # NULL is followed by every other value ascending and by nothing descending
+            return None if descending else f"{column} IS NOT NULL"
+        condition = f"{column} {op}{'=' if inclusive else ''} %s"
+        if descending and column in nullable:
+            condition = f"({condition} OR {column} IS NULL)"
+        return condition
+    
+    branches = []
+    params = []
+    for index, column in enumerate(columns):
+        condition = after(column, values[index])
+        if condition is None:
+            continue
+        terms = [f"{previous} <=> %s" for previous in columns[:index]]
+        params.extend(values[:index])
+        terms.append(condition)
+        if values[index] is not None:
+            params.append(values[index])
+        branches.append(f"({' AND '.join(terms)})")
+    
+    condition = ' OR '.join(branches) or 'FALSE'
+    leading = after(columns[0], values[0], inclusive=True)
+    if leading is not None and len(columns) > 1 and values[0] is not None:
+        condition = f"{leading} AND ({condition})"
+        params.insert(0, values[0])
+    return condition, params
+
+
+def calibrate_bcrypt_rounds(target_ms: float = 250) -> int:
+    """Pick the highest bcrypt cost whose hash time fits a latency budget.
+    
+    Each extra round doubles the hashing time, so one measurement at the
+    minimum cost is enough to extrapolate; the chosen cost is then measured
+    once more to correct for the estimate.
+    
+    Args:
+        target_ms: Target time in milliseconds for one hash on this host
+    
+    Returns:
+        int: Cost factor between MIN_BCRYPT_ROUNDS and MAX_BCRYPT_ROUNDS
+    """
+    def measure(rounds):
+        started = time.perf_counter()
+        bcrypt.hashpw(b'calibration', bcrypt.gensalt(rounds=rounds))
+        return (time.perf_counter() - started) * 1000
+    
+    rounds = MIN_BCRYPT_ROUNDS
+    elapsed = measure(rounds)
+    while rounds < MAX_BCRYPT_ROUNDS and elapsed * 2 <= target_ms:
+        rounds += 1
+        elapsed *= 2
+    
+    if rounds > MIN_BCRYPT_ROUNDS and measure(rounds) > target_ms * 1.5:
+        rounds -= 1
+    
+    return rounds
+
+
+def _uses_session(method):
+    """Run a DatabaseManager method inside a (possibly shared) session.
+    
+    Nested calls on the same thread reuse the session that is already open,
+    so methods can freely call each other. With instrumentation enabled the
+    call is timed, including any wait for a free connection.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            with self.session():
+                return method(self, *args, **kwargs)
+        
+        previous = instrumentation.begin_method()
+        started = time.perf_counter()
+        try:
+            with self.session():
+                return method(self, *args, **kwargs)
+        finally:
+            instrumentation.end_method(method.__name__, time.perf_counter() - started, previous)
+    return wrapper
+
+
+def _read_through(kind: str):
+    """Serve a point lookup from the manager's cache when it has one.
+    
+    Hits return without opening a session. Misses run the lookup and cache
+    the record, tagged with the user (and login) it was read from so that
+    writes to those rows invalidate it. Callers get their own copy of the
+    record, since records are mutable.
+    
+    Args:
+        kind: Cache key prefix of the lookup
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, key):
+            cache = self.cache
+            if cache is None:
+                return method(self, key)
+            
+            cached = cache.get((kind, key))
+            if cached is not None:
+                return cached.copy()
+            
+            token = cache.begin_read()
+            record = method(self, key)
+            if record is not None:
+                tags = [("user", record["userId"])]
+                if "loginId" in record:
+                    tags.append(("login", record["loginId"]))
+                cache.put((kind, key), record.copy(), tags, token)
+            return record
+        return wrapper
+    return decorator
 
 
 class DatabaseManager:
-    """Manager class for database operations including connection and CRUD operations."""
+    """Manager class for database operations including connection and CRUD operations.
+    
+    The manager runs in one of two modes. With ``pool_size`` of 0 it keeps a
+    single connection and serializes access to it with a lock. With a positive
+    ``pool_size`` it keeps a ``mysql.connector.pooling`` pool and every thread
+    checks out its own connection and cursor for the duration of a session,
+    so background work and the GUI can query in parallel.
+    
+    The high-volume point queries run as server-side prepared statements
+    that are cached per connection, so the server parses their SQL once per
+    connection rather than on every call. With a RecordCache, repeated
+    point lookups are answered from memory until a write through this
+    manager invalidates them or their time-to-live runs out.
+    """
     
-    def __init__(self):
-        """Initialize database manager with empty connection."""
-        self.connection = None
-        self.cursor = None
+    def __init__(self, pool_size: int = 0, allow_local_infile: bool = False,
+                 bcrypt_rounds: Optional[int] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 cache: Optional[RecordCache] = None,
+                 auth_workers: Optional[int] = None,
+                 login_throttle: Optional[LoginThrottle] = None):
+        """Initialize database manager with empty connection.
+        
+        Args:
+            pool_size: Number of pooled connections, or 0 for a single connection
+            allow_local_infile: Allow LOAD DATA LOCAL INFILE for bulk imports
+            bcrypt_rounds: bcrypt cost factor for new hashes, see calibrate_bcrypt_rounds
+            instrumentation: Optional Instrumentation recording method and statement timings
+            cache: Optional RecordCache for select_user_by_id and select_login_by_username
+            auth_workers: Number of bcrypt threads of authenticate, defaults to the number of CPU cores
+            login_throttle: Throttle of failed authenticate calls, a default LoginThrottle if None
+        """
+        self.pool_size = max(0, min(int(pool_size or 0), mysql.connector.pooling.CNX_POOL_MAXSIZE))
+        self.allow_local_infile = allow_local_infile
+        self.bcrypt_rounds = max(int(bcrypt_rounds or MIN_BCRYPT_ROUNDS), MIN_BCRYPT_ROUNDS)
+        self.instrumentation = instrumentation
+        self.cache = cache
+        self.login_throttle = login_throttle if login_throttle is not None else LoginThrottle()
+        self.auth_workers = max(1, int(auth_workers or os.cpu_count() or 1))
         self.db_name = None
+        # Database name -> schema version known to be applied
+        self._schema_versions = {}
+        self._connection = None
+        self._cursor = None
+        self._pool = None
+        self._pool_slots = None
+        self._connect_args = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        # Raw connection -> (connection ID, {query: prepared cursor})
+        self._statements = weakref.WeakKeyDictionary()
+        self._statements_lock = threading.Lock()
+        self._auth_pool = None
+        self._auth_slots = threading.BoundedSemaphore(self.auth_workers * (AUTH_QUEUE_PER_WORKER + 1))
+        self._auth_lock = threading.Lock()
+        # bcrypt cost -> hash that unknown usernames are checked against
+        self._dummy_hashes = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_connection()
+        return False
+    
+    @property
+    def connection(self):
+        """The connection of the current thread's session, or the shared one."""
+        connection = getattr(self._local, "connection", None)
+        return connection if connection is not None else self._connection
+    
+    @property
+    def cursor(self):
+        """The cursor of the current thread's session, or the shared one."""
+        cursor = getattr(self._local, "cursor", None)
+        return cursor if cursor is not None else self._cursor
+    
+    def _cursor_for(self, connection, **options):
+        """Open a cursor, timed if instrumentation is enabled.
+        
+        Args:
+            connection: Connection to open the cursor on
+            **options: Cursor options such as prepared=True
+        
+        Returns:
+            The cursor, wrapped in a TimedCursor when instrumented
+        """
+        cursor = connection.cursor(**options)
+        if self.instrumentation is not None:
+            return TimedCursor(cursor, self.instrumentation)
+        return cursor
+    
+    def _invalidate(self, tags: Iterable[Tuple[str, int]]):
+        """Drop cached lookups that include the given rows.
+        
+        Args:
+            tags: ("user", user ID) or ("login", login ID) of the rows written
+        """
+        if self.cache is not None:
+            self.cache.invalidate(tags)
+    
+    def invalidate_users(self, user_ids: Optional[Iterable[int]] = None):
+        """Drop cached lookups of users changed outside this manager.
+        
+        Args:
+            user_ids: IDs of the changed users, or None to drop everything
+        """
+        if self.cache is None:
+            return
+        if user_ids is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(("user", user_id) for user_id in user_ids)
+    
+    @property
+    def is_pooled(self) -> bool:
+        """Whether the manager is connected through a connection pool."""
+        return self._pool is not None
     
     def connect_to_mysql(self, host: str, user: str, password: str) -> bool:
         """Connect to MySQL server with the provided credentials.
@@ -29,16 +368,247 @@ class DatabaseManager:
             bool: True if connection was successful, False otherwise
         """
         try:
-            self.connection = mysql.connector.connect(
-                host=host,
-                user=user,
-                password=password
-            )
-            self.cursor = self.connection.cursor()
+            self._connect_args = {
+                "host": host,
+                "user": user,
+                "password": password,
+                "allow_local_infile": self.allow_local_infile,
+                # Report matched rather than changed rows, so an UPDATE that
+                # leaves every value as it was still counts as a success
+                "client_flags": [ClientFlag.FOUND_ROWS]
+            }
+            if self.pool_size:
+                self._pool = mysql.connector.pooling.MySQLConnectionPool(
+                    pool_name=f"user_management_{next(_pool_counter)}",
+                    pool_size=self.pool_size,
+                    # Resetting the session on return would deallocate the
+                    # connection's prepared statements. session() rolls back
+                    # any open transaction before returning a connection, so
+                    # the next borrower never inherits a snapshot or writes
+                    pool_reset_session=False,
+                    **self._connect_args
+                )
+                self._pool_slots = threading.BoundedSemaphore(self.pool_size)
+            else:
+                self._connection = mysql.connector.connect(**self._connect_args)
+                self._cursor = self._cursor_for(self._connection)
             return True
         except mysql.connector.Error as err:
             return False, str(err)
     
+    @contextmanager
+    def session(self):
+        """Check out a connection and cursor for the current thread.
+        
+        Inside the block ``self.connection`` and ``self.cursor`` refer to the
+        checked-out pair, so the regular query methods can be used as-is. In
+        single-connection mode the shared connection is locked instead.
+        
+        If the block raises, the transaction is rolled back, so writes of the
+        failed call are not committed by the next call that commits. A
+        transaction still open when the outermost session ends is rolled
+        back too. Under REPEATABLE READ the first read of a transaction fixes
+        its snapshot, so without this every later read on the connection
+        would miss the changes other clients commit, until this client
+        happened to commit a write itself.
+        
+        Yields:
+            The cursor of the session
+        """
+        if getattr(self._local, "depth", 0):
+            # Already inside a session on this thread, reuse it
+            self._local.depth += 1
+            try:
+                yield self.cursor
+            finally:
+                self._local.depth -= 1
+            return
+        
+        if self._pool is None:
+            with self._lock:
+                self._local.depth = 1
+                try:
+                    yield self._cursor
+                except BaseException:
+                    self._rollback(self._connection)
+                    raise
+                else:
+                    if self._connection.in_transaction:
+                        self._rollback(self._connection)
+                finally:
+                    self._local.depth = 0
+            return
+        
+        with self._pool_slots:
+            connection = self._pool.get_connection()
+            try:
+                cursor = self._cursor_for(connection)
+                self._local.connection = connection
+                self._local.cursor = cursor
+                self._local.depth = 1
+                try:
+                    yield cursor
+                except BaseException:
+                    self._rollback(connection)
+                    raise
+                finally:
+                    self._local.depth = 0
+                    self._local.connection = None
+                    self._local.cursor = None
+                    cursor.close()
+            finally:
+                # End the read snapshot; the pool does not reset sessions
+                # (see connect_to_mysql), so the next borrower would inherit it
+                if connection.in_transaction:
+                    self._rollback(connection)
+                # Returns the connection to the pool
+                connection.close()
+    
+    @staticmethod
+    def _rollback(connection):
+        """Roll back the transaction of a connection.
+        
+        Errors are ignored: a connection that was lost has no transaction left.
+        
+        Args:
+            connection: Connection to roll back
+        """
+        try:
+            connection.rollback()
+        except mysql.connector.Error:
+            pass
+    
+    def _prepared_cursor(self, query: str):
+        """Return the cached prepared-statement cursor for query on the current connection.
+        
+        Each cursor holds one server-side statement, so a cursor is cached per
+        query and connection. The cache of a connection is dropped when its
+        connection ID changes, i.e. after a reconnect, since the server
+        forgets all statements of the old session.
+        
+        Args:
+            query: SQL with %s placeholders
+        
+        Returns:
+            A prepared cursor of the current session's connection
+        """
+        connection = self.connection
+        # Pooled connections are wrappers that are re-created on every checkout
+        raw = getattr(connection, "_cnx", connection)
+        with self._statements_lock:
+            connection_id, cursors = self._statements.get(raw, (None, None))
+            if cursors is None or connection_id != raw.connection_id:
+                cursors = {}
+                self._statements[raw] = (raw.connection_id, cursors)
+        
+        cursor = cursors.get(query)
+        if cursor is None:
+            cursor = cursors[query] = self._cursor_for(raw, prepared=True)
+        return cursor
+    
+    def _execute_prepared(self, query: str, params: Tuple):
+        """Execute a query as a cached prepared statement.
+        
+        The cursor only re-prepares when given a different query object, so
+        callers pass the same string constant on every call.
+        
+        Args:
+            query: SQL with %s placeholders
+            params: Query parameters
+        
+        Returns:
+            The cursor that executed the statement
+        """
+        cursor = self._prepared_cursor(query)
+        try:
+            cursor.execute(query, params)
+        except mysql.connector.Error as err:
+            if err.errno != errorcode.ER_UNKNOWN_STMT_HANDLER:
+                raise
+            # The server dropped the statement, e.g. after a session reset
+            raw = getattr(self.connection, "_cnx", self.connection)
+            with self._statements_lock:
+                self._statements.pop(raw, None)
+            cursor = self._prepared_cursor(query)
+            cursor.execute(query, params)
+        return cursor
+    
+    @contextmanager
+    def dedicated_connection(self):
+        """Open a separate connection to the selected database for long-running work.
+        
+        Streaming reads keep their connection busy until the last row has been
+        fetched, so they get a connection of their own instead of holding a
+        pooled one or the shared connection's lock.
+        
+        Yields:
+            A new connection, closed when the block exits
+        """
+        connection = mysql.connector.connect(**self._connect_args, database=self.db_name)
+        try:
+            yield connection
+        finally:
+            try:
+                connection.close()
+            except mysql.connector.Error:
+                # Closing with unread rows after an early exit is harmless
+                pass
+    
+    def iter_users(self, include_login: bool = False, batch_size: int = 1000) -> Iterator[Dict]:
+        """Stream every user without buffering the table in memory.
+        
+        Rows are read through an unbuffered cursor on a dedicated connection
+        and fetched ``batch_size`` at a time, so memory use does not depend on
+        the table size. Password hashes are never included.
+        
+        Args:
+            include_login: Add loginId and username from the Login table
+            batch_size: Number of rows fetched from the server at a time
+        
+        Yields:
+            Dict: User dictionary
+        """
+        if include_login:
+            query = """
+            SELECT u.userId, u.firstName, u.lastName, u.email, u.accessLevel, l.loginId, l.username
+            FROM User u
+            LEFT JOIN Login l ON l.userId = u.userId
+            ORDER BY u.userId
+            """
+            columns = ('userId', 'firstName', 'lastName', 'email', 'accessLevel', 'loginId', 'username')
+        else:
+            query = "SELECT userId, firstName, lastName, email, accessLevel FROM User ORDER BY userId"
+            columns = ('userId', 'firstName', 'lastName', 'email', 'accessLevel')
+        
+        with self.dedicated_connection() as connection:
+            cursor = self._cursor_for(connection, buffered=False)
+            try:
+                cursor.execute(query)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(zip(columns, row))
+            finally:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    # The consumer stopped early and rows are still unread
+                    pass
+    
+    def _use_database(self, db_name: str):
+        """Make db_name the default database for current and future sessions.
+        
+        Args:
+            db_name: Sanitized database name
+        """
+        self.cursor.execute(f"USE {db_name}")
+        if self._pool is not None:
+            # Pooled connections are reconfigured on their next checkout
+            self._pool.set_config(**self._connect_args, database=db_name)
+    
+    @_uses_session
     def get_all_databases(self) -> List[str]:
         """Get a list of all databases on the MySQL server.
         
@@ -53,6 +623,50 @@ class DatabaseManager:
         except mysql.connector.Error:
             return []
     
+    @_uses_session
+    def get_database_metadata(self, db_names: Iterable[str]) -> Dict[str, Dict]:
+        """Summarize some databases from information_schema.
+        
+        Only the named schemas are inspected, so the cost follows the number
+        of databases on screen rather than on the server.
+        
+        Args:
+            db_names: Names of the databases to describe
+        
+        Returns:
+            Dict[str, Dict]: Per database name, 'size' in bytes, 'user_rows'
+            (the server's row estimate for the User table, or None without
+            one) and 'app_tables', the number of this application's tables
+            (User and Login) present. Databases without tables are left out.
+        """
+        db_names = list(db_names)
+        if not db_names:
+            return {}
+        
+        try:
+            placeholders = ', '.join(['%s'] * len(db_names))
+            query = f"""
+            SELECT TABLE_SCHEMA,
+                   COALESCE(SUM(DATA_LENGTH + INDEX_LENGTH), 0),
+                   MAX(CASE WHEN TABLE_NAME = 'User' THEN TABLE_ROWS END),
+                   SUM(TABLE_NAME IN ('User', 'Login'))
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA IN ({placeholders})
+            GROUP BY TABLE_SCHEMA
+            """
+            self.cursor.execute(query, db_names)
+            return {
+                name: {
+                    "size": int(size),
+                    "user_rows": int(user_rows) if user_rows is not None else None,
+                    "app_tables": int(app_tables or 0)
+                }
+                for name, size, user_rows, app_tables in self.cursor
+            }
+        except mysql.connector.Error:
+            return {}
+    
+    @_uses_session
     def select_database(self, db_name: str) -> bool:
         """Select an existing database.
         
@@ -64,11 +678,13 @@ class DatabaseManager:
         """
         try:
             self.db_name = db_name
-            self.cursor.execute(f"USE {self.db_name}")
+            self._use_database(self.db_name)
+            self.invalidate_users()
             return True
         except mysql.connector.Error:
             return False
     
+    @_uses_session
     def create_database(self, db_name: str) -> bool:
         """Create a new database.
         
@@ -84,44 +700,76 @@ class DatabaseManager:
             
             # Create database
             self.cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.db_name}")
-            self.cursor.execute(f"USE {self.db_name}")
+            self._use_database(self.db_name)
+            self.invalidate_users()
             return True
         except mysql.connector.Error:
             return False
     
+    @_uses_session
     def create_tables(self) -> bool:
-        """Create User and Login tables if they don't exist.
+        """Bring the current database's tables up to the latest schema version.
+        
+        A database already at the latest version costs one version query
+        the first time it is opened in this session and none afterwards.
+        See database.migrations.
         
         Returns:
-            bool: True if tables were created, False otherwise
+            bool: True if the schema is up to date, False otherwise
         """
+        if self._schema_versions.get(self.db_name, 0) >= LATEST_VERSION:
+            return True
+        
         try:
-            # Create User table
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS User (
-                userId INT AUTO_INCREMENT PRIMARY KEY,
-                firstName VARCHAR(50) NOT NULL,
-                lastName VARCHAR(50) NOT NULL,
-                email VARCHAR(100) NOT NULL,
-                accessLevel ENUM('basic', 'admin') DEFAULT 'basic'
-            )
-            """)
-            
-            # Create Login table
-            self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Login (
-                loginId INT AUTO_INCREMENT PRIMARY KEY,
-                userId INT UNIQUE,
-                username VARCHAR(50) UNIQUE NOT NULL,
-                password VARCHAR(255) NOT NULL,
-                FOREIGN KEY (userId) REFERENCES User(userId) ON DELETE CASCADE
-            )
-            """)
-            
+            version = migrate(self.connection, self.cursor)
+            self._schema_versions[self.db_name] = version
             return True
         except mysql.connector.Error:
             return False
     
+    @_uses_session
+    def schema_version(self) -> Optional[int]:
+        """Read the schema version of the current database.
+        
+        Returns:
+            int: Highest applied migration, or None if it cannot be read
+        """
+        try:
+            return current_version(self.cursor)
+        except mysql.connector.Error:
+            return None
+    
+    def _user_change_start(self) -> datetime:
+        """Read the server time at the start of a multi-statement User write.
+        
+        Rows written by the transaction carry an updatedAt at or after this
+        time, which the change log entry of the transaction passes on to
+        change polling.
+        
+        Returns:
+            datetime: Current server time
+        """
+        self.cursor.execute("SELECT NOW(6)")
+        (now,) = self.cursor.fetchone()
+        return now
+    
+    def _log_user_change(self, started_at: Optional[datetime] = None, deleted: int = 0):
+        """Record a User write transaction in the change log, just before its commit.
+        
+        Args:
+            started_at: Result of _user_change_start, or None for a single
+                statement that ran just now
+            deleted: Number of users the transaction deleted
+        """
+        query = f"INSERT INTO {USER_CHANGE_LOG_TABLE} (startedAt, deleted) VALUES (COALESCE(%s, NOW(6)), %s)"
+        cursor = self._execute_prepared(query, (started_at, deleted))
+        if cursor.lastrowid and cursor.lastrowid % USER_CHANGE_LOG_PRUNE_EVERY == 0:
+            self.cursor.execute(
+                f"DELETE FROM {USER_CHANGE_LOG_TABLE} WHERE loggedAt < NOW(6) - INTERVAL %s HOUR",
+                (USER_CHANGE_LOG_RETENTION_HOURS,)
+            )
+    
+    @_uses_session
     def insert_user(self, first_name: str, last_name: str, email: str, access_level: str) -> Optional[int]:
         """Insert a new user and return the user ID.
         
@@ -140,14 +788,112 @@ class DatabaseManager:
             VALUES (%s, %s, %s, %s)
             """
             values = (first_name, last_name, email, access_level)
-            self.cursor.execute(query, values)
+            cursor = self._execute_prepared(query, values)
+            user_id = cursor.lastrowid
+            self._log_user_change()
             self.connection.commit()
             
-            user_id = self.cursor.lastrowid
             return user_id
         except mysql.connector.Error:
+            self.connection.rollback()
             return None
     
+    @_uses_session
+    def insert_users_bulk(self, users: Iterable[Tuple[str, str, str, str]], batch_size: int = 1000,
+                          commit_interval: int = 10000, progress: Callable[[int], None] = None) -> int:
+        """Insert many users with batched multi-row INSERT statements.
+        
+        Users are consumed lazily, so the input can be a stream of any size.
+        Each batch is sent as one multi-row INSERT, and the transaction is
+        committed every ``commit_interval`` rows. If a statement fails, the
+        rows since the last commit are rolled back and insertion stops.
+        
+        Args:
+            users: Iterable of (first_name, last_name, email, access_level) tuples
+            batch_size: Number of rows per INSERT statement
+            commit_interval: Number of rows per transaction
+            progress: Optional callback receiving the number of rows committed so far
+        
+        Returns:
+            int: Number of users inserted and committed
+        """
+        query = """
+        INSERT INTO User (firstName, lastName, email, accessLevel)
+        VALUES (%s, %s, %s, %s)
+        """
+        committed = 0
+        pending = 0
+        started_at = None
+        try:
+            batch = []
+            for user in users:
+                batch.append(user)
+                if len(batch) < batch_size:
+                    continue
+                if started_at is None:
+                    started_at = self._user_change_start()
+                # executemany rewrites a simple INSERT into one multi-row statement
+                self.cursor.executemany(query, batch)
+                pending += len(batch)
+                batch = []
+                if pending >= commit_interval:
+                    self._log_user_change(started_at)
+                    self.connection.commit()
+                    committed += pending
+                    pending = 0
+                    started_at = None
+                    if progress:
+                        progress(committed)
+            
+            if batch:
+                if started_at is None:
+                    started_at = self._user_change_start()
+                self.cursor.executemany(query, batch)
+                pending += len(batch)
+            if pending:
+                self._log_user_change(started_at)
+            self.connection.commit()
+            committed += pending
+            if progress:
+                progress(committed)
+            return committed
+        except mysql.connector.Error:
+            self.connection.rollback()
+            return committed
+    
+    @_uses_session
+    def load_users_file(self, path: str) -> int:
+        """Load a prepared CSV file into the User table with LOAD DATA LOCAL INFILE.
+        
+        The file must hold firstName, lastName, email and accessLevel columns,
+        comma separated, optionally quoted with '"', one user per line. This
+        needs allow_local_infile on the manager and local_infile on the server.
+        
+        Args:
+            path: Path of the CSV file
+        
+        Returns:
+            int: Number of users loaded, or -1 if the load failed
+        """
+        try:
+            query = """
+            LOAD DATA LOCAL INFILE %s INTO TABLE User
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+            LINES TERMINATED BY '\\n'
+            (firstName, lastName, email, accessLevel)
+            """
+            started_at = self._user_change_start()
+            self.cursor.execute(query, (path,))
+            loaded = self.cursor.rowcount
+            self._log_user_change(started_at)
+            self.connection.commit()
+            return loaded
+        except mysql.connector.Error:
+            self.connection.rollback()
+            return -1
+    
+    @_uses_session
     def insert_login(self, user_id: int, username: str, password: str) -> bool:
         """Insert login credentials with encrypted password.
         
@@ -175,6 +921,92 @@ class DatabaseManager:
         except mysql.connector.Error:
             return False
     
+    @_uses_session
+    def insert_logins_bulk(self, logins: Iterable[Tuple[int, str, str]], batch_size: int = 500,
+                           workers: Optional[int] = None, commit_interval: int = 5000,
+                           progress: Callable[[int, float], None] = None) -> Dict:
+        """Insert many logins, hashing their passwords in parallel.
+        
+        bcrypt releases the GIL while hashing, so a thread pool sized to the
+        machine's cores hashes one batch per core at a time while earlier
+        batches are being inserted. Logins are consumed lazily, and only a
+        few batches are held in memory at once. If a statement fails, the rows
+        since the last commit are rolled back and insertion stops. Any other
+        error is raised after the same rollback.
+        
+        Args:
+            logins: Iterable of (user_id, username, password) tuples with plain text passwords
+            batch_size: Number of logins per INSERT statement
+            workers: Number of hashing threads, defaults to the number of CPU cores
+            commit_interval: Number of rows per transaction
+            progress: Optional callback receiving (logins committed, logins per second)
+        
+        Returns:
+            Dict: 'inserted' logins, 'elapsed' seconds and 'rate' in logins per second
+        
+        Raises:
+            ValueError: If a password is longer than the 72 bytes bcrypt accepts
+        """
+        query = """
+        INSERT INTO Login (userId, username, password)
+        VALUES (%s, %s, %s)
+        """
+        workers = workers or os.cpu_count() or 1
+        started = time.perf_counter()
+        committed = 0
+        pending = 0
+        
+        def stats():
+            elapsed = time.perf_counter() - started
+            return {
+                'inserted': committed,
+                'elapsed': elapsed,
+                'rate': committed / elapsed if elapsed else 0.0
+            }
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt") as pool:
+            def hashed_batches():
+                # Keep enough batches in flight to keep every worker busy
+                in_flight = deque()
+                logins_iter = iter(logins)
+                while True:
+                    batch = list(itertools.islice(logins_iter, batch_size))
+                    if batch:
+                        hashes = [pool.submit(self._encrypt_password, password) for (_, _, password) in batch]
+                        in_flight.append((batch, hashes))
+                    if in_flight and (not batch or len(in_flight) > 2):
+                        batch_done, hashes_done = in_flight.popleft()
+                        yield [
+                            (user_id, username, future.result())
+                            for (user_id, username, _), future in zip(batch_done, hashes_done)
+                        ]
+                    elif not batch:
+                        return
+            
+            try:
+                for values in hashed_batches():
+                    self.cursor.executemany(query, values)
+                    pending += len(values)
+                    if pending >= commit_interval:
+                        self.connection.commit()
+                        committed += pending
+                        pending = 0
+                        if progress:
+                            progress(committed, stats()['rate'])
+                
+                self.connection.commit()
+                committed += pending
+                if progress:
+                    progress(committed, stats()['rate'])
+            except mysql.connector.Error:
+                self.connection.rollback()
+            except Exception:
+                # Batches already sent must not be committed by a later call
+                self.connection.rollback()
+                raise
+        
+        return stats()
+    
     def _encrypt_password(self, password: str) -> str:
         """Encrypt password using bcrypt.
         
@@ -185,79 +1017,489 @@ class DatabaseManager:
             str: Encrypted password
         """
         password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self.bcrypt_rounds)
         hashed_password = bcrypt.hashpw(password_bytes, salt)
         return hashed_password.decode('utf-8')
     
-    def verify_password(self, entered_password: str, stored_password: str) -> bool:
+    def verify_password(self, entered_password: str, stored_password: str, login_id: int = None) -> bool:
         """Verify password against stored hash.
         
+        When login_id is given and the stored hash was made with fewer rounds
+        than the current cost, the password is rehashed with the current cost
+        in the background after a successful check.
+        
         Args:
             entered_password: Password to verify
             stored_password: Stored hashed password
+            login_id: Login ID the hash belongs to, enables transparent rehashing
             
         Returns:
             bool: True if password matches, False otherwise
         """
-        return bcrypt.checkpw(entered_password.encode('utf-8'), stored_password.encode('utf-8'))
+        matches = bcrypt.checkpw(entered_password.encode('utf-8'), stored_password.encode('utf-8'))
+        
+        if matches and login_id is not None:
+            self._schedule_rehash(login_id, entered_password, stored_password)
+        
+        return matches
+    
+    def _schedule_rehash(self, login_id: int, password: str, stored_password: str):
+        """Rehash a verified password in the background if its hash is outdated.
+        
+        Args:
+            login_id: Login ID the hash belongs to
+            password: Verified plain text password
+            stored_password: Hash the password was verified against
+        """
+        if hash_rounds(stored_password) < self.bcrypt_rounds:
+            threading.Thread(
+                target=self._rehash_password,
+                args=(login_id, password, stored_password),
+                name=f"rehash-{login_id}",
+                daemon=True
+            ).start()
     
-    def select_all_users(self) -> List[Dict]:
+    def authenticate(self, username: str, password: str) -> AuthResult:
+        """Check a username and password against the Login table.
+        
+        The login is read with one prepared, indexed lookup that bypasses the
+        cache, so a changed password takes effect at once. The password is
+        checked on a pool of ``auth_workers`` bcrypt threads, which release
+        the GIL, so bursts of logins are verified in parallel without running
+        more hashes at once than there are cores. When the pool's queue stays
+        full for AUTH_QUEUE_TIMEOUT seconds the attempt is refused rather
+        than queued without bound.
+        
+        An unknown username is checked against a dummy hash of the current
+        cost, so it takes as long as a wrong password and the response time
+        does not reveal which usernames exist. Failures are counted per
+        username by ``login_throttle``, and a locked username is refused
+        before any work is done. Outdated hashes are rehashed after a
+        successful login, as in verify_password.
+        
+        Args:
+            username: Username to log in as
+            password: Plain text password
+        
+        Returns:
+            AuthResult: The login if the credentials were accepted, and how
+            long to wait before retrying if the attempt was refused
+        """
+        started = time.perf_counter()
+        try:
+            retry_after = self.login_throttle.retry_after(username)
+            if retry_after > 0:
+                return AuthResult(None, retry_after)
+            
+            if not self._auth_slots.acquire(timeout=AUTH_QUEUE_TIMEOUT):
+                # Overloaded; tell the caller to come back instead of piling up
+                return AuthResult(None, AUTH_QUEUE_TIMEOUT)
+            try:
+                dummy_hash = self._dummy_hash()
+                login = self._select_login(username)
+                stored_password = login.password if login is not None else dummy_hash
+                matches = self._auth_executor().submit(self._check_password, password, stored_password).result()
+            finally:
+                self._auth_slots.release()
+            
+            if login is None or not matches:
+                return AuthResult(None, self.login_throttle.failure(username))
+            
+            self.login_throttle.success(username)
+            self._schedule_rehash(login.loginId, password, login.password)
+            return AuthResult(login)
+        finally:
+            if self.instrumentation is not None:
+                self.instrumentation.record_method("authenticate", time.perf_counter() - started)
+    
+    def _auth_executor(self) -> ThreadPoolExecutor:
+        """Return the bcrypt thread pool of authenticate, creating it on first use."""
+        with self._auth_lock:
+            if self._auth_pool is None:
+                self._auth_pool = ThreadPoolExecutor(max_workers=self.auth_workers, thread_name_prefix="auth")
+            return self._auth_pool
+    
+    def _dummy_hash(self) -> str:
+        """Return a hash of a random password at the current cost.
+        
+        Returns:
+            str: bcrypt hash, made once per cost factor
+        """
+        rounds = self.bcrypt_rounds
+        dummy_hash = self._dummy_hashes.get(rounds)
+        if dummy_hash is None:
+            with self._auth_lock:
+                dummy_hash = self._dummy_hashes.get(rounds)
+                if dummy_hash is None:
+                    dummy_hash = bcrypt.hashpw(os.urandom(16), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+                    self._dummy_hashes[rounds] = dummy_hash
+        return dummy_hash
+    
+    @staticmethod
+    def _check_password(password: str, stored_password: str) -> bool:
+        """Run bcrypt.checkpw, treating a malformed hash or password as a mismatch.
+        
+        Args:
+            password: Plain text password
+            stored_password: Stored hashed password
+        
+        Returns:
+            bool: True if the password matches
+        """
+        try:
+            return bcrypt.checkpw(password.encode('utf-8'), stored_password.encode('utf-8'))
+        except ValueError:
+            return False
+    
+    @_uses_session
+    def _rehash_password(self, login_id: int, password: str, stored_password: str) -> bool:
+        """Replace an outdated password hash with one made at the current cost.
+        
+        The update only applies if the stored hash has not changed meanwhile,
+        so a concurrent password change is never overwritten.
+        
+        Args:
+            login_id: Login ID to update
+            password: Verified plain text password
+            stored_password: Hash the password was verified against
+        
+        Returns:
+            bool: True if the hash was replaced, False otherwise
+        """
+        try:
+            query = "UPDATE Login SET password = %s WHERE loginId = %s AND password = %s"
+            self.cursor.execute(query, (self._encrypt_password(password), login_id, stored_password))
+            self.connection.commit()
+            self._invalidate([("login", login_id)])
+            
+            return self.cursor.rowcount > 0
+        except mysql.connector.Error:
+            return False
+    
+    @_uses_session
+    def select_all_users(self, columnar: bool = False) -> Union[List[UserRecord], ColumnarResult]:
         """Retrieve all users from the User table.
         
+        Args:
+            columnar: Return a ColumnarResult instead of a list of records,
+                which takes considerably less memory for large tables
+        
         Returns:
-            List[Dict]: List of user dictionaries
+            List[UserRecord] or ColumnarResult: All users
         """
         try:
             self.cursor.execute("SELECT userId, firstName, lastName, email, accessLevel FROM User")
-            users = []
-            for (user_id, first_name, last_name, email, access_level) in self.cursor:
-                users.append({
-                    'userId': user_id,
-                    'firstName': first_name,
-                    'lastName': last_name,
-                    'email': email,
-                    'accessLevel': access_level
-                })
-            return users
+            if columnar:
+                users = ColumnarResult(UserRecord)
+                users.extend(self.cursor)
+                return users
+            return UserRecord.from_rows(self.cursor)
+        except mysql.connector.Error:
+            return ColumnarResult(UserRecord) if columnar else []
+    
+    @_uses_session
+    def select_users_page(self, after_id: Optional[int] = None, limit: int = 200) -> List[UserRecord]:
+        """Retrieve one page of users ordered by ID using keyset pagination.
+        
+        Seeking past the last seen primary key keeps every page as cheap as
+        the first, unlike OFFSET which rescans all skipped rows.
+        
+        Args:
+            after_id: Return users with an ID greater than this, or None to start at the beginning
+            limit: Maximum number of users to return
+        
+        Returns:
+            List[UserRecord]: List of users
+        """
+        try:
+            query = """
+            SELECT userId, firstName, lastName, email, accessLevel
+            FROM User
+            WHERE userId > %s
+            ORDER BY userId
+            LIMIT %s
+            """
+            self.cursor.execute(query, (after_id if after_id is not None else 0, limit))
+            return UserRecord.from_rows(self.cursor)
+        except mysql.connector.Error:
+            return []
+    
+    @_uses_session
+    def select_users_sorted(self, sort: str = 'userId', descending: bool = False,
+                            after: Optional[tuple] = None, limit: int = 200) -> Tuple[List[UserRecord], Optional[tuple]]:
+        """Retrieve one page of users in a chosen order using keyset pagination.
+        
+        The ORDER BY is answered by walking an index and each page seeks past
+        the sort key of the previous page's last row, so a page deep into a
+        sorted table costs the same as the first one.
+        
+        Args:
+            sort: Column to sort by, one of USER_SORT_KEYS
+            descending: Sort in descending order
+            after: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of users to return
+        
+        Returns:
+            Tuple[List[UserRecord], Optional[tuple]]: Users and the cursor of the
+            next page, or None when there are no more users
+        
+        Raises:
+            ValueError: If the sort column is not one of USER_SORT_KEYS
+        """
+        columns = USER_SORT_KEYS.get(sort)
+        if columns is None:
+            raise ValueError(f"Cannot sort users by {sort}")
+        
+        try:
+            direction = 'DESC' if descending else 'ASC'
+            where = ""
+            params = []
+            if after is not None:
+                # ENUM columns sort by their position in the definition, so
+                # compare access levels by position too
+                values = tuple(
+                    ACCESS_LEVELS.index(value) + 1 if column == 'accessLevel' and value is not None else value
+                    for column, value in zip(columns, after)
+                )
+                condition, params = _keyset_condition(columns, values, descending, nullable=('accessLevel',))
+                where = f"WHERE {condition}"
+            
+            query = f"""
+            SELECT userId, firstName, lastName, email, accessLevel
+            FROM User
+            {where}
+            ORDER BY {', '.join(f'{column} {direction}' for column in columns)}
+            LIMIT %s
+            """
+            self.cursor.execute(query, (*params, limit))
+            users = UserRecord.from_rows(self.cursor)
+            next_cursor = tuple(users[-1][column] for column in columns) if len(users) == limit else None
+            return users, next_cursor
+        except mysql.connector.Error:
+            return [], None
+    
+    @_uses_session
+    def search_users(self, text: str, limit: int = 200,
+                     cursor: Optional[Tuple[float, int]] = None) -> Tuple[List[UserRecord], Optional[Tuple[float, int]]]:
+        """Search users on the server, ranked by relevance.
+        
+        Words of three or more characters are matched as prefixes through the
+        FULLTEXT index on names and email and ranked by relevance. Shorter
+        words are matched as prefixes through the B-tree indexes on each column,
+        'basic' and 'admin' filter on the access level, and a number looks up
+        a user ID directly.
+        
+        Pages continue after the (score, userId) of the previous page's last
+        row rather than skipping an OFFSET, so reading every page of a broad
+        search does not rescan the earlier pages each time.
+        
+        Args:
+            text: Search text
+            limit: Maximum number of users to return
+            cursor: Cursor returned with the previous page, or None for the first page
+        
+        Returns:
+            Tuple[List[UserRecord], Optional[Tuple[float, int]]]: Matching users and
+            the cursor of the next page, or None when there are no more results
+        """
+        try:
+            text = text.strip()
+            
+            if text.isascii() and text.isdigit():
+                conditions = ["userId = %s"]
+                params = [int(text)]
+                score = "0"
+                score_params = []
+            else:
+                words = re.findall(r'[^\W_]+', text.lower())
+                long_words = [word for word in words if len(word) >= FULLTEXT_MIN_WORD and word not in ACCESS_LEVELS]
+                short_words = [word for word in words if len(word) < FULLTEXT_MIN_WORD]
+                levels = [word for word in words if word in ACCESS_LEVELS]
+                
+                conditions = []
+                params = []
+                score = "0"
+                score_params = []
+                
+                if long_words:
+                    against = ' '.join(f"+{word}*" for word in long_words)
+                    score = "MATCH (firstName, lastName, email) AGAINST (%s IN BOOLEAN MODE)"
+                    score_params = [against]
+                    conditions.append(score)
+                    params.append(against)
+                
+                for word in short_words:
+                    if long_words:
+                        # Cheap residual filter on the rows the FULLTEXT index found
+                        conditions.append("CONCAT_WS(' ', firstName, lastName, email) LIKE %s")
+                        params.append(f"%{word}%")
+                    else:
+                        conditions.append("(firstName LIKE %s OR lastName LIKE %s OR email LIKE %s)")
+                        params.extend([f"{word}%"] * 3)
+                
+                for level in levels:
+                    conditions.append("accessLevel = %s")
+                    params.append(level)
+                
+                if not conditions:
+                    return [], None
+            
+            if cursor is not None:
+                # Rows after the previous page in ORDER BY score DESC, userId
+                last_score, last_id = cursor
+                conditions.append(f"({score} < %s OR ({score} = %s AND userId > %s))")
+                params.extend(score_params + [last_score] + score_params + [last_score, last_id])
+            
+            query = f"""
+            SELECT userId, firstName, lastName, email, accessLevel, {score} AS score
+            FROM User
+            WHERE {' AND '.join(conditions)}
+            ORDER BY score DESC, userId
+            LIMIT %s
+            """
+            # Fetch one extra row to find out whether another page exists
+            self.cursor.execute(query, score_params + params + [limit + 1])
+            rows = self.cursor.fetchall()
+            users = UserRecord.from_rows(row[:5] for row in rows[:limit])
+            
+            if len(rows) > limit:
+                last = rows[limit - 1]
+                return users, (last[5], last[0])
+            return users, None
+        except mysql.connector.Error:
+            return [], None
+    
+    @_uses_session
+    def count_users(self) -> int:
+        """Count the rows of the User table.
+        
+        Returns:
+            int: Number of users, or 0 if the count failed
+        """
+        try:
+            self.cursor.execute("SELECT COUNT(*) FROM User")
+            (count,) = self.cursor.fetchone()
+            return count
+        except mysql.connector.Error:
+            return 0
+    
+    @_uses_session
+    def get_user_change_state(self) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+        """Read the starting point for change polling.
+        
+        Both maxima are read from the end of an index, so this costs the
+        same on any table size.
+        
+        Returns:
+            Tuple: (latest updatedAt of User, latest loggedAt of the change
+            log), each None if its table is empty, or None if the query failed
+        """
+        try:
+            self.cursor.execute(f"""
+            SELECT (SELECT MAX(updatedAt) FROM User), (SELECT MAX(loggedAt) FROM {USER_CHANGE_LOG_TABLE})
+            """)
+            return self.cursor.fetchone()
+        except mysql.connector.Error:
+            return None
+    
+    @_uses_session
+    def select_user_change_log(self, since: datetime, limit: int = 1000) -> List[Tuple[int, datetime, datetime, int]]:
+        """Retrieve the User write transactions logged at or after a point in time.
+        
+        Args:
+            since: Watermark; entries with an equal or later loggedAt are returned
+            limit: Maximum number of entries to return
+        
+        Returns:
+            List[Tuple[int, datetime, datetime, int]]: (version, startedAt,
+            loggedAt, deleted users) of each transaction, oldest first
+        """
+        try:
+            query = f"""
+            SELECT version, startedAt, loggedAt, deleted
+            FROM {USER_CHANGE_LOG_TABLE}
+            WHERE loggedAt >= %s
+            ORDER BY loggedAt, version
+            LIMIT %s
+            """
+            self.cursor.execute(query, (since, limit))
+            return self.cursor.fetchall()
         except mysql.connector.Error:
             return []
     
-    def select_user_by_id(self, user_id: int) -> Optional[Dict]:
+    @_uses_session
+    def select_users_changed_since(self, since: datetime, limit: int = 1000) -> List[Tuple[UserRecord, datetime]]:
+        """Retrieve users inserted or modified at or after a point in time.
+        
+        The range scan on idx_user_updated only touches changed rows, so
+        polling costs nothing while nobody edits.
+        
+        Args:
+            since: Watermark; rows with an equal or later updatedAt are returned
+            limit: Maximum number of rows to return
+        
+        Returns:
+            List[Tuple[UserRecord, datetime]]: Changed users with their
+            updatedAt, oldest change first
+        """
+        try:
+            query = """
+            SELECT userId, firstName, lastName, email, accessLevel, updatedAt
+            FROM User
+            WHERE updatedAt >= %s
+            ORDER BY updatedAt, userId
+            LIMIT %s
+            """
+            self.cursor.execute(query, (since, limit))
+            return [(UserRecord(*row[:5]), row[5]) for row in self.cursor]
+        except mysql.connector.Error:
+            return []
+    
+    @_read_through("user")
+    @_uses_session
+    def select_user_by_id(self, user_id: int) -> Optional[UserRecord]:
         """Retrieve a specific user by ID.
         
         Args:
             user_id: User ID to search for
             
         Returns:
-            Dict: User information if found, None otherwise
+            UserRecord: User information if found, None otherwise
         """
         try:
             query = "SELECT userId, firstName, lastName, email, accessLevel FROM User WHERE userId = %s"
-            self.cursor.execute(query, (user_id,))
-            result = self.cursor.fetchone()
+            # Prepared cursors are unbuffered, so read the whole (single-row) result
+            rows = self._execute_prepared(query, (user_id,)).fetchall()
+            result = rows[0] if rows else None
             
             if result:
-                user_id, first_name, last_name, email, access_level = result
-                return {
-                    'userId': user_id,
-                    'firstName': first_name,
-                    'lastName': last_name,
-                    'email': email,
-                    'accessLevel': access_level
-                }
+                return UserRecord(*result)
             else:
                 return None
         except mysql.connector.Error:
             return None
     
-    def select_login_by_username(self, username: str) -> Optional[Dict]:
+    @_read_through("login")
+    def select_login_by_username(self, username: str) -> Optional[LoginRecord]:
         """Retrieve login information by username.
         
+        Args:
+            username: Username to search for
+        
+        Returns:
+            LoginRecord: Login and user information if found, None otherwise
+        """
+        return self._select_login(username)
+    
+    @_uses_session
+    def _select_login(self, username: str) -> Optional[LoginRecord]:
+        """Read a login from the database, bypassing the cache.
+        
         Args:
             username: Username to search for
             
         Returns:
-            Dict: Login and user information if found, None otherwise
+            LoginRecord: Login and user information if found, None otherwise
         """
         try:
             query = """
@@ -266,30 +1508,23 @@ class DatabaseManager:
             JOIN User u ON l.userId = u.userId
             WHERE l.username = %s
             """
-            self.cursor.execute(query, (username,))
-            result = self.cursor.fetchone()
+            rows = self._execute_prepared(query, (username,)).fetchall()
+            result = rows[0] if rows else None
             
             if result:
-                login_id, user_id, username, password, first_name, last_name, email, access_level = result
-                return {
-                    'loginId': login_id,
-                    'userId': user_id,
-                    'username': username,
-                    'password': password,
-                    'firstName': first_name,
-                    'lastName': last_name,
-                    'email': email,
-                    'accessLevel': access_level
-                }
+                return LoginRecord(*result)
             else:
                 return None
         except mysql.connector.Error:
             return None
     
+    @_uses_session
     def update_user(self, user_id: int, first_name: str = None, last_name: str = None, 
                     email: str = None, access_level: str = None) -> bool:
         """Update user information.
         
+        Only the given columns are written, in a single UPDATE statement.
+        
         Args:
             user_id: User ID to update
             first_name: New first name or None to keep current
@@ -300,31 +1535,108 @@ class DatabaseManager:
         Returns:
             bool: True if update was successful, False otherwise
         """
+        values = (first_name, last_name, email, access_level)
+        changes = {field: value for field, value in zip(USER_UPDATE_FIELDS, values) if value is not None}
+        
         try:
-            # Get current user data
-            current_user = self.select_user_by_id(user_id)
-            if not current_user:
-                return False
+            if not changes:
+                # Nothing to write; succeed if the user exists
+                return self.select_user_by_id(user_id) is not None
             
-            # Update with new values or keep current ones
-            first_name = first_name if first_name is not None else current_user['firstName']
-            last_name = last_name if last_name is not None else current_user['lastName']
-            email = email if email is not None else current_user['email']
-            access_level = access_level if access_level is not None else current_user['accessLevel']
-            
-            query = """
-            UPDATE User 
-            SET firstName = %s, lastName = %s, email = %s, accessLevel = %s
-            WHERE userId = %s
-            """
-            values = (first_name, last_name, email, access_level, user_id)
-            self.cursor.execute(query, values)
+            token = self.cache.begin_read() if self.cache is not None else None
+            assignments = ', '.join(f"{field} = %s" for field in changes)
+            query = f"UPDATE User SET {assignments} WHERE userId = %s"
+            self.cursor.execute(query, (*changes.values(), user_id))
+            updated = self.cursor.rowcount > 0
+            self._log_user_change()
             self.connection.commit()
             
-            return self.cursor.rowcount > 0
+            if updated and self.cache is not None:
+                # Keep the edited user cached, so reopening it needs no query
+                self.cache.write_through(("user", user_id), lambda user: user.replace(**changes),
+                                         [("user", user_id)], token)
+            else:
+                self._invalidate([("user", user_id)])
+            return updated
         except mysql.connector.Error:
+            self.connection.rollback()
             return False
     
+    @_uses_session
+    def update_users_bulk(self, changes: Union[Dict[int, Dict], Iterable[Tuple[int, Dict]]],
+                          batch_size: int = 1000, progress: Callable[[int], None] = None) -> int:
+        """Apply many partial user updates in one transaction.
+        
+        Users that receive the same changes, such as an access level change
+        for a whole group, share one ``UPDATE ... WHERE userId IN (...)``
+        statement per ``batch_size`` users. All updates are committed
+        together; if a statement fails, every update is rolled back.
+        
+        Args:
+            changes: Mapping or iterable of (user_id, {column: new value}) pairs,
+                with columns from USER_UPDATE_FIELDS
+            batch_size: Maximum number of users per UPDATE statement
+            progress: Optional callback receiving the number of users processed so far
+        
+        Returns:
+            int: Number of users updated, or -1 if the updates were rolled back
+        
+        Raises:
+            ValueError: If a change names a column that cannot be updated
+        """
+        if isinstance(changes, dict):
+            changes = changes.items()
+        
+        groups = {}
+        written = []
+        processed = 0
+        updated = 0
+        started_at = None
+        
+        def flush(change_set):
+            nonlocal processed, updated, started_at
+            if started_at is None:
+                started_at = self._user_change_start()
+            user_ids = groups.pop(change_set)
+            assignments = ', '.join(f"{field} = %s" for field, _ in change_set)
+            placeholders = ', '.join(['%s'] * len(user_ids))
+            query = f"UPDATE User SET {assignments} WHERE userId IN ({placeholders})"
+            self.cursor.execute(query, [value for _, value in change_set] + user_ids)
+            written.extend(user_ids)
+            updated += self.cursor.rowcount
+            processed += len(user_ids)
+            if progress:
+                progress(processed)
+        
+        try:
+            for user_id, change in changes:
+                unknown = set(change) - set(USER_UPDATE_FIELDS)
+                if unknown:
+                    raise ValueError(f"Cannot update column(s) {', '.join(sorted(unknown))}")
+                if not change:
+                    continue
+                
+                change_set = tuple(sorted(change.items()))
+                user_ids = groups.setdefault(change_set, [])
+                user_ids.append(user_id)
+                if len(user_ids) >= batch_size:
+                    flush(change_set)
+            
+            for change_set in list(groups):
+                flush(change_set)
+            if started_at is not None:
+                self._log_user_change(started_at)
+            self.connection.commit()
+            self._invalidate(("user", user_id) for user_id in written)
+            return updated
+        except ValueError:
+            self.connection.rollback()
+            raise
+        except mysql.connector.Error:
+            self.connection.rollback()
+            return -1
+    
+    @_uses_session
     def update_login(self, user_id: int, username: str = None, password: str = None) -> bool:
         """Update login information.
         
@@ -359,11 +1671,13 @@ class DatabaseManager:
             
             self.cursor.execute(query, values)
             self.connection.commit()
+            self._invalidate([("user", user_id)])
             
             return self.cursor.rowcount > 0
         except mysql.connector.Error:
             return False
     
+    @_uses_session
     def delete_user(self, user_id: int) -> bool:
         """Delete a user (will cascade delete their login due to constraints).
         
@@ -375,13 +1689,70 @@ class DatabaseManager:
         """
         try:
             query = "DELETE FROM User WHERE userId = %s"
-            self.cursor.execute(query, (user_id,))
+            deleted = self._execute_prepared(query, (user_id,)).rowcount
+            self._log_user_change(deleted=deleted)
             self.connection.commit()
+            self._invalidate([("user", user_id)])
             
-            return self.cursor.rowcount > 0
+            return deleted > 0
         except mysql.connector.Error:
+            self.connection.rollback()
             return False
     
+    @_uses_session
+    def delete_users(self, user_ids: Iterable[int], chunk_size: int = 1000,
+                     progress: Callable[[int], None] = None) -> int:
+        """Delete many users (and, by cascade, their logins) in one transaction.
+        
+        IDs are deleted in chunks of ``chunk_size`` with one
+        ``DELETE ... WHERE userId IN (...)`` statement each. If a statement
+        fails, every deletion is rolled back. Any other error, e.g. from
+        consuming ``user_ids``, is raised after the same rollback.
+        
+        Args:
+            user_ids: IDs of the users to delete
+            chunk_size: Maximum number of IDs per DELETE statement
+            progress: Optional callback receiving the number of IDs processed so far
+        
+        Returns:
+            int: Number of users deleted, or -1 if the deletion was rolled back
+        """
+        deleted = 0
+        processed = 0
+        written = []
+        
+        def delete_chunk(chunk):
+            nonlocal deleted, processed
+            placeholders = ', '.join(['%s'] * len(chunk))
+            self.cursor.execute(f"DELETE FROM User WHERE userId IN ({placeholders})", chunk)
+            written.extend(chunk)
+            deleted += self.cursor.rowcount
+            processed += len(chunk)
+            if progress:
+                progress(processed)
+        
+        try:
+            chunk = []
+            for user_id in user_ids:
+                chunk.append(user_id)
+                if len(chunk) >= chunk_size:
+                    delete_chunk(chunk)
+                    chunk = []
+            if chunk:
+                delete_chunk(chunk)
+            if processed:
+                self._log_user_change(deleted=deleted)
+            self.connection.commit()
+            self._invalidate(("user", user_id) for user_id in written)
+            return deleted
+        except mysql.connector.Error:
+            self.connection.rollback()
+            return -1
+        except Exception:
+            self.connection.rollback()
+            raise
+    
+    @_uses_session
     def delete_login(self, login_id: int) -> bool:
         """Delete a login record by login ID.
         
@@ -395,6 +1766,7 @@ class DatabaseManager:
             query = "DELETE FROM Login WHERE loginId = %s"
             self.cursor.execute(query, (login_id,))
             self.connection.commit()
+            self._invalidate([("login", login_id)])
             
             return self.cursor.rowcount > 0
         except mysql.connector.Error:
@@ -402,7 +1774,25 @@ class DatabaseManager:
     
     def close_connection(self):
         """Close database connection."""
-        if self.connection:
-            if self.cursor:
-                self.cursor.close()
-            self.connection.close()
\ No newline at end of file
+        with self._lock:
+            if self._connection:
+                if self._cursor:
+                    self._cursor.close()
+                self._connection.close()
+            self._connection = None
+            self._cursor = None
+        
+        with self._statements_lock:
+            self._statements.clear()
+        self.invalidate_users()
+        
+        if self._pool is not None:
+            # Close idle pooled connections; checked-out ones close on return
+            self._pool._remove_connections()
+            self._pool = None
+            self._pool_slots = None
+        
+        with self._auth_lock:
+            if self._auth_pool is not None:
+                self._auth_pool.shutdown(wait=False)
+                self._auth_pool = None
\ No newline at end of file
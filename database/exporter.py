@@ -0,0 +1,124 @@
+"""
+Constant-memory streaming export of users to CSV or JSON Lines files.
+"""
+
+import csv
+import gzip
+import json
+import os
+import time
+from typing import Callable
+
+
+# Supported export formats and their file extensions
+EXPORT_FORMATS = ("csv", "jsonl")
+
+USER_COLUMNS = ("userId", "firstName", "lastName", "email", "accessLevel")
+LOGIN_COLUMNS = ("loginId", "username")
+
+# Number of rows between progress reports and cancellation checks
+PROGRESS_INTERVAL = 10000
+
+
+class ExportResult:
+    """Summary of an export."""
+    
+    def __init__(self, path):
+        """Initialize an empty result.
+        
+        Args:
+            path: Path of the export file
+        """
+        self.path = path
+        self.exported = 0
+        self.cancelled = False
+        self.elapsed = 0.0
+    
+    @property
+    def rate(self) -> float:
+        """Exported rows per second."""
+        return self.exported / self.elapsed if self.elapsed else 0.0
+
+
+def export_format(path: str) -> str:
+    """Infer the export format from a file name.
+    
+    Args:
+        path: Path such as users.csv, users.jsonl or users.jsonl.gz
+    
+    Returns:
+        str: 'csv' or 'jsonl'
+    """
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return "jsonl" if name.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def export_users(db_manager, path: str, fmt: str = None, include_login: bool = False,
+                 compress: bool = None, batch_size: int = 1000,
+                 progress: Callable[[int], None] = None, cancel_event=None) -> ExportResult:
+    """Stream the User table (optionally joined with Login) to a file.
+    
+    Rows flow from an unbuffered cursor straight into the output file, so
+    memory use stays the same for any table size. Password hashes are never
+    exported. The file is written under a temporary name and renamed once
+    complete, so a cancelled or failed export never leaves a partial file.
+    
+    Args:
+        db_manager: Connected database manager with a database selected
+        path: Path of the export file
+        fmt: 'csv' or 'jsonl'; inferred from the file name when omitted
+        include_login: Add each user's loginId and username
+        compress: gzip the output; defaults to True when the path ends in .gz
+        batch_size: Number of rows fetched from the server at a time
+        progress: Optional callback receiving the number of rows exported so far
+        cancel_event: Optional threading.Event that stops the export
+    
+    Returns:
+        ExportResult: Summary of the export
+    """
+    fmt = fmt or export_format(path)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}'")
+    if compress is None:
+        compress = path.lower().endswith(".gz")
+    
+    columns = USER_COLUMNS + (LOGIN_COLUMNS if include_login else ())
+    result = ExportResult(path)
+    started = time.perf_counter()
+    temp_path = f"{path}.part"
+    
+    opener = gzip.open if compress else open
+    try:
+        with opener(temp_path, "wt", newline="", encoding="utf-8") as output:
+            if fmt == "csv":
+                writer = csv.writer(output)
+                writer.writerow(columns)
+                write = lambda user: writer.writerow([user[column] for column in columns])
+            else:
+                write = lambda user: output.write(json.dumps(user, ensure_ascii=False, default=str) + "\n")
+            
+            for user in db_manager.iter_users(include_login=include_login, batch_size=batch_size):
+                write(user)
+                result.exported += 1
+                if result.exported % PROGRESS_INTERVAL == 0:
+                    if progress:
+                        progress(result.exported)
+                    if cancel_event is not None and cancel_event.is_set():
+                        result.cancelled = True
+                        break
+        
+        if result.cancelled:
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    result.elapsed = time.perf_counter() - started
+    if progress:
+        progress(result.exported)
+    return result
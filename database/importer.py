@@ -0,0 +1,282 @@
+"""
+Streaming bulk import of users from CSV or JSON Lines files.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from database.db_manager import ACCESS_LEVELS
+
+
+# Column limits of the User table
+FIELD_LENGTHS = {
+    "firstName": 50,
+    "lastName": 50,
+    "email": 100
+}
+
+EMAIL_PATTERN = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# Accepted spellings of each column in input files
+COLUMN_ALIASES = {
+    "firstName": ("firstName", "first_name", "firstname", "first name"),
+    "lastName": ("lastName", "last_name", "lastname", "last name"),
+    "email": ("email", "e-mail", "mail"),
+    "accessLevel": ("accessLevel", "access_level", "accesslevel", "access level", "role")
+}
+
+
+class ImportResult:
+    """Summary of a bulk import."""
+    
+    def __init__(self):
+        """Initialize an empty result."""
+        self.read = 0
+        self.inserted = 0
+        self.rejected = 0
+        self.rejected_path = None
+        self.cancelled = False
+        self.failed = False
+        self.elapsed = 0.0
+    
+    @property
+    def rate(self) -> float:
+        """Inserted users per second."""
+        return self.inserted / self.elapsed if self.elapsed else 0.0
+
+
+class _ProgressFile(io.RawIOBase):
+    """Binary file wrapper that counts the bytes read from disk."""
+    
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes_read = 0
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        count = self.raw.readinto(buffer)
+        self.bytes_read += count or 0
+        return count
+    
+    def close(self):
+        self.raw.close()
+        super().close()
+
+
+def open_rows(path: str, progress_file: _ProgressFile = None) -> Iterator[Tuple[int, Dict]]:
+    """Stream raw rows from a CSV or JSON Lines file, optionally gzip-compressed.
+    
+    The format is taken from the file extension (.csv, .jsonl or .ndjson,
+    each optionally followed by .gz).
+    
+    Args:
+        path: Path of the input file
+        progress_file: Optional wrapper around the opened file for progress reporting
+    
+    Yields:
+        Tuple[int, Dict]: Line number and the raw row
+    """
+    name = path.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    
+    raw = progress_file if progress_file is not None else open(path, "rb")
+    binary = gzip.GzipFile(fileobj=raw) if compressed else io.BufferedReader(raw)
+    text = io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+    
+    try:
+        if name.endswith((".jsonl", ".ndjson", ".json")):
+            for line_number, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as error:
+                    yield line_number, {"_error": f"Invalid JSON: {error}", "_raw": line.strip()}
+                    continue
+                if not isinstance(row, dict):
+                    row = {"_error": "Expected a JSON object", "_raw": line.strip()}
+                yield line_number, row
+        else:
+            reader = csv.DictReader(text)
+            for row in reader:
+                # Line number of the header is 1
+                yield reader.line_num, row
+    finally:
+        text.close()
+        raw.close()
+
+
+def _column(row: Dict, field: str):
+    """Look up a field in a raw row under any of its accepted names.
+    
+    Args:
+        row: Raw row
+        field: Canonical field name
+    
+    Returns:
+        The value, or None if the row does not have the field
+    """
+    for alias in COLUMN_ALIASES[field]:
+        if alias in row:
+            return row[alias]
+    return None
+
+
+def validate_user_row(row: Dict) -> Tuple[Optional[Tuple[str, str, str, str]], Optional[str]]:
+    """Validate a raw row using the same rules as the user form.
+    
+    Args:
+        row: Raw row
+    
+    Returns:
+        Tuple: (user tuple, None) if the row is valid, (None, reason) otherwise
+    """
+    if "_error" in row:
+        return None, row["_error"]
+    
+    values = {}
+    for field in ("firstName", "lastName", "email"):
+        value = _column(row, field)
+        value = str(value).strip() if value is not None else ""
+        if not value:
+            return None, f"Missing {field}"
+        if len(value) > FIELD_LENGTHS[field]:
+            return None, f"{field} longer than {FIELD_LENGTHS[field]} characters"
+        if any(ord(char) < 32 for char in value):
+            return None, f"{field} contains control characters"
+        values[field] = value
+    
+    if not EMAIL_PATTERN.match(values["email"]):
+        return None, "Invalid email format"
+    
+    access_level = _column(row, "accessLevel")
+    access_level = str(access_level).strip().lower() if access_level else "basic"
+    if access_level not in ACCESS_LEVELS:
+        return None, f"Invalid access level '{access_level}'"
+    
+    return (values["firstName"], values["lastName"], values["email"], access_level), None
+
+
+def import_users(db_manager, path: str, batch_size: int = 1000, commit_interval: int = 10000,
+                 use_load_data: bool = False, rejected_path: str = None,
+                 progress: Callable[[int, int, int, int], None] = None,
+                 cancel_event=None) -> ImportResult:
+    """Stream users from a file into the database.
+    
+    Rows are read, validated and inserted in batches without ever holding
+    the whole file in memory. Invalid rows are written to a rejects file
+    together with their line number and the reason they were rejected.
+    
+    Args:
+        db_manager: Connected database manager with a database selected
+        path: Path of the CSV or JSON Lines file
+        batch_size: Number of rows per INSERT statement
+        commit_interval: Number of rows per transaction
+        use_load_data: Load each chunk with LOAD DATA LOCAL INFILE instead of INSERT
+        rejected_path: Where to write rejected rows; defaults to <path>.rejected.csv
+        progress: Optional callback receiving (bytes_read, total_bytes, inserted, rejected)
+        cancel_event: Optional threading.Event that stops the import after the current chunk
+    
+    Returns:
+        ImportResult: Summary of the import
+    """
+    result = ImportResult()
+    result.rejected_path = rejected_path or f"{path}.rejected.csv"
+    total_bytes = os.path.getsize(path)
+    started = time.perf_counter()
+    
+    progress_file = _ProgressFile(open(path, "rb"))
+    rejects_file = None
+    rejects_writer = None
+    
+    def report():
+        if progress:
+            progress(progress_file.bytes_read, total_bytes, result.inserted, result.rejected)
+    
+    def valid_users():
+        nonlocal rejects_file, rejects_writer
+        for line_number, row in open_rows(path, progress_file):
+            result.read += 1
+            user, error = validate_user_row(row)
+            if user is not None:
+                yield user
+                continue
+            
+            result.rejected += 1
+            if rejects_writer is None:
+                rejects_file = open(result.rejected_path, "w", newline="", encoding="utf-8")
+                rejects_writer = csv.writer(rejects_file)
+                rejects_writer.writerow(["line", "error", "row"])
+            raw = row.get("_raw") or json.dumps(row, ensure_ascii=False, default=str)
+            rejects_writer.writerow([line_number, error, raw])
+    
+    try:
+        users = valid_users()
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                result.cancelled = True
+                break
+            
+            # Work in chunks of one transaction so progress and cancellation are responsive
+            chunk = []
+            for user in users:
+                chunk.append(user)
+                if len(chunk) >= commit_interval:
+                    break
+            if not chunk:
+                break
+            
+            if use_load_data:
+                inserted = _load_chunk(db_manager, chunk)
+            else:
+                inserted = db_manager.insert_users_bulk(chunk, batch_size, commit_interval)
+            
+            if inserted < len(chunk):
+                result.inserted += max(inserted, 0)
+                result.failed = True
+                break
+            
+            result.inserted += inserted
+            report()
+    finally:
+        progress_file.close()
+        if rejects_file is not None:
+            rejects_file.close()
+    
+    if not result.rejected:
+        result.rejected_path = None
+    
+    result.elapsed = time.perf_counter() - started
+    report()
+    return result
+
+
+def _load_chunk(db_manager, chunk) -> int:
+    """Write a chunk of validated users to a temporary file and LOAD DATA it.
+    
+    Args:
+        db_manager: Connected database manager
+        chunk: List of user tuples
+    
+    Returns:
+        int: Number of users loaded, or -1 if the load failed
+    """
+    handle, temp_path = tempfile.mkstemp(suffix=".csv", prefix="user_import_")
+    try:
+        with os.fdopen(handle, "w", newline="", encoding="utf-8") as temp_file:
+            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL, lineterminator="\n")
+            writer.writerows(chunk)
+        return db_manager.load_users_file(temp_path)
+    finally:
+        os.remove(temp_path)
@@ -0,0 +1,334 @@
+"""
+Timing instrumentation and slow-query log for database operations.
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+import math
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+import mysql.connector
+
+
+# Histogram bucket upper bounds in seconds: 10 µs to about 10 minutes,
+# each bucket 25% wider than the previous one (at most 25% error)
+BUCKET_BOUNDS = tuple(1e-5 * 1.25 ** index for index in range(81))
+
+# Statements beyond this many distinct shapes are counted together
+MAX_STATEMENTS = 500
+OTHER_STATEMENTS = "<other statements>"
+
+_WHITESPACE = re.compile(r"\s+")
+# Placeholder lists of varying length, e.g. IN (%s, %s, %s)
+_PLACEHOLDER_LIST = re.compile(r"\bIN\s*\(\s*%s(?:\s*,\s*%s)+\s*\)", re.IGNORECASE)
+
+
+def normalize_sql(sql) -> str:
+    """Reduce a statement to its shape so that its executions share statistics.
+    
+    Args:
+        sql: SQL text with %s placeholders
+    
+    Returns:
+        str: Single-line SQL with placeholder lists collapsed
+    """
+    if isinstance(sql, (bytes, bytearray)):
+        sql = sql.decode("utf-8", "replace")
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    return _PLACEHOLDER_LIST.sub("IN (%s, ...)", sql)
+
+
+class OperationStats:
+    """Latency histogram and counters of one method or statement."""
+    
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last_error = None
+    
+    def record(self, seconds: float, rows: int = 0, error: str = None):
+        """Add one observation.
+        
+        Args:
+            seconds: Duration of the call
+            rows: Rows returned or affected
+            error: Error message if the call failed
+        """
+        self.buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.calls += 1
+        self.rows += max(rows, 0)
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if error is not None:
+            self.errors += 1
+            self.last_error = error
+    
+    def percentile(self, percent: float) -> float:
+        """Estimate a latency percentile from the histogram.
+        
+        Args:
+            percent: Percentile between 0 and 100
+        
+        Returns:
+            float: Upper bound of the bucket holding the percentile, in seconds
+        """
+        if not self.calls:
+            return 0.0
+        rank = max(1, math.ceil(self.calls * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+    
+    def summary(self) -> Dict:
+        """Return the statistics as a dictionary with latencies in milliseconds."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "mean_ms": self.total / self.calls * 1000 if self.calls else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+            "last_error": self.last_error
+        }
+
+
+class Instrumentation:
+    """Collects per-method and per-statement timings of a DatabaseManager.
+    
+    Methods are timed by the session decorator and statements by
+    TimedCursor. Statements slower than ``slow_query_ms`` are appended to
+    the slow-query log, without their parameters so that no passwords or
+    hashes are written to disk.
+    """
+    
+    def __init__(self, slow_query_ms: float = 200, slow_query_log: Optional[str] = None):
+        """Initialize empty statistics.
+        
+        Args:
+            slow_query_ms: Threshold in milliseconds for the slow-query log
+            slow_query_log: Path of the slow-query log, or None to disable it
+        """
+        self.slow_query_ms = slow_query_ms
+        self.slow_query_log = slow_query_log
+        self.methods = {}
+        self.statements = {}
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._local = threading.local()
+    
+    def record_method(self, name: str, seconds: float, error: str = None):
+        """Record one call of a DatabaseManager method.
+        
+        Args:
+            name: Method name
+            seconds: Duration of the call
+            error: Error message if a statement of the call failed
+        """
+        with self._lock:
+            stats = self.methods.get(name)
+            if stats is None:
+                stats = self.methods[name] = OperationStats()
+            stats.record(seconds, error=error)
+    
+    def record_statement(self, sql, seconds: float, rows: int = 0, error: str = None) -> OperationStats:
+        """Record one execution of an SQL statement.
+        
+        Args:
+            sql: SQL text
+            seconds: Duration of the execution
+            rows: Rows affected, if known
+            error: Error message if the statement failed
+        
+        Returns:
+            OperationStats: Statistics of the statement, for adding fetched rows later
+        """
+        shape = normalize_sql(sql)
+        with self._lock:
+            stats = self.statements.get(shape)
+            if stats is None:
+                if len(self.statements) >= MAX_STATEMENTS:
+                    shape = OTHER_STATEMENTS
+                    stats = self.statements.get(shape)
+                if stats is None:
+                    stats = self.statements[shape] = OperationStats()
+            stats.record(seconds, rows, error)
+        
+        if error is not None:
+            # Let the method being timed on this thread know it hit an error
+            self._local.error = error
+        
+        if self.slow_query_log and seconds * 1000 >= self.slow_query_ms:
+            self._log_slow(shape, seconds, rows, error)
+        return stats
+    
+    def add_rows(self, stats: OperationStats, rows: int):
+        """Count rows fetched after a statement was recorded.
+        
+        Args:
+            stats: Statistics returned by record_statement
+            rows: Number of rows fetched
+        """
+        with self._lock:
+            stats.rows += rows
+    
+    def begin_method(self) -> Optional[str]:
+        """Start tracking statement errors for a method call on this thread.
+        
+        Returns:
+            The error flag of an enclosing method call, to pass to end_method
+        """
+        previous = getattr(self._local, "error", None)
+        self._local.error = None
+        return previous
+    
+    def end_method(self, name: str, seconds: float, previous: Optional[str]):
+        """Record a method call started with begin_method.
+        
+        The method counts as failed if any of its statements failed, even
+        though DatabaseManager methods turn errors into return values.
+        
+        Args:
+            name: Method name
+            seconds: Duration of the call
+            previous: Value returned by begin_method
+        """
+        error = getattr(self._local, "error", None)
+        self.record_method(name, seconds, error)
+        # Nested calls fail their caller too
+        self._local.error = previous or error
+    
+    def _log_slow(self, sql: str, seconds: float, rows: int, error: str):
+        """Append a statement to the slow-query log.
+        
+        Args:
+            sql: Normalized SQL text
+            seconds: Duration of the execution
+            rows: Rows affected, if known
+            error: Error message if the statement failed
+        """
+        timestamp = datetime.now().isoformat(timespec="milliseconds")
+        line = f"{timestamp}\t{seconds * 1000:.1f} ms\trows={max(rows, 0)}\t{sql}"
+        if error is not None:
+            line += f"\terror={error}"
+        try:
+            with self._log_lock, open(self.slow_query_log, "a", encoding="utf-8") as log:
+                log.write(line + "\n")
+        except OSError:
+            # Logging must never break the query that was logged
+            pass
+    
+    def snapshot(self, kind: str = "methods") -> List[Dict]:
+        """Summarize the collected statistics, slowest p99 first.
+        
+        Args:
+            kind: 'methods' or 'statements'
+        
+        Returns:
+            List[Dict]: One summary per method or statement, with its 'name'
+        """
+        source = self.methods if kind == "methods" else self.statements
+        with self._lock:
+            rows = [dict(stats.summary(), name=name) for name, stats in source.items()]
+        rows.sort(key=lambda row: row["p99_ms"], reverse=True)
+        return rows
+    
+    def reset(self):
+        """Discard all collected statistics."""
+        with self._lock:
+            self.methods = {}
+            self.statements = {}
+
+
+class TimedCursor:
+    """Cursor proxy that records every statement it executes."""
+    
+    def __init__(self, cursor, instrumentation: Instrumentation):
+        """Wrap a cursor.
+        
+        Args:
+            cursor: mysql.connector cursor
+            instrumentation: Instrumentation receiving the timings
+        """
+        self._cursor = cursor
+        self._instrumentation = instrumentation
+        self._stats = None
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+    
+    def __iter__(self):
+        count = 0
+        try:
+            for row in self._cursor:
+                count += 1
+                yield row
+        finally:
+            self._count(count)
+    
+    def _timed(self, method, operation, params):
+        """Run an execute method and record its duration.
+        
+        Args:
+            method: execute or executemany of the wrapped cursor
+            operation: SQL text
+            params: Parameters passed on to the method
+        
+        Returns:
+            The method's result
+        """
+        started = time.perf_counter()
+        try:
+            result = method(operation, params)
+        except mysql.connector.Error as err:
+            self._stats = None
+            self._instrumentation.record_statement(operation, time.perf_counter() - started, error=str(err))
+            raise
+        
+        # Unbuffered SELECTs report no row count until their rows are fetched
+        rowcount = self._cursor.rowcount if self._cursor.description is None else 0
+        self._stats = self._instrumentation.record_statement(operation, time.perf_counter() - started, rowcount)
+        return result
+    
+    def _count(self, rows: int):
+        """Count fetched rows towards the last statement.
+        
+        Args:
+            rows: Number of rows fetched
+        """
+        if self._stats is not None and rows:
+            self._instrumentation.add_rows(self._stats, rows)
+    
+    def execute(self, operation, params=()):
+        return self._timed(self._cursor.execute, operation, params)
+    
+    def executemany(self, operation, seq_params):
+        return self._timed(self._cursor.executemany, operation, seq_params)
+    
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        self._count(row is not None)
+        return row
+    
+    def fetchmany(self, size=1):
+        rows = self._cursor.fetchmany(size)
+        self._count(len(rows))
+        return rows
+    
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._count(len(rows))
+        return rows
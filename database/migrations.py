@@ -0,0 +1,280 @@
+"""
+Versioned schema migrations for the application's tables.
+
+Every database records the migrations applied to it in a ``schema_version``
+table. Opening a database that is already up to date costs a single
+``SELECT MAX(version)``. Otherwise the missing migrations run in order under
+a named lock, so two clients opening the same database do not both migrate it.
+
+Migrations are written to also work on databases created before this table
+existed: they check information_schema and only add what is missing.
+Table changes go through ``alter_table``, which asks the server for an
+online algorithm first and falls back step by step when it cannot oblige.
+"""
+
+from typing import Callable, List, NamedTuple, Optional
+
+import mysql.connector
+from mysql.connector import errorcode
+
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+# Seconds to wait for another client that is migrating the same database
+MIGRATION_LOCK_TIMEOUT = 60
+
+# SQL expression naming the migration lock of the current database. Lock
+# names are limited to 64 characters, so the database name is hashed
+MIGRATION_LOCK_NAME = "CONCAT('schema_migration.', MD5(DATABASE()))"
+
+# Secondary indexes on the User table that back search_users; prefix
+# searches use the sort indexes below
+USER_SEARCH_INDEXES = {
+    "ft_user_search": "FULLTEXT INDEX ft_user_search (firstName, lastName, email)"
+}
+
+# Modification timestamp of User rows, maintained by the server, and its
+# index; change polling reads the rows modified since a watermark
+USER_CHANGE_COLUMN = "updatedAt TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)"
+USER_CHANGE_INDEXES = {
+    "idx_user_updated": "INDEX idx_user_updated (updatedAt)"
+}
+
+# One row per committed transaction that wrote User rows through
+# DatabaseManager, inserted just before the commit. Deletions leave no row
+# behind in User, and rows of a long transaction carry timestamps from well
+# before its commit; the log records both, so change polling needs neither
+# a row count nor a guess at how late a commit can be
+USER_CHANGE_LOG_TABLE = "UserChangeLog"
+
+# Full-column indexes matching the sort orders of the user list. InnoDB
+# appends the primary key to every secondary index, so each one also covers
+# the userId tie-breaker of keyset pagination and no sort needs a filesort
+USER_SORT_INDEXES = {
+    "idx_user_sort_first": "INDEX idx_user_sort_first (firstName, lastName)",
+    "idx_user_sort_last": "INDEX idx_user_sort_last (lastName, firstName)",
+    "idx_user_sort_email": "INDEX idx_user_sort_email (email)",
+    "idx_user_sort_access": "INDEX idx_user_sort_access (accessLevel)"
+}
+
+# Prefix indexes that migration 2 used to build. They cannot serve ORDER BY
+# and the sort indexes make them redundant for prefix searches, so
+# migration 4 drops them from databases created before they were removed
+SUPERSEDED_SEARCH_INDEXES = ("idx_user_email", "idx_user_name")
+
+# Errors meaning the server cannot run an ALTER TABLE with the requested
+# ALGORITHM or LOCK clause, or does not know the clause (INSTANT before 8.0)
+_UNSUPPORTED_ALTER = {
+    errorcode.ER_ALTER_OPERATION_NOT_SUPPORTED,
+    errorcode.ER_ALTER_OPERATION_NOT_SUPPORTED_REASON,
+    errorcode.ER_NOT_SUPPORTED_YET,
+    errorcode.ER_PARSE_ERROR
+}
+
+
+class Migration(NamedTuple):
+    """One schema change."""
+    
+    version: int
+    description: str
+    apply: Callable
+
+
+def alter_table(cursor, table: str, changes: List[str], instant: bool = False):
+    """Run ALTER TABLE with the least disruptive algorithm the server supports.
+    
+    The change is tried with ALGORITHM=INSTANT (only when requested, as it
+    applies to column changes), then ALGORITHM=INPLACE with LOCK=NONE so
+    that reads and writes continue, then INPLACE with the default lock and
+    finally the server's default, which may copy the table.
+    
+    Args:
+        cursor: Cursor on the database to change
+        table: Table name
+        changes: ALTER TABLE clauses, e.g. ["ADD INDEX idx (col)"]
+        instant: Try ALGORITHM=INSTANT first
+    """
+    attempts = [", ALGORITHM=INPLACE, LOCK=NONE", ", ALGORITHM=INPLACE", ""]
+    if instant:
+        attempts.insert(0, ", ALGORITHM=INSTANT")
+    
+    statement = f"ALTER TABLE {table} {', '.join(changes)}"
+    for index, options in enumerate(attempts):
+        try:
+            cursor.execute(statement + options)
+            return
+        except mysql.connector.Error as err:
+            if err.errno not in _UNSUPPORTED_ALTER or index == len(attempts) - 1:
+                raise
+
+
+def _existing_columns(cursor, table: str) -> set:
+    """Return the column names of a table in the current database."""
+    cursor.execute("""
+    SELECT COLUMN_NAME FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    return {name for (name,) in cursor}
+
+
+def _existing_indexes(cursor, table: str) -> set:
+    """Return the index names of a table in the current database."""
+    cursor.execute("""
+    SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    return {name for (name,) in cursor}
+
+
+def add_missing_indexes(cursor, table: str, indexes: dict):
+    """Add the indexes a table does not have yet, in one ALTER TABLE.
+    
+    Args:
+        cursor: Cursor on the database to change
+        table: Table name
+        indexes: Index name -> index definition
+    """
+    existing = _existing_indexes(cursor, table)
+    missing = [f"ADD {definition}" for name, definition in indexes.items() if name not in existing]
+    if missing:
+        alter_table(cursor, table, missing)
+
+
+def _create_base_tables(cursor):
+    """Migration 1: the tables every version of the application used."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS User (
+        userId INT AUTO_INCREMENT PRIMARY KEY,
+        firstName VARCHAR(50) NOT NULL,
+        lastName VARCHAR(50) NOT NULL,
+        email VARCHAR(100) NOT NULL,
+        accessLevel ENUM('basic', 'admin') DEFAULT 'basic'
+    )
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS Login (
+        loginId INT AUTO_INCREMENT PRIMARY KEY,
+        userId INT UNIQUE,
+        username VARCHAR(50) UNIQUE NOT NULL,
+        password VARCHAR(255) NOT NULL,
+        FOREIGN KEY (userId) REFERENCES User(userId) ON DELETE CASCADE
+    )
+    """)
+
+
+def _add_search_indexes(cursor):
+    """Migration 2: indexes for search_users."""
+    add_missing_indexes(cursor, "User", USER_SEARCH_INDEXES)
+
+
+def _add_change_tracking(cursor):
+    """Migration 3: updatedAt and its index for change polling."""
+    if "updatedAt" not in _existing_columns(cursor, "User"):
+        alter_table(cursor, "User", [f"ADD COLUMN {USER_CHANGE_COLUMN}"], instant=True)
+    add_missing_indexes(cursor, "User", USER_CHANGE_INDEXES)
+
+
+def _add_sort_indexes(cursor):
+    """Migration 4: indexes for sorted browsing, replacing the name and email prefix indexes."""
+    add_missing_indexes(cursor, "User", USER_SORT_INDEXES)
+    existing = _existing_indexes(cursor, "User")
+    superseded = [f"DROP INDEX {name}" for name in SUPERSEDED_SEARCH_INDEXES if name in existing]
+    if superseded:
+        alter_table(cursor, "User", superseded)
+
+
+def _create_change_log(cursor):
+    """Migration 5: the log of User write transactions for change polling."""
+    cursor.execute(f"""
+    CREATE TABLE IF NOT EXISTS {USER_CHANGE_LOG_TABLE} (
+        version BIGINT AUTO_INCREMENT PRIMARY KEY,
+        startedAt TIMESTAMP(6) NOT NULL,
+        loggedAt TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+        deleted INT NOT NULL DEFAULT 0,
+        INDEX idx_change_log_logged (loggedAt)
+    )
+    """)
+
+
+MIGRATIONS = [
+    Migration(1, "Create the User and Login tables", _create_base_tables),
+    Migration(2, "Add the User search indexes", _add_search_indexes),
+    Migration(3, "Track User modification times", _add_change_tracking),
+    Migration(4, "Add the User sort indexes", _add_sort_indexes),
+    Migration(5, "Log User write transactions", _create_change_log),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(cursor) -> int:
+    """Read the schema version of the current database.
+    
+    Args:
+        cursor: Cursor on the database
+    
+    Returns:
+        int: Highest applied migration, 0 if none has been recorded
+    """
+    try:
+        cursor.execute(f"SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE}")
+        (version,) = cursor.fetchone()
+        return version or 0
+    except mysql.connector.Error as err:
+        if err.errno == errorcode.ER_NO_SUCH_TABLE:
+            return 0
+        raise
+
+
+def migrate(connection, cursor, target: Optional[int] = None) -> int:
+    """Bring the current database up to the latest (or target) schema version.
+    
+    DDL statements commit implicitly in MySQL, so every migration is
+    recorded right after it ran; an interrupted run resumes with the
+    migration that failed.
+    
+    Args:
+        connection: Connection whose current database is migrated
+        cursor: Cursor of the connection
+        target: Version to stop at, or None for the latest
+    
+    Returns:
+        int: Schema version after migrating
+    
+    Raises:
+        mysql.connector.Error: If a migration fails or the lock cannot be taken
+    """
+    target = LATEST_VERSION if target is None else target
+    version = current_version(cursor)
+    if version >= target:
+        return version
+    
+    cursor.execute(f"SELECT GET_LOCK({MIGRATION_LOCK_NAME}, %s)", (MIGRATION_LOCK_TIMEOUT,))
+    (locked,) = cursor.fetchone()
+    if not locked:
+        raise mysql.connector.Error(msg="Timed out waiting for another client to migrate the database")
+    
+    try:
+        cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+            version INT PRIMARY KEY,
+            description VARCHAR(200) NOT NULL,
+            appliedAt TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        # Another client may have migrated while we waited for the lock
+        version = current_version(cursor)
+        
+        for migration in MIGRATIONS:
+            if version < migration.version <= target:
+                migration.apply(cursor)
+                cursor.execute(
+                    f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description) VALUES (%s, %s)",
+                    (migration.version, migration.description)
+                )
+                connection.commit()
+                version = migration.version
+        return version
+    finally:
+        cursor.execute(f"SELECT RELEASE_LOCK({MIGRATION_LOCK_NAME})")
+        cursor.fetchall()
@@ -0,0 +1,256 @@
+"""
+Compact record types for query results.
+
+Building a dictionary per row costs a hash table and a copy of every key
+for each user, which dominates memory on large tables. The records here
+store their fields in ``__slots__`` instead, and ColumnarResult stores a
+whole result set as one list per column. Both keep dictionary-style access
+so callers can keep using ``user["email"]``.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+
+USER_FIELDS = ('userId', 'firstName', 'lastName', 'email', 'accessLevel')
+LOGIN_FIELDS = ('loginId', 'userId', 'username', 'password',
+                'firstName', 'lastName', 'email', 'accessLevel')
+
+
+class Record:
+    """Base class for slot-based records with dictionary-style access.
+    
+    Subclasses declare ``_fields`` and matching ``__slots__``; fields can be
+    read as attributes (``user.email``) or as keys (``user["email"]``).
+    """
+    
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    
+    # Integer columns, stored in compact arrays by ColumnarResult
+    _int_fields: Tuple[str, ...] = ()
+    
+    # Text columns with many repeated values (names, access levels); bulk
+    # reads let equal values share one string object instead of one per row
+    _shared_fields: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> List["Record"]:
+        """Build records from result rows in ``_fields`` order.
+        
+        Equal values of the shared fields are stored once, since the driver
+        returns a new string object for every value of every row.
+        
+        Args:
+            rows: Iterable of row sequences
+        
+        Returns:
+            List[Record]: The new records
+        """
+        positions = [cls._fields.index(name) for name in cls._shared_fields]
+        shared = {}
+        records = []
+        for row in rows:
+            row = list(row)
+            for position in positions:
+                value = row[position]
+                row[position] = shared.setdefault(value, value)
+            records.append(cls(*row))
+        return records
+    
+    def __getitem__(self, key: str):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key not in self._fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+    
+    def __len__(self) -> int:
+        return len(self._fields)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Record):
+            return self._fields == other._fields and self.values() == other.values()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    # Records are mutable, so like dictionaries they are not hashable
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+    
+    def get(self, key: str, default=None):
+        """Return a field's value, or default if there is no such field.
+        
+        Args:
+            key: Field name
+            default: Value returned for unknown fields
+        
+        Returns:
+            The field's value or default
+        """
+        if key not in self._fields:
+            return default
+        return getattr(self, key)
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Return the field names."""
+        return self._fields
+    
+    def values(self) -> List:
+        """Return the field values in field order."""
+        return [getattr(self, name) for name in self._fields]
+    
+    def items(self) -> List[Tuple[str, object]]:
+        """Return (field name, value) pairs in field order."""
+        return [(name, getattr(self, name)) for name in self._fields]
+    
+    def copy(self) -> "Record":
+        """Return a shallow copy of the record."""
+        return type(self)(*self.values())
+    
+    def replace(self, **changes) -> "Record":
+        """Return a copy of the record with some fields changed.
+        
+        Args:
+            **changes: New field values by field name
+        
+        Returns:
+            Record: The updated copy
+        """
+        record = self.copy()
+        for name, value in changes.items():
+            record[name] = value
+        return record
+    
+    def to_dict(self) -> Dict:
+        """Return a plain dictionary copy, e.g. for JSON serialization."""
+        return {name: getattr(self, name) for name in self._fields}
+
+
+class UserRecord(Record):
+    """One row of the User table."""
+    
+    __slots__ = USER_FIELDS
+    _fields = USER_FIELDS
+    _int_fields = ('userId',)
+    _shared_fields = ('firstName', 'lastName', 'accessLevel')
+    
+    def __init__(self, userId, firstName, lastName, email, accessLevel):
+        self.userId = userId
+        self.firstName = firstName
+        self.lastName = lastName
+        self.email = email
+        self.accessLevel = accessLevel
+
+
+class LoginRecord(Record):
+    """One row of the Login table joined with its user."""
+    
+    __slots__ = LOGIN_FIELDS
+    _fields = LOGIN_FIELDS
+    _int_fields = ('loginId', 'userId')
+    _shared_fields = ('firstName', 'lastName', 'accessLevel')
+    
+    def __init__(self, loginId, userId, username, password,
+                 firstName, lastName, email, accessLevel):
+        self.loginId = loginId
+        self.userId = userId
+        self.username = username
+        self.password = password
+        self.firstName = firstName
+        self.lastName = lastName
+        self.email = email
+        self.accessLevel = accessLevel
+
+
+class ColumnarResult:
+    """Column-oriented result set for bulk reads.
+    
+    Rows are kept as one list per column rather than one object per row:
+    integer columns go into ``array('q')`` and repeated values of the
+    shared fields are stored once.
+    Indexing by position materializes a record on demand, indexing by
+    field name returns the whole column.
+    """
+    
+    def __init__(self, record_type=UserRecord):
+        """Initialize an empty result set.
+        
+        Args:
+            record_type: Record subclass describing the columns
+        """
+        self.record_type = record_type
+        self.fields = record_type._fields
+        self._columns = [
+            array('q') if name in record_type._int_fields else []
+            for name in self.fields
+        ]
+        self._shared_positions = frozenset(
+            position for position, name in enumerate(self.fields)
+            if name in record_type._shared_fields
+        )
+        self._shared = {}
+    
+    def append(self, row: Tuple):
+        """Add one result row in field order.
+        
+        Args:
+            row: Sequence of column values
+        """
+        for position, (column, value) in enumerate(zip(self._columns, row)):
+            if position in self._shared_positions:
+                value = self._shared.setdefault(value, value)
+            column.append(value)
+    
+    def extend(self, rows: Iterable[Tuple]):
+        """Add result rows in field order.
+        
+        Args:
+            rows: Iterable of row sequences
+        """
+        for row in rows:
+            self.append(row)
+    
+    def column(self, name: str) -> Union[List, array]:
+        """Return the values of one column.
+        
+        Args:
+            name: Field name
+        
+        Returns:
+            The column's values in row order
+        """
+        return self._columns[self.fields.index(name)]
+    
+    def __len__(self) -> int:
+        return len(self._columns[0])
+    
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            if index not in self.fields:
+                raise KeyError(index)
+            return self.column(index)
+        if isinstance(index, slice):
+            return [self.record_type(*row) for row in zip(*(column[index] for column in self._columns))]
+        return self.record_type(*(column[index] for column in self._columns))
+    
+    def __iter__(self) -> Iterator[Record]:
+        record_type = self.record_type
+        for row in zip(*self._columns):
+            yield record_type(*row)
+    
+    def __repr__(self) -> str:
+        return f"ColumnarResult({self.record_type.__name__}, {len(self)} rows)"
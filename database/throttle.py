@@ -0,0 +1,146 @@
+"""
+Per-user throttling of failed login attempts.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable
+
+
+class LoginThrottle:
+    """Thread-safe tracker of failed logins with exponential back-off.
+    
+    Every username gets a few free attempts. Each failure after that locks
+    the username for twice as long as the previous one, up to ``max_delay``.
+    A success, or ``max_delay`` seconds without failures after the last lock
+    ran out, forgets the count. Unknown usernames are tracked exactly like
+    existing ones, so the throttle does not reveal which accounts exist.
+    
+    At most ``max_entries`` usernames are remembered. Beyond that the one
+    whose lock ran out first is forgotten: unlocked usernames go first, least
+    recently failed first, so failing with other names cannot push a locked
+    one out. Only when every remembered username is locked does the lock
+    that ends soonest go, which keeps memory bounded however many names are
+    tried.
+    """
+    
+    def __init__(self, free_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 300.0,
+                 max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        """Initialize an empty throttle.
+        
+        Args:
+            free_attempts: Failures allowed before a username is locked
+            base_delay: Seconds of the first lock
+            max_delay: Upper bound of a lock in seconds, also how long after
+                a lock failures are remembered
+            max_entries: Maximum number of usernames remembered
+            clock: Monotonic time source
+        """
+        self.free_attempts = max(0, int(free_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        # Username -> (failures, locked until, order of the failure)
+        self._entries = {}
+        # Heap of (locked until, order, username), the eviction order; items
+        # whose order no longer matches the username's entry are stale
+        self._expiry = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(username: str) -> str:
+        """Usernames compare case-insensitively, like the Login table's collation."""
+        return username.strip().casefold()
+    
+    def retry_after(self, username: str) -> float:
+        """Seconds until a username may try again.
+        
+        Args:
+            username: Username about to log in
+        
+        Returns:
+            float: Remaining lock time, 0.0 if the username may try now
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(username))
+            if entry is None:
+                return 0.0
+            return max(0.0, entry[1] - self._clock())
+    
+    def failure(self, username: str) -> float:
+        """Record a failed attempt.
+        
+        Args:
+            username: Username that failed to log in
+        
+        Returns:
+            float: Seconds the username is now locked for, 0.0 if not locked
+        """
+        key = self._key(username)
+        now = self._clock()
+        with self._lock:
+            failures, locked_until, _ = self._entries.get(key, (0, now, None))
+            if now - locked_until >= self.max_delay:
+                failures = 0
+            failures += 1
+            
+            delay = 0.0
+            if failures > self.free_attempts:
+                doublings = min(failures - self.free_attempts - 1, 32)
+                delay = min(self.base_delay * 2 ** doublings, self.max_delay)
+            
+            order = next(self._order)
+            self._entries[key] = (failures, now + delay, order)
+            heapq.heappush(self._expiry, (now + delay, order, key))
+            if len(self._entries) > self.max_entries:
+                self._evict(key)
+            if len(self._expiry) > 2 * len(self._entries):
+                self._compact()
+            return delay
+    
+    def success(self, username: str):
+        """Forget the failed attempts of a username after it logged in.
+        
+        Args:
+            username: Username that logged in
+        """
+        with self._lock:
+            self._entries.pop(self._key(username), None)
+    
+    def _evict(self, keep: str):
+        """Forget the username whose lock ends first; the lock must be held.
+        
+        Args:
+            keep: Username that just failed, which is never forgotten
+        """
+        kept = []
+        while self._expiry:
+            item = heapq.heappop(self._expiry)
+            _, order, key = item
+            entry = self._entries.get(key)
+            if entry is None or entry[2] != order:
+                continue
+            if key == keep:
+                kept.append(item)
+                continue
+            del self._entries[key]
+            break
+        for item in kept:
+            heapq.heappush(self._expiry, item)
+    
+    def _compact(self):
+        """Drop the stale items of the eviction heap; the lock must be held."""
+        self._expiry = [
+            (locked_until, order, key) for key, (_, locked_until, order) in self._entries.items()
+        ]
+        heapq.heapify(self._expiry)
+    
+    def clear(self):
+        """Forget all failed attempts."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
@@ -7,12 +7,43 @@ from tkinter import ttk, messagebox, simpledialog
 import re
 
 from gui.main_app import MainApp
+from gui.users.user_list import PagedTreeview, SEARCH_DELAY
+
+
+# Databases per page of the virtual list and pages kept in the treeview
+DATABASE_PAGE_SIZE = 100
+DATABASE_MAX_PAGES = 3
+
+# Placeholder for metadata that is being loaded
+METADATA_PENDING = object()
+
+
+def format_size(size):
+    """Format a byte count for display.
+    
+    Args:
+        size: Size in bytes
+    
+    Returns:
+        str: Size with a binary unit, e.g. '1.5 MiB'
+    """
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
 
 
 class DatabaseSelector:
-    """Screen for selecting or creating a database."""
+    """Screen for selecting or creating a database.
     
-    def __init__(self, root, parent_frame, db_manager, config):
+    Database names are filtered in memory and shown through a virtual list,
+    so the screen opens at once however many schemas the server hosts.
+    Size, User row count and the presence of the application's tables are
+    looked up in the background for the databases on screen only.
+    """
+    
+    def __init__(self, root, parent_frame, db_manager, config, executor):
         """Initialize database selector screen.
         
         Args:
@@ -20,11 +51,17 @@ class DatabaseSelector:
             parent_frame: Parent frame to place widgets in
             db_manager: Database manager instance
             config: Application configuration object
+            executor: Background executor for database calls
         """
         self.root = root
         self.parent_frame = parent_frame
         self.db_manager = db_manager
         self.config = config
+        self.executor = executor
+        self.databases = []
+        self.matches = []
+        self.metadata = {}
+        self._filter_job = None
         
         # Update window title
         self.root.title("User Management System - Select Database")
@@ -38,50 +75,67 @@ class DatabaseSelector:
         title_label = ttk.Label(self.parent_frame, text="Select Database", style="Title.TLabel")
         title_label.pack(pady=(0, 20))
         
-        # Get available databases
-        self.databases = self.db_manager.get_all_databases()
-        
         # Database selection frame
         db_frame = ttk.Frame(self.parent_frame)
         db_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # Create scrollable frame for databases
+        # Type-to-filter box
+        filter_frame = ttk.Frame(db_frame)
+        filter_frame.pack(fill=tk.X, padx=10)
+        ttk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", self._schedule_filter)
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var)
+        filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        filter_entry.bind("<Down>", lambda event: self._focus_list())
+        filter_entry.bind("<Return>", lambda event: self._open_selected())
+        filter_entry.focus_set()
+        
+        # Only the rows near the visible part of the list are kept in the treeview
         container = ttk.Frame(db_frame)
         container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create canvas with scrollbar
-        canvas = tk.Canvas(container)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        columns = ("name", "size", "users", "tables")
+        self.tree = ttk.Treeview(container, columns=columns, show="headings", selectmode="browse")
+        headings = {
+            "name": ("Database", 260, tk.W),
+            "size": ("Size", 90, tk.E),
+            "users": ("Users (approx.)", 110, tk.E),
+            "tables": ("App Tables", 90, tk.CENTER)
+        }
+        for column, (text, width, anchor) in headings.items():
+            self.tree.heading(column, text=text)
+            self.tree.column(column, width=width, anchor=anchor, stretch=column == "name")
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.tree.yview)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.tree.bind("<Double-1>", lambda event: self._open_selected())
+        self.tree.bind("<Return>", lambda event: self._open_selected())
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.pages = PagedTreeview(
+            self.tree,
+            scrollbar,
+            self.executor,
+            row_key=lambda name: name,
+            row_values=self._row_values,
+            page_size=DATABASE_PAGE_SIZE,
+            max_pages=DATABASE_MAX_PAGES,
+            on_change=self._on_rows_changed
+        )
         
-        # Add database buttons
-        if self.databases:
-            for db_name in self.databases:
-                db_button = ttk.Button(
-                    scrollable_frame,
-                    text=db_name,
-                    command=lambda name=db_name: self._select_database(name),
-                    width=30
-                )
-                db_button.pack(pady=5, padx=10, fill=tk.X)
-        else:
-            no_db_label = ttk.Label(
-                scrollable_frame,
-                text="No databases found. Create a new one.",
-                style="Subtitle.TLabel"
-            )
-            no_db_label.pack(pady=20)
+        self.status_label = ttk.Label(db_frame, text="Loading databases...")
+        self.status_label.pack(anchor=tk.W, padx=10)
+        
+        # Get available databases in the background
+        self.executor.submit(
+            self.db_manager.get_all_databases,
+            on_success=self._show_databases,
+            on_error=lambda error: self._show_databases([]),
+            key="databases",
+            owner=self.tree
+        )
         
         # Buttons frame
         button_frame = ttk.Frame(self.parent_frame)
@@ -96,6 +150,14 @@ class DatabaseSelector:
         )
         new_db_button.pack(side=tk.RIGHT, padx=5)
         
+        # Open button
+        open_button = ttk.Button(
+            button_frame,
+            text="Open",
+            command=self._open_selected
+        )
+        open_button.pack(side=tk.RIGHT, padx=5)
+        
         # Back button
         back_button = ttk.Button(
             button_frame,
@@ -104,24 +166,171 @@ class DatabaseSelector:
         )
         back_button.pack(side=tk.LEFT, padx=5)
     
+    def _show_databases(self, databases):
+        """Start listing the databases once their names have been loaded.
+        
+        Args:
+            databases: List of database names
+        """
+        self.databases = databases
+        self._apply_filter()
+    
+    def _schedule_filter(self, *args):
+        """Filter the list once typing has paused."""
+        if self._filter_job is not None:
+            self.tree.after_cancel(self._filter_job)
+        self._filter_job = self.tree.after(SEARCH_DELAY, self._apply_filter)
+    
+    def _apply_filter(self):
+        """Show the databases whose name contains the filter text."""
+        self._filter_job = None
+        text = self.filter_var.get().strip().lower()
+        if text:
+            self.matches = [name for name in self.databases if text in name.lower()]
+        else:
+            self.matches = self.databases
+        matches = self.matches
+        self.pages.reset(lambda offset, limit: self._fetch_matches(matches, offset, limit))
+    
+    @staticmethod
+    def _fetch_matches(matches, offset, limit):
+        """Row source over the in-memory list of matching names.
+        
+        Args:
+            matches: Matching database names
+            offset: Index of the first name of the page, or None
+            limit: Maximum number of names to return
+        
+        Returns:
+            tuple: (names, next_cursor)
+        """
+        offset = offset or 0
+        end = offset + limit
+        return matches[offset:end], end if end < len(matches) else None
+    
+    def _row_values(self, name):
+        """Treeview values of a database, with its metadata once known.
+        
+        Args:
+            name: Database name
+        
+        Returns:
+            tuple: Column values
+        """
+        info = self.metadata.get(name, METADATA_PENDING)
+        if info is METADATA_PENDING:
+            return (name, "…", "…", "…")
+        if info is None:
+            # No tables at all
+            return (name, format_size(0), "", "no")
+        users = f"{info['user_rows']:,}" if info["user_rows"] is not None else ""
+        tables = {0: "no", 1: "partial"}.get(info["app_tables"], "yes")
+        return (name, format_size(info["size"]), users, tables)
+    
+    def _on_rows_changed(self):
+        """Update the status line and load metadata for newly shown databases."""
+        if not self.tree.winfo_exists():
+            return
+        
+        if self.pages.error is not None:
+            self.status_label.config(text=f"Failed to list databases: {self.pages.error}")
+        elif not self.databases:
+            self.status_label.config(text="No databases found. Create a new one.")
+        elif not self.matches:
+            self.status_label.config(text="No databases match the filter.")
+        elif len(self.matches) == len(self.databases):
+            self.status_label.config(text=f"{len(self.databases):,} databases")
+        else:
+            self.status_label.config(text=f"{len(self.matches):,} of {len(self.databases):,} databases")
+        
+        missing = [name for name in self.tree.get_children() if name not in self.metadata]
+        if not missing:
+            return
+        # Placeholders so scrolling back and forth does not ask twice
+        for name in missing:
+            self.metadata[name] = METADATA_PENDING
+        self.executor.submit(
+            self.db_manager.get_database_metadata, missing,
+            on_success=lambda metadata: self._on_metadata(missing, metadata),
+            on_error=lambda error: self._on_metadata(missing, None),
+            owner=self.tree,
+            quiet=True
+        )
+    
+    def _on_metadata(self, names, metadata):
+        """Show loaded metadata in the rows still on screen.
+        
+        Args:
+            names: Databases that were asked for
+            metadata: Result of get_database_metadata, or None if it failed
+        """
+        for name in names:
+            if metadata is None:
+                # Ask again the next time the database is shown
+                del self.metadata[name]
+            else:
+                self.metadata[name] = metadata.get(name)
+        if metadata is not None:
+            self.pages.update_rows(names)
+    
+    def _focus_list(self):
+        """Move the keyboard focus from the filter box to the list."""
+        children = self.tree.get_children()
+        if children:
+            self.tree.focus_set()
+            self.tree.selection_set(children[0])
+            self.tree.focus(children[0])
+    
+    def _open_selected(self):
+        """Open the selected database, or the only one matching the filter."""
+        selection = self.tree.selection()
+        if selection:
+            self._select_database(selection[0])
+        elif len(getattr(self, "matches", [])) == 1:
+            self._select_database(self.matches[0])
+    
     def _select_database(self, db_name):
         """Select an existing database and proceed to main app.
         
         Args:
             db_name: Name of the database to select
         """
-        if self.db_manager.select_database(db_name):
+        def open_database():
+            if not self.db_manager.select_database(db_name):
+                return f"Failed to select database {db_name}"
             # Ensure tables exist
-            if self.db_manager.create_tables():
-                # Save last used database
-                self.config.set("last_database", db_name)
-                
-                # Open main application
-                self._open_main_app()
-            else:
-                messagebox.showerror("Error", f"Failed to create tables in database {db_name}")
-        else:
-            messagebox.showerror("Error", f"Failed to select database {db_name}")
+            if not self.db_manager.create_tables():
+                return f"Failed to create tables in database {db_name}"
+            return None
+        
+        self.executor.submit(
+            open_database,
+            on_success=lambda error: self._on_database_ready(db_name, error),
+            on_error=lambda error: messagebox.showerror("Error", f"Failed to select database {db_name}: {error}"),
+            key="open_database",
+            owner=self.parent_frame
+        )
+    
+    def _on_database_ready(self, db_name, error, message=None):
+        """Open the main application once a database is ready.
+        
+        Args:
+            db_name: Name of the selected database
+            error: Error message, or None if the database is ready
+            message: Optional success message to show first
+        """
+        if error:
+            messagebox.showerror("Error", error)
+            return
+        
+        # Save last used database
+        self.config.set("last_database", db_name)
+        
+        if message:
+            messagebox.showinfo("Success", message)
+        
+        # Open main application
+        self._open_main_app()
     
     def _create_new_database(self):
         """Create a new database."""
@@ -144,20 +353,23 @@ class DatabaseSelector:
             return
         
         # Try to create database
-        if self.db_manager.create_database(db_name):
+        def create_database():
+            if not self.db_manager.create_database(db_name):
+                return "Failed to create new database"
             # Create tables
-            if self.db_manager.create_tables():
-                # Save last used database
-                self.config.set("last_database", db_name)
-                
-                messagebox.showinfo("Success", f"Database '{db_name}' created successfully!")
-                
-                # Open main application
-                self._open_main_app()
-            else:
-                messagebox.showerror("Error", "Failed to create tables in new database")
-        else:
-            messagebox.showerror("Error", "Failed to create new database")
+            if not self.db_manager.create_tables():
+                return "Failed to create tables in new database"
+            return None
+        
+        self.executor.submit(
+            create_database,
+            on_success=lambda error: self._on_database_ready(
+                db_name, error, f"Database '{db_name}' created successfully!"
+            ),
+            on_error=lambda error: messagebox.showerror("Error", f"Failed to create new database: {error}"),
+            key="open_database",
+            owner=self.parent_frame
+        )
     
     def _open_main_app(self):
         """Open the main application."""
@@ -166,7 +378,7 @@ class DatabaseSelector:
             widget.destroy()
         
         # Create main application screen
-        MainApp(self.root, self.parent_frame, self.db_manager, self.config)
+        MainApp(self.root, self.parent_frame, self.db_manager, self.config, self.executor)
     
     def _back_to_login(self):
         """Go back to login screen."""
@@ -181,4 +393,4 @@ class DatabaseSelector:
             widget.destroy()
         
         # Create login screen
-        LoginScreen(self.root, self.config)
\ No newline at end of file
+        LoginScreen(self.root, self.config, self.executor)
\ No newline at end of file
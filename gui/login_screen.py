@@ -4,25 +4,33 @@ Login screen module for the User Management System.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import os
 import re
-
-from database.db_manager import DatabaseManager
-from gui.database_selector import DatabaseSelector
+import threading
 
 
 class LoginScreen:
-    """Login screen for connecting to MySQL server."""
+    """Login screen for connecting to MySQL server.
+    
+    The database modules (mysql.connector, bcrypt and the screens after
+    login) are imported on a worker thread after the form is shown, so the
+    window appears without waiting for them.
+    """
     
-    def __init__(self, root, config):
+    def __init__(self, root, config, executor):
         """Initialize login screen.
         
         Args:
             root: Tkinter root window
             config: Application configuration object
+            executor: Background executor for database calls
         """
         self.root = root
         self.config = config
-        self.db_manager = DatabaseManager()
+        self.executor = executor
+        self._connecting = False
+        self.db_manager = None
+        self._db_manager_lock = threading.Lock()
         
         # Create main frame
         self.main_frame = ttk.Frame(root, padding=20)
@@ -31,6 +39,87 @@ class LoginScreen:
         # Create login form
         self._create_widgets()
         
+        # Load the database layer while the user types
+        self.root.after_idle(self._preload)
+    
+    def _preload(self):
+        """Create the database manager in the background."""
+        self.executor.submit(
+            self._ensure_db_manager,
+            on_success=self._on_db_manager_ready,
+            key="db_manager",
+            quiet=True
+        )
+    
+    def _ensure_db_manager(self):
+        """Import the database layer and create the database manager once.
+        
+        Runs on worker threads, either ahead of time or for the first
+        connection attempt, whichever comes first.
+        
+        Returns:
+            DatabaseManager: The database manager
+        """
+        with self._db_manager_lock:
+            if self.db_manager is not None:
+                return self.db_manager
+            
+            from database.cache import RecordCache
+            from database.db_manager import DatabaseManager
+            from database.instrumentation import Instrumentation
+            # Warm up the next screens too
+            import gui.database_selector  # noqa: F401
+            
+            instrumentation = None
+            if self.config.get("instrumentation", True):
+                slow_query_log = self.config.get("slow_query_log")
+                instrumentation = Instrumentation(
+                    slow_query_ms=self.config.get("slow_query_ms", 200),
+                    slow_query_log=os.path.expanduser(slow_query_log) if slow_query_log else None
+                )
+            
+            cache = None
+            if self.config.get("point_cache_size", 1024):
+                cache = RecordCache(
+                    max_size=self.config.get("point_cache_size", 1024),
+                    ttl=self.config.get("point_cache_ttl", 30)
+                )
+            
+            self.db_manager = DatabaseManager(
+                pool_size=self.config.get("pool_size", 0),
+                allow_local_infile=self.config.get("allow_local_infile", False),
+                bcrypt_rounds=self.config.get("bcrypt_rounds"),
+                instrumentation=instrumentation,
+                cache=cache
+            )
+            return self.db_manager
+    
+    def _on_db_manager_ready(self, db_manager):
+        """Start bcrypt calibration once the database layer is loaded.
+        
+        Args:
+            db_manager: The database manager
+        """
+        from database.db_manager import calibrate_bcrypt_rounds
+        
+        # Pick a bcrypt cost for this host the first time the app runs
+        if self.config.get("bcrypt_rounds") is None:
+            self.executor.submit(
+                calibrate_bcrypt_rounds,
+                self.config.get("bcrypt_target_ms", 250),
+                on_success=self._on_bcrypt_calibrated,
+                key="bcrypt_calibration"
+            )
+    
+    def _on_bcrypt_calibrated(self, rounds):
+        """Store the calibrated bcrypt cost.
+        
+        Args:
+            rounds: Calibrated cost factor
+        """
+        self.config.set("bcrypt_rounds", rounds)
+        self.db_manager.bcrypt_rounds = rounds
+    
     def _create_widgets(self):
         """Create screen widgets."""
         # Title
@@ -94,13 +183,13 @@ class LoginScreen:
         buttons_frame.pack(fill=tk.X, pady=20)
         
         # Connect button
-        connect_button = ttk.Button(
+        self.connect_button = ttk.Button(
             buttons_frame, 
             text="Connect", 
             command=self._connect_to_mysql,
             style="Primary.TButton"
         )
-        connect_button.pack(side=tk.RIGHT, padx=5)
+        self.connect_button.pack(side=tk.RIGHT, padx=5)
         
         # Exit button
         exit_button = ttk.Button(
@@ -118,6 +207,10 @@ class LoginScreen:
         )
         theme_button.pack(side=tk.LEFT, padx=5)
         
+        # Connection progress indicator
+        self.status_label = ttk.Label(self.main_frame, text="")
+        self.status_label.pack(anchor=tk.W)
+        
         # Set focus to password field if username is already filled
         if self.user_var.get():
             pass_entry.focus_set()
@@ -141,6 +234,10 @@ class LoginScreen:
         
     def _connect_to_mysql(self):
         """Connect to MySQL server with the provided credentials."""
+        # The Return binding outlives this screen; ignore it once the form is gone
+        if not self.connect_button.winfo_exists():
+            return
+        
         host = self.host_var.get().strip()
         user = self.user_var.get().strip()
         password = self.pass_var.get()
@@ -154,10 +251,41 @@ class LoginScreen:
             messagebox.showerror("Error", "Please enter a username")
             return
         
-        # Try to connect
+        # Ignore repeated requests while a connection attempt is running
+        if self._connecting:
+            return
+        
+        # Try to connect on a worker thread
+        self._set_connecting(True)
+        self.executor.submit(
+            lambda: self._ensure_db_manager().connect_to_mysql(host, user, password),
+            on_success=lambda result: self._on_connect_result(result, host, user),
+            on_error=self._on_connect_error,
+            key="connect",
+            owner=self.main_frame
+        )
+    
+    def _set_connecting(self, connecting):
+        """Show or hide the connection progress indicator.
+        
+        Args:
+            connecting: Whether a connection attempt is in progress
+        """
+        self._connecting = connecting
+        self.connect_button.config(state=tk.DISABLED if connecting else tk.NORMAL)
+        self.status_label.config(text="Connecting..." if connecting else "")
+    
+    def _on_connect_result(self, result, host, user):
+        """Handle the result of a connection attempt.
+        
+        Args:
+            result: Return value of DatabaseManager.connect_to_mysql
+            host: Host that was connected to
+            user: User that was connected as
+        """
+        self._set_connecting(False)
+        
         try:
-            result = self.db_manager.connect_to_mysql(host, user, password)
-            
             if isinstance(result, tuple) and not result[0]:
                 messagebox.showerror("Connection Error", f"Failed to connect to MySQL: {result[1]}")
                 return
@@ -168,8 +296,9 @@ class LoginScreen:
                 
             # Save connection details if remember me is checked
             if self.remember_me.get():
-                self.config.set("host", host)
-                self.config.set("user", user)
+                with self.config.batch():
+                    self.config.set("host", host)
+                    self.config.set("user", user)
             
             # Show success message
             messagebox.showinfo("Success", "Connected to MySQL successfully!")
@@ -178,6 +307,15 @@ class LoginScreen:
             self._open_database_selector()
         except Exception as e:
             messagebox.showerror("Unexpected Error", f"An error occurred: {e}")
+    
+    def _on_connect_error(self, error):
+        """Handle an unexpected error raised while connecting.
+        
+        Args:
+            error: The raised exception
+        """
+        self._set_connecting(False)
+        messagebox.showerror("Unexpected Error", f"An error occurred: {error}")
             
     def _open_database_selector(self):
         """Open the database selector screen."""
@@ -185,5 +323,7 @@ class LoginScreen:
         for widget in self.main_frame.winfo_children():
             widget.destroy()
         
+        from gui.database_selector import DatabaseSelector
+        
         # Create database selector screen
-        DatabaseSelector(self.root, self.main_frame, self.db_manager, self.config)
\ No newline at end of file
+        DatabaseSelector(self.root, self.main_frame, self.db_manager, self.config, self.executor)
\ No newline at end of file
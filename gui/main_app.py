@@ -6,14 +6,20 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 
+from database.db_manager import calibrate_bcrypt_rounds
+from gui.users.change_poller import UserChangePoller
 from gui.users.user_list import UserListView
 from gui.users.user_form import UserForm
 
 
+# Milliseconds between refreshes of the query performance panel
+PERFORMANCE_REFRESH_MS = 1000
+
+
 class MainApp:
     """Main application class for the User Management System."""
     
-    def __init__(self, root, parent_frame, db_manager, config):
+    def __init__(self, root, parent_frame, db_manager, config, executor):
         """Initialize main application.
         
         Args:
@@ -21,11 +27,23 @@ class MainApp:
             parent_frame: Parent frame to place widgets in
             db_manager: Database manager instance
             config: Application configuration object
+            executor: Background executor for database calls
         """
         self.root = root
         self.parent_frame = parent_frame
         self.db_manager = db_manager
         self.config = config
+        self.executor = executor
+        
+        # Client-side user search index, built by the user list view. Every
+        # rebuild starts a new generation; builds of older ones are dropped
+        self.search_index = None
+        self.search_index_generation = 0
+        # Generation of the index being built, or None
+        self.search_index_building = None
+        
+        # The user list is kept alive while other views are shown
+        self.user_list = None
         
         # Update window title with database name
         self.root.title(f"User Management System - {self.db_manager.db_name}")
@@ -35,6 +53,13 @@ class MainApp:
         
         # Start with user list view
         self._show_user_list()
+        
+        # Pick up users changed by other operators
+        self.change_poller = UserChangePoller(
+            self.main_container, self.db_manager, self.executor, self._on_user_changes,
+            interval_ms=self.config.get("change_poll_interval_ms", 5000)
+        )
+        self.change_poller.start()
     
     def _create_structure(self):
         """Create the main application UI structure."""
@@ -125,15 +150,35 @@ class MainApp:
         )
     
     def _clear_content(self):
-        """Clear the content frame."""
+        """Clear the content frame, hiding rather than destroying the user list."""
+        list_frame = None
+        if self.user_list is not None and self.user_list.frame.winfo_exists():
+            list_frame = self.user_list.frame
+            self.user_list.hide()
+        
         for widget in self.content_frame.winfo_children():
-            widget.destroy()
+            if widget is not list_frame:
+                widget.destroy()
     
     def _show_user_list(self):
-        """Show the user list view."""
+        """Show the user list view, refreshing only what changed since it was last shown."""
         self._clear_content()
         self._update_status(f"Connected to {self.db_manager.db_name}")
-        UserListView(self.content_frame, self.db_manager, self)
+        if self.user_list is None or not self.user_list.frame.winfo_exists():
+            self.user_list = UserListView(self.content_frame, self.db_manager, self)
+        else:
+            self.user_list.show()
+    
+    def _on_user_changes(self, users, refresh_needed):
+        """Apply changes found by the change poller.
+        
+        Args:
+            users: Users inserted or updated by other operators
+            refresh_needed: True if users were deleted or too many changed to list
+        """
+        self.db_manager.invalidate_users(None if refresh_needed else [user["userId"] for user in users])
+        if self.user_list is not None and self.user_list.frame.winfo_exists():
+            self.user_list.apply_changes(users, refresh_needed)
     
     def _show_user_form(self, user_id=None):
         """Show the user form (create or edit).
@@ -198,6 +243,29 @@ class MainApp:
         )
         db_label.pack(anchor=tk.W, pady=2)
         
+        # Password hashing settings
+        security_frame = ttk.LabelFrame(settings_frame, text="Password Hashing", padding=10)
+        security_frame.pack(fill=tk.X, pady=10)
+        
+        rounds_label = ttk.Label(
+            security_frame,
+            text=f"bcrypt cost factor: {self.db_manager.bcrypt_rounds} "
+                 f"(target {self.config.get('bcrypt_target_ms', 250)} ms per hash)"
+        )
+        rounds_label.pack(anchor=tk.W, pady=2)
+        
+        calibrate_button = ttk.Button(
+            security_frame,
+            text="Recalibrate",
+            command=lambda: self._calibrate_bcrypt(rounds_label, calibrate_button)
+        )
+        calibrate_button.pack(anchor=tk.W, pady=5)
+        
+        # Query performance
+        performance_frame = ttk.LabelFrame(settings_frame, text="Query Performance", padding=10)
+        performance_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self._create_performance_panel(performance_frame)
+        
         # About section
         about_frame = ttk.LabelFrame(settings_frame, text="About", padding=10)
         about_frame.pack(fill=tk.X, pady=10)
@@ -209,6 +277,120 @@ class MainApp:
         )
         about_text.pack(anchor=tk.W, pady=5)
     
+    def _create_performance_panel(self, parent):
+        """Create the live latency table of database methods and statements.
+        
+        Args:
+            parent: Frame to place the panel in
+        """
+        instrumentation = self.db_manager.instrumentation
+        if instrumentation is None:
+            ttk.Label(parent, text="Query instrumentation is disabled in the configuration.").pack(anchor=tk.W)
+            return
+        
+        controls = ttk.Frame(parent)
+        controls.pack(fill=tk.X, pady=(0, 5))
+        
+        kind_var = tk.StringVar(value="methods")
+        ttk.Radiobutton(controls, text="By method", variable=kind_var, value="methods").pack(side=tk.LEFT)
+        ttk.Radiobutton(controls, text="By statement", variable=kind_var, value="statements").pack(side=tk.LEFT, padx=10)
+        
+        def reset():
+            instrumentation.reset()
+            if self.db_manager.cache is not None:
+                self.db_manager.cache.reset_stats()
+        
+        ttk.Button(controls, text="Reset", command=reset).pack(side=tk.RIGHT)
+        
+        if instrumentation.slow_query_log:
+            slow_log_text = (
+                f"Statements slower than {instrumentation.slow_query_ms} ms are logged to "
+                f"{instrumentation.slow_query_log}"
+            )
+        else:
+            slow_log_text = "The slow-query log is disabled."
+        ttk.Label(parent, text=slow_log_text).pack(anchor=tk.W, pady=(0, 5))
+        
+        cache = self.db_manager.cache
+        cache_label = ttk.Label(parent)
+        cache_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        columns = ("name", "calls", "errors", "rows", "p50", "p95", "p99", "max", "last_error")
+        tree = ttk.Treeview(parent, columns=columns, show="headings", height=8)
+        headings = {
+            "name": ("Operation", 260, tk.W),
+            "calls": ("Calls", 60, tk.E),
+            "errors": ("Errors", 60, tk.E),
+            "rows": ("Rows", 80, tk.E),
+            "p50": ("p50 ms", 70, tk.E),
+            "p95": ("p95 ms", 70, tk.E),
+            "p99": ("p99 ms", 70, tk.E),
+            "max": ("Max ms", 70, tk.E),
+            "last_error": ("Last Error", 200, tk.W)
+        }
+        for column, (text, width, anchor) in headings.items():
+            tree.heading(column, text=text)
+            tree.column(column, width=width, anchor=anchor, stretch=column in ("name", "last_error"))
+        tree.pack(fill=tk.BOTH, expand=True)
+        
+        def refresh():
+            if not tree.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            for row in instrumentation.snapshot(kind_var.get()):
+                tree.insert("", "end", values=(
+                    row["name"],
+                    f"{row['calls']:,}",
+                    f"{row['errors']:,}",
+                    f"{row['rows']:,}",
+                    f"{row['p50_ms']:.1f}",
+                    f"{row['p95_ms']:.1f}",
+                    f"{row['p99_ms']:.1f}",
+                    f"{row['max_ms']:.1f}",
+                    row["last_error"] or ""
+                ))
+            if cache is None:
+                cache_label.config(text="The point-lookup cache is disabled.")
+            else:
+                stats = cache.stats()
+                cache_label.config(text=(
+                    f"Point-lookup cache: {stats['hits']:,} hits, {stats['misses']:,} misses "
+                    f"({stats['hit_rate']:.0%} hit rate), {stats['size']:,}/{stats['max_size']:,} entries, "
+                    f"{stats['invalidations']:,} invalidated"
+                ))
+            tree.after(PERFORMANCE_REFRESH_MS, refresh)
+        
+        refresh()
+    
+    def _calibrate_bcrypt(self, label, button):
+        """Benchmark bcrypt on this host and store the chosen cost factor.
+        
+        Existing hashes made with a lower cost are upgraded the next time
+        their password is verified.
+        
+        Args:
+            label: Label showing the current cost factor
+            button: Button that started the calibration
+        """
+        target_ms = self.config.get("bcrypt_target_ms", 250)
+        
+        def on_calibrated(rounds):
+            self.config.set("bcrypt_rounds", rounds)
+            self.db_manager.bcrypt_rounds = rounds
+            label.config(text=f"bcrypt cost factor: {rounds} (target {target_ms} ms per hash)")
+            button.config(state=tk.NORMAL)
+            self._update_status(f"bcrypt cost factor set to {rounds}")
+        
+        button.config(state=tk.DISABLED)
+        self._update_status("Calibrating bcrypt...")
+        self.executor.submit(
+            calibrate_bcrypt_rounds,
+            target_ms,
+            on_success=on_calibrated,
+            key="bcrypt_calibration",
+            owner=button
+        )
+    
     def _toggle_theme(self, button):
         """Toggle application theme.
         
@@ -224,9 +406,11 @@ class MainApp:
             # Go back to database selector
             from gui.database_selector import DatabaseSelector
             
+            self.change_poller.stop()
+            
             # Clear current screen
             for widget in self.parent_frame.winfo_children():
                 widget.destroy()
             
             # Create database selector screen
-            DatabaseSelector(self.root, self.parent_frame, self.db_manager, self.config)
\ No newline at end of file
+            DatabaseSelector(self.root, self.parent_frame, self.db_manager, self.config, self.executor)
\ No newline at end of file
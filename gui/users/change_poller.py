@@ -0,0 +1,184 @@
+"""
+Background polling for users changed by other operators.
+"""
+
+from datetime import datetime, timedelta
+
+
+# Change log entries are written just before their commit, so entries
+# committed slightly out of timestamp order are caught by re-reading this
+# much before the watermarks on every poll
+WATERMARK_OVERLAP = timedelta(seconds=2)
+
+# More changed rows or logged transactions than this in one poll trigger a
+# full refresh instead
+MAX_CHANGES_PER_POLL = 1000
+
+# Watermark used for an empty table
+EPOCH = datetime(1970, 1, 2)
+
+
+class UserChangePoller:
+    """Periodically fetch users changed since the last poll.
+    
+    Each poll reads the change log entries and the User rows past their
+    watermarks, through the indexes on loggedAt and updatedAt, so an idle
+    database costs two cheap range scans per interval.
+    
+    Every transaction that writes User rows through DatabaseManager logs
+    when it started and how many users it deleted. A deletion makes the
+    view refresh. The start time lets the poll reach back for rows of a
+    long transaction, such as a bulk import, whose updatedAt lies well
+    before its commit. Rows written by other tools are still picked up by
+    updatedAt, but their deletions are not noticed.
+    """
+    
+    def __init__(self, widget, db_manager, executor, on_changes, interval_ms: int = 5000):
+        """Initialize the poller.
+        
+        Args:
+            widget: Widget used for scheduling; polling stops once it is destroyed
+            db_manager: Database manager instance
+            executor: Background executor used for the queries
+            on_changes: Callback receiving (changed users, refresh_needed) on the Tk thread;
+                refresh_needed is True when users were deleted or too many changed to list
+            interval_ms: Milliseconds between polls
+        """
+        self.widget = widget
+        self.db_manager = db_manager
+        self.executor = executor
+        self.on_changes = on_changes
+        self.interval_ms = interval_ms
+        self._job = None
+        self._watermark = None
+        self._log_watermark = None
+        # User ID -> updatedAt, and change log version -> loggedAt, of the
+        # rows already seen in the overlap windows
+        self._recent = {}
+        self._seen_versions = {}
+    
+    def start(self):
+        """Start polling."""
+        if self._job is None and self.interval_ms > 0:
+            self._schedule()
+    
+    def stop(self):
+        """Stop polling."""
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except Exception:
+                # Widget already destroyed
+                pass
+            self._job = None
+        self.executor.cancel(self._task_key)
+    
+    @property
+    def _task_key(self):
+        return f"user_change_poll_{id(self)}"
+    
+    def _schedule(self):
+        """Schedule the next poll."""
+        self._job = self.widget.after(self.interval_ms, self._poll)
+    
+    def _poll(self):
+        """Run one poll in the background."""
+        if not self.widget.winfo_exists():
+            self._job = None
+            return
+        self.executor.submit(
+            self._check,
+            on_success=self._on_checked,
+            on_error=lambda error: self._schedule(),
+            key=self._task_key,
+            owner=self.widget,
+            quiet=True
+        )
+    
+    def _on_checked(self, result):
+        """Deliver changes and schedule the next poll (runs on the Tk thread).
+        
+        Args:
+            result: (changed users, refresh_needed)
+        """
+        users, refresh_needed = result
+        if users or refresh_needed:
+            self.on_changes(users, refresh_needed)
+        self._schedule()
+    
+    def _check(self):
+        """Fetch the changes since the last poll (runs on a worker thread).
+        
+        Polls run one after another, so the watermark state needs no lock.
+        
+        Returns:
+            tuple: (changed users, refresh_needed)
+        """
+        if self._watermark is None:
+            if self._resync() is None:
+                return [], False
+            # The rows already in the overlap windows are loaded, not changes
+            rows = self.db_manager.select_users_changed_since(self._watermark - WATERMARK_OVERLAP,
+                                                              MAX_CHANGES_PER_POLL)
+            self._recent = {user["userId"]: updated_at for user, updated_at in rows}
+            entries = self.db_manager.select_user_change_log(self._log_watermark - WATERMARK_OVERLAP,
+                                                             MAX_CHANGES_PER_POLL)
+            self._seen_versions = {version: logged_at for version, _, logged_at, _ in entries}
+            return [], False
+        
+        entries = self.db_manager.select_user_change_log(self._log_watermark - WATERMARK_OVERLAP,
+                                                         MAX_CHANGES_PER_POLL + 1)
+        if len(entries) > MAX_CHANGES_PER_POLL:
+            return self._resync() or [], True
+        
+        deleted = False
+        since = self._watermark - WATERMARK_OVERLAP
+        for version, started_at, logged_at, deleted_users in entries:
+            if version in self._seen_versions:
+                continue
+            self._seen_versions[version] = logged_at
+            self._log_watermark = max(self._log_watermark, logged_at)
+            deleted = deleted or deleted_users > 0
+            # Rows of a long transaction are stamped when written, not when committed
+            since = min(since, started_at)
+        
+        rows = self.db_manager.select_users_changed_since(since, MAX_CHANGES_PER_POLL + 1)
+        if len(rows) > MAX_CHANGES_PER_POLL:
+            # A mass update may share one timestamp, so the watermark could
+            # not advance past it; skip to the latest change and reload
+            return self._resync() or [], True
+        
+        changed = []
+        for user, updated_at in rows:
+            if self._recent.get(user["userId"]) == updated_at:
+                # Already reported by a previous poll of the overlap window
+                continue
+            self._recent[user["userId"]] = updated_at
+            changed.append(user)
+            self._watermark = max(self._watermark, updated_at)
+        
+        # Forget what has left the overlap windows
+        cutoff = self._watermark - WATERMARK_OVERLAP
+        self._recent = {user_id: updated_at for user_id, updated_at in self._recent.items() if updated_at >= cutoff}
+        log_cutoff = self._log_watermark - WATERMARK_OVERLAP
+        self._seen_versions = {version: logged_at for version, logged_at in self._seen_versions.items()
+                               if logged_at >= log_cutoff}
+        
+        return changed, deleted
+    
+    def _resync(self):
+        """Jump the watermarks to the latest change, initially or after an overflow.
+        
+        Returns:
+            list: No individual changes, as the caller reloads instead; None
+            if the state could not be read
+        """
+        state = self.db_manager.get_user_change_state()
+        if state is None:
+            return None
+        latest, latest_logged = state
+        self._watermark = latest or EPOCH
+        self._log_watermark = latest_logged or EPOCH
+        self._recent = {}
+        self._seen_versions = {}
+        return []
@@ -0,0 +1,135 @@
+"""
+Export dialog for streaming users to CSV or JSON Lines files.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import threading
+
+from database.exporter import export_users
+
+
+class ExportDialog:
+    """Modal dialog that exports the user table and shows its progress."""
+    
+    def __init__(self, root, db_manager, main_app):
+        """Ask for a destination file and start exporting to it.
+        
+        Args:
+            root: Tkinter root window
+            db_manager: Database manager instance
+            main_app: Main application reference
+        """
+        self.root = root
+        self.db_manager = db_manager
+        self.main_app = main_app
+        self.cancel_event = threading.Event()
+        
+        path = filedialog.asksaveasfilename(
+            parent=root,
+            title="Export Users",
+            defaultextension=".csv",
+            filetypes=[
+                ("CSV files", "*.csv"),
+                ("Compressed CSV files", "*.csv.gz"),
+                ("JSON Lines files", "*.jsonl"),
+                ("Compressed JSON Lines files", "*.jsonl.gz")
+            ]
+        )
+        if not path:
+            return
+        
+        self.path = path
+        self.include_login = messagebox.askyesno(
+            "Export Users",
+            "Include login usernames?\n(Password hashes are never exported.)",
+            parent=root
+        )
+        self._create_widgets()
+        self._start_export()
+    
+    def _create_widgets(self):
+        """Create dialog widgets."""
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Exporting Users")
+        self.window.transient(self.root)
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self._cancel)
+        
+        frame = ttk.Frame(self.window, padding=20)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text=f"Exporting to {self.path}", style="Header.TLabel").pack(anchor=tk.W)
+        
+        # The row count is not known up front, so progress is indeterminate
+        self.progress = ttk.Progressbar(frame, orient=tk.HORIZONTAL, length=400, mode="indeterminate")
+        self.progress.pack(fill=tk.X, pady=10)
+        self.progress.start(15)
+        
+        self.status_label = ttk.Label(frame, text="Starting...")
+        self.status_label.pack(anchor=tk.W)
+        
+        self.cancel_button = ttk.Button(frame, text="Cancel", command=self._cancel)
+        self.cancel_button.pack(anchor=tk.E, pady=(10, 0))
+        
+        self.window.grab_set()
+    
+    def _start_export(self):
+        """Run the export on a worker thread."""
+        self.main_app.executor.submit(
+            export_users,
+            self.db_manager,
+            self.path,
+            include_login=self.include_login,
+            progress=lambda exported: self.main_app.executor.post(self._show_progress, exported),
+            cancel_event=self.cancel_event,
+            on_success=self._on_finished,
+            on_error=self._on_error,
+            owner=self.window
+        )
+    
+    def _show_progress(self, exported):
+        """Update the exported row count (runs on the Tk thread).
+        
+        Args:
+            exported: Rows exported so far
+        """
+        if self.window.winfo_exists():
+            self.status_label.config(text=f"Exported {exported:,} users")
+    
+    def _cancel(self):
+        """Stop the export and discard the partial file."""
+        self.cancel_event.set()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Cancelling...")
+    
+    def _close(self):
+        """Close the dialog."""
+        self.progress.stop()
+        self.window.grab_release()
+        self.window.destroy()
+    
+    def _on_finished(self, result):
+        """Report the outcome of the export.
+        
+        Args:
+            result: ExportResult of the export
+        """
+        self._close()
+        if result.cancelled:
+            messagebox.showinfo("Export Cancelled", "The export was cancelled.")
+        else:
+            messagebox.showinfo(
+                "Export Complete",
+                f"Exported {result.exported:,} users to {result.path} "
+                f"in {result.elapsed:.1f} s ({result.rate:,.0f} users/s)."
+            )
+    
+    def _on_error(self, error):
+        """Report an export that failed.
+        
+        Args:
+            error: The raised exception
+        """
+        self._close()
+        messagebox.showerror("Export Failed", f"Failed to export users: {error}")
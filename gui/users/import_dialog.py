@@ -0,0 +1,143 @@
+"""
+Bulk import dialog for loading users from CSV or JSON Lines files.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import threading
+
+from database.importer import import_users
+
+
+class ImportDialog:
+    """Modal dialog that imports a user file and shows its progress."""
+    
+    def __init__(self, root, db_manager, main_app, on_done=None):
+        """Ask for a file and start importing it.
+        
+        Args:
+            root: Tkinter root window
+            db_manager: Database manager instance
+            main_app: Main application reference
+            on_done: Optional callback invoked after users were imported
+        """
+        self.root = root
+        self.db_manager = db_manager
+        self.main_app = main_app
+        self.on_done = on_done
+        self.cancel_event = threading.Event()
+        
+        path = filedialog.askopenfilename(
+            parent=root,
+            title="Import Users",
+            filetypes=[
+                ("User files", "*.csv *.jsonl *.ndjson *.csv.gz *.jsonl.gz"),
+                ("CSV files", "*.csv *.csv.gz"),
+                ("JSON Lines files", "*.jsonl *.ndjson *.jsonl.gz"),
+                ("All files", "*.*")
+            ]
+        )
+        if not path:
+            return
+        
+        self.path = path
+        self._create_widgets()
+        self._start_import()
+    
+    def _create_widgets(self):
+        """Create dialog widgets."""
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Importing Users")
+        self.window.transient(self.root)
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self._cancel)
+        
+        frame = ttk.Frame(self.window, padding=20)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text=f"Importing {self.path}", style="Header.TLabel").pack(anchor=tk.W)
+        
+        self.progress = ttk.Progressbar(frame, orient=tk.HORIZONTAL, length=400, mode="determinate", maximum=100)
+        self.progress.pack(fill=tk.X, pady=10)
+        
+        self.status_label = ttk.Label(frame, text="Starting...")
+        self.status_label.pack(anchor=tk.W)
+        
+        self.cancel_button = ttk.Button(frame, text="Cancel", command=self._cancel)
+        self.cancel_button.pack(anchor=tk.E, pady=(10, 0))
+        
+        self.window.grab_set()
+    
+    def _start_import(self):
+        """Run the import on a worker thread."""
+        config = self.main_app.config
+        self.main_app.executor.submit(
+            import_users,
+            self.db_manager,
+            self.path,
+            batch_size=config.get("import_batch_size", 1000),
+            commit_interval=config.get("import_commit_interval", 10000),
+            use_load_data=config.get("allow_local_infile", False),
+            progress=lambda *args: self.main_app.executor.post(self._show_progress, *args),
+            cancel_event=self.cancel_event,
+            on_success=self._on_finished,
+            on_error=self._on_error,
+            owner=self.window
+        )
+    
+    def _show_progress(self, bytes_read, total_bytes, inserted, rejected):
+        """Update the progress bar (runs on the Tk thread).
+        
+        Args:
+            bytes_read: Bytes of the input file read so far
+            total_bytes: Size of the input file
+            inserted: Users inserted so far
+            rejected: Rows rejected so far
+        """
+        if not self.window.winfo_exists():
+            return
+        if total_bytes:
+            self.progress["value"] = min(100, bytes_read * 100 / total_bytes)
+        self.status_label.config(text=f"Inserted {inserted:,} users, rejected {rejected:,} rows")
+    
+    def _cancel(self):
+        """Stop the import after the current chunk."""
+        self.cancel_event.set()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Cancelling...")
+    
+    def _on_finished(self, result):
+        """Report the outcome of the import.
+        
+        Args:
+            result: ImportResult of the import
+        """
+        self.window.grab_release()
+        self.window.destroy()
+        
+        message = (
+            f"Inserted {result.inserted:,} of {result.read:,} rows "
+            f"in {result.elapsed:.1f} s ({result.rate:,.0f} users/s)."
+        )
+        if result.rejected:
+            message += f"\n\n{result.rejected:,} rows were rejected; see {result.rejected_path}"
+        if result.cancelled:
+            message += "\n\nThe import was cancelled."
+        
+        if result.failed:
+            messagebox.showerror("Import Stopped", message + "\n\nA database error stopped the import.")
+        else:
+            messagebox.showinfo("Import Complete", message)
+        
+        if result.inserted and self.on_done:
+            self.on_done()
+    
+    def _on_error(self, error):
+        """Report an import that could not run.
+        
+        Args:
+            error: The raised exception
+        """
+        self.window.grab_release()
+        self.window.destroy()
+        messagebox.showerror("Import Failed", f"Failed to import users: {error}")
@@ -25,13 +25,34 @@ class UserForm:
         self.user_id = user_id
         self.user_data = None
         
-        # If editing, load user data
+        # If editing, load user data in the background
         if self.user_id:
-            self.user_data = self.db_manager.select_user_by_id(self.user_id)
-            if not self.user_data:
-                messagebox.showerror("Error", f"User ID {self.user_id} not found")
-                self.main_app._show_user_list()
-                return
+            self.loading_label = ttk.Label(self.parent, text="Loading user...", padding=10)
+            self.loading_label.pack(anchor=tk.W)
+            self.main_app.executor.submit(
+                self.db_manager.select_user_by_id, self.user_id,
+                on_success=self._on_user_loaded,
+                on_error=lambda error: self._on_user_loaded(None),
+                key="user_form",
+                owner=self.loading_label
+            )
+            return
+        
+        # Create widgets
+        self._create_widgets()
+    
+    def _on_user_loaded(self, user_data):
+        """Show the form once the edited user has been loaded.
+        
+        Args:
+            user_data: User dictionary, or None if the user was not found
+        """
+        self.loading_label.destroy()
+        self.user_data = user_data
+        if not self.user_data:
+            messagebox.showerror("Error", f"User ID {self.user_id} not found")
+            self.main_app._show_user_list()
+            return
         
         # Create widgets
         self._create_widgets()
@@ -101,9 +122,9 @@ class UserForm:
         # Access level
         ttk.Label(user_frame, text="Access Level:").grid(row=3, column=0, sticky="w", pady=5)
         self.access_level_var = tk.StringVar(
-            value=self.user_data["accessLevel"] if self.user_data else "user"
+            value=self.user_data["accessLevel"] if self.user_data else "basic"
         )
-        access_level_options = ["user", "admin"]
+        access_level_options = ["basic", "admin"]
         self.access_level_combobox = ttk.Combobox(
             user_frame, textvariable=self.access_level_var, values=access_level_options, state="readonly"
         )
@@ -114,13 +135,13 @@ class UserForm:
         # Create buttons
         button_frame = ttk.Frame(self.form_frame)
         button_frame.grid(row=2, column=0, columnspan=2, pady=(10, 0))
-        save_button = ttk.Button(
+        self.save_button = ttk.Button(
             button_frame,
             text="Save",
             command=self._save_user,
             style="Primary.TButton"
         )
-        save_button.grid(row=0, column=0, padx=5)
+        self.save_button.grid(row=0, column=0, padx=5)
         cancel_button = ttk.Button(
             button_frame,
             text="Cancel",
@@ -145,25 +166,59 @@ class UserForm:
             messagebox.showerror("Error", "Invalid email format")
             return
         
-        # Save user data
+        # Save user data in the background
         if self.user_id:
-            success = self.db_manager.update_user(
-                self.user_id, first_name, last_name, email, access_level
-            )
             action = "updated"
+            # Only send the fields that were changed
+            current = self.user_data
+            save = lambda: self.db_manager.update_user(
+                self.user_id,
+                first_name if first_name != current["firstName"] else None,
+                last_name if last_name != current["lastName"] else None,
+                email if email != current["email"] else None,
+                access_level if access_level != current["accessLevel"] else None
+            )
         else:
-            success = self.db_manager.insert_user(
+            action = "added"
+            save = lambda: self.db_manager.insert_user(
                 first_name, last_name, email, access_level
             )
-            action = "added"
+        
+        self.save_button.config(state=tk.DISABLED)
+        self.main_app._update_status("Saving user...")
+        self.main_app.executor.submit(
+            save,
+            on_success=lambda success: self._on_user_saved(success, action),
+            on_error=lambda error: self._on_user_saved(False, action),
+            key="user_form",
+            owner=self.frame
+        )
+    
+    def _on_user_saved(self, success, action):
+        """Report the result of a save.
+        
+        Args:
+            success: Whether the save succeeded
+            action: Past-tense description of the action
+        """
+        self.save_button.config(state=tk.NORMAL)
         
         if success:
+            # Keep the client-side search index in step with the edit
+            if self.main_app.search_index is not None:
+                self.main_app.search_index.update({
+                    "userId": self.user_id or success,
+                    "firstName": self.first_name_var.get().strip(),
+                    "lastName": self.last_name_var.get().strip(),
+                    "email": self.email_var.get().strip(),
+                    "accessLevel": self.access_level_var.get()
+                })
+            
             messagebox.showinfo("Success", f"User successfully {action}")
             self.main_app._show_user_list()
         else:
             messagebox.showerror("Error", f"Failed to {action} user")
-
-
-
     
-   
\ No newline at end of file
+    def _cancel(self):
+        """Discard changes and return to the user list."""
+        self.main_app._show_user_list()
@@ -4,6 +4,465 @@ User list view module for displaying and managing users.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from collections import deque
+
+from database.db_manager import ACCESS_LEVELS, USER_SORT_KEYS
+from gui.users.export_dialog import ExportDialog
+from gui.users.import_dialog import ImportDialog
+from utils.search_index import UserSearchIndex
+
+
+# Number of users fetched per page and number of pages kept in the treeview
+PAGE_SIZE = 200
+MAX_PAGES = 5
+
+# Fraction of the scroll range from either edge at which the next page is loaded
+SCROLL_MARGIN = 0.15
+
+# Milliseconds to wait after the last keystroke before searching
+SEARCH_DELAY = 250
+
+# Number of users fetched per query while building the search index
+INDEX_BATCH_SIZE = 5000
+
+# Column headings of the user list, and the markers of the sorted column
+USER_COLUMNS = {
+    "userId": "ID",
+    "firstName": "First Name",
+    "lastName": "Last Name",
+    "email": "Email",
+    "accessLevel": "Access Level"
+}
+SORT_MARKERS = (" \u25b2", " \u25bc")
+
+
+def user_sort_key(sort):
+    """Key function sorting users in memory the way select_users_sorted does.
+    
+    Text compares case-insensitively like MySQL's default collation, access
+    levels by their ENUM position, and NULL sorts first.
+    
+    Args:
+        sort: Column to sort by, one of USER_SORT_KEYS
+    
+    Returns:
+        Callable: Key function for a user dictionary
+    """
+    def column_key(column, value):
+        if value is None:
+            return (0, 0)
+        if column == "accessLevel":
+            return (1, ACCESS_LEVELS.index(value) if value in ACCESS_LEVELS else len(ACCESS_LEVELS))
+        if isinstance(value, str):
+            return (1, value.lower())
+        return (1, value)
+    
+    columns = USER_SORT_KEYS[sort]
+    return lambda user: tuple(column_key(column, user[column]) for column in columns)
+
+
+class PagedTreeview:
+    """Virtual scrolling over a paged row source for a ttk.Treeview.
+    
+    Only a sliding window of at most ``max_pages`` pages lives in the
+    treeview. Pages are loaded as the user scrolls towards either edge of the
+    window and dropped from the opposite edge, so memory use and rendering
+    cost stay flat no matter how many rows the source holds. The next page is
+    prefetched in the background while the current one is being viewed.
+    
+    A row source is a callable ``fetch(cursor, limit)`` returning
+    ``(rows, next_cursor)``; it is called on a worker thread with ``None`` for
+    the first page, and ``next_cursor`` is ``None`` once the source is exhausted.
+    """
+    
+    def __init__(self, tree, scrollbar, executor, row_key, row_values,
+                 page_size=PAGE_SIZE, max_pages=MAX_PAGES, on_change=None):
+        """Initialize the paged treeview.
+        
+        Args:
+            tree: Treeview to fill
+            scrollbar: Vertical scrollbar attached to the treeview
+            executor: Background executor used to fetch pages
+            row_key: Callable returning the unique key of a row
+            row_values: Callable returning the treeview values of a row
+            page_size: Number of rows per page
+            max_pages: Maximum number of pages kept in the treeview
+            on_change: Optional callback invoked after the window changes
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.executor = executor
+        self.row_key = row_key
+        self.row_values = row_values
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.on_change = on_change
+        
+        self.fetch = None
+        self.loading = False
+        self.error = None
+        self._pages = deque()
+        self._trimmed = []
+        self._prefetched = None
+        self._removed = set()
+        self._generation = 0
+        self._task_key = f"paged_tree_{id(self)}"
+        
+        self.tree.configure(yscrollcommand=self._on_scroll)
+    
+    @property
+    def row_count(self):
+        """Number of rows currently in the treeview."""
+        return sum(len(page["rows"]) for page in self._pages)
+    
+    @property
+    def has_more(self):
+        """Whether rows exist beyond either edge of the window."""
+        return bool(self._trimmed) or self._next_cursor() is not None
+    
+    def reset(self, fetch):
+        """Clear the treeview and start browsing a new row source.
+        
+        Args:
+            fetch: Row source callable
+        """
+        self._generation += 1
+        self.executor.cancel(self._task_key)
+        self.executor.cancel(self._task_key + "_prefetch")
+        
+        self.fetch = fetch
+        self.loading = False
+        self.error = None
+        self._pages.clear()
+        self._trimmed = []
+        self._prefetched = None
+        self._removed = set()
+        self.tree.delete(*self.tree.get_children())
+        
+        self._load_page(None, at_end=True)
+    
+    def remove_rows(self, keys):
+        """Remove rows from the window in place, without reloading it.
+        
+        The rows are also kept out of pages loaded later, which may have been
+        fetched before the rows were removed.
+        
+        Args:
+            keys: Keys of the rows to remove
+        """
+        keys = set(keys)
+        self._removed.update(keys)
+        for page in self._pages:
+            page["rows"] = [row for row in page["rows"] if self.row_key(row) not in keys]
+        
+        present = [key for key in keys if self.tree.exists(key)]
+        if present:
+            self.tree.delete(*present)
+        
+        if self.on_change:
+            self.on_change()
+    
+    def update_rows(self, rows):
+        """Replace displayed rows with newer versions in place.
+        
+        Args:
+            rows: New versions of rows, identified by their key
+        
+        Returns:
+            list: The rows that are not in the window
+        """
+        updated = {}
+        missing = []
+        for row in rows:
+            key = self.row_key(row)
+            if self.tree.exists(key):
+                updated[key] = row
+                self.tree.item(key, values=self.row_values(row))
+            else:
+                missing.append(row)
+        
+        if updated:
+            for page in self._pages:
+                page["rows"] = [updated.get(self.row_key(row), row) for row in page["rows"]]
+        return missing
+    
+    def window_bounds(self):
+        """Cursors delimiting the rows the window covers.
+        
+        Returns:
+            tuple: (cursor of the first page, cursor after the last page), where
+            None means the window reaches that end of the source
+        """
+        if not self._pages:
+            return None, None
+        return self._pages[0]["cursor"], self._pages[-1]["next"]
+    
+    def refresh(self, fetch=None):
+        """Re-read the pages in the window and apply only the differences.
+        
+        Rows keep their treeview items, so selection and scroll position
+        survive, and only inserted, changed or removed rows touch the
+        treeview.
+        
+        Args:
+            fetch: New row source for the same rows, or None to keep the current one
+        """
+        if fetch is not None:
+            self.fetch = fetch
+        if self.fetch is None:
+            return
+        if not self._pages:
+            self.reset(self.fetch)
+            return
+        
+        # Supersede page loads in flight; the refreshed window replaces them
+        self._generation += 1
+        self.executor.cancel(self._task_key)
+        self.executor.cancel(self._task_key + "_prefetch")
+        self.loading = True
+        self._prefetched = None
+        
+        generation = self._generation
+        fetch = self.fetch
+        first_cursor = self._pages[0]["cursor"]
+        page_count = len(self._pages)
+        page_size = self.page_size
+        
+        def load():
+            pages = []
+            cursor = first_cursor
+            for _ in range(page_count):
+                rows, next_cursor = fetch(cursor, page_size)
+                pages.append({"cursor": cursor, "rows": rows, "next": next_cursor})
+                if next_cursor is None:
+                    break
+                cursor = next_cursor
+            return pages
+        
+        self.executor.submit(
+            load,
+            on_success=lambda pages: self._apply_refresh(generation, pages),
+            on_error=lambda error: self._on_error(generation, error),
+            key=self._task_key,
+            owner=self.tree
+        )
+    
+    def _apply_refresh(self, generation, pages):
+        """Bring the treeview in line with re-read pages.
+        
+        Args:
+            generation: Generation the refresh was started in
+            pages: Re-read pages of the window
+        """
+        if generation != self._generation:
+            return
+        self.loading = False
+        self.error = None
+        
+        old_values = {}
+        for page in self._pages:
+            for row in page["rows"]:
+                old_values[self.row_key(row)] = self.row_values(row)
+        
+        # Keep the first visible row in place
+        old_keys = list(self.tree.get_children())
+        first_visible = int(round(self.tree.yview()[0] * len(old_keys))) if old_keys else 0
+        anchor = old_keys[min(first_visible, len(old_keys) - 1)] if old_keys else None
+        
+        seen = set()
+        for page in pages:
+            rows = []
+            for row in page["rows"]:
+                key = self.row_key(row)
+                if key not in seen and key not in self._removed:
+                    seen.add(key)
+                    rows.append(row)
+            page["rows"] = rows
+        
+        removed = [key for key in old_keys if key not in seen]
+        if removed:
+            self.tree.delete(*removed)
+        
+        # Walk the new rows against the surviving items, which are still in order
+        current = [key for key in old_keys if key in seen]
+        index = 0
+        for page in pages:
+            for row in page["rows"]:
+                key = self.row_key(row)
+                values = self.row_values(row)
+                if index < len(current) and current[index] == key:
+                    if old_values.get(key) != values:
+                        self.tree.item(key, values=values)
+                elif key in old_values:
+                    # The row moved, e.g. because its sort key changed
+                    self.tree.move(key, "", index)
+                    current.remove(key)
+                    current.insert(index, key)
+                    if old_values[key] != values:
+                        self.tree.item(key, values=values)
+                else:
+                    self.tree.insert("", index, iid=key, values=values)
+                    current.insert(index, key)
+                index += 1
+        
+        self._pages = deque(pages)
+        
+        if anchor is not None and anchor in seen and current:
+            self.tree.yview_moveto(current.index(anchor) / len(current))
+        
+        self._prefetch()
+        if self.on_change:
+            self.on_change()
+    
+    def _next_cursor(self):
+        """Cursor of the page after the window, or None at the end of the source."""
+        if not self._pages:
+            return None
+        return self._pages[-1]["next"]
+    
+    def _on_scroll(self, first, last):
+        """Forward scroll updates to the scrollbar and load pages near the edges.
+        
+        Args:
+            first: Fraction of the rows above the visible area
+            last: Fraction of the rows up to the end of the visible area
+        """
+        self.scrollbar.set(first, last)
+        
+        if self.loading or self.fetch is None or not self._pages:
+            return
+        
+        if float(last) >= 1.0 - SCROLL_MARGIN and self._next_cursor() is not None:
+            self._load_page(self._next_cursor(), at_end=True)
+        elif float(first) <= SCROLL_MARGIN and self._trimmed:
+            self._load_page(self._trimmed[-1], at_end=False)
+    
+    def _load_page(self, cursor, at_end):
+        """Fetch a page in the background and add it to the window.
+        
+        Args:
+            cursor: Cursor of the page to load
+            at_end: True to append the page, False to prepend it
+        """
+        # Use the prefetched page when it is the one being asked for
+        if at_end and self._prefetched is not None and self._prefetched[0] == cursor:
+            _, rows, next_cursor = self._prefetched
+            self._prefetched = None
+            self._add_page(self._generation, cursor, at_end, (rows, next_cursor))
+            return
+        
+        self.loading = True
+        generation = self._generation
+        self.executor.submit(
+            self.fetch, cursor, self.page_size,
+            on_success=lambda result: self._add_page(generation, cursor, at_end, result),
+            on_error=lambda error: self._on_error(generation, error),
+            key=self._task_key,
+            owner=self.tree
+        )
+    
+    def _prefetch(self):
+        """Fetch the page after the window ahead of time."""
+        cursor = self._next_cursor()
+        if cursor is None:
+            return
+        
+        generation = self._generation
+        
+        def store(result):
+            if generation == self._generation:
+                self._prefetched = (cursor, result[0], result[1])
+        
+        self.executor.submit(
+            self.fetch, cursor, self.page_size,
+            on_success=store,
+            key=self._task_key + "_prefetch",
+            owner=self.tree
+        )
+    
+    def _on_error(self, generation, error):
+        """Record a failed page load.
+        
+        Args:
+            generation: Generation the load was started in
+            error: The raised exception
+        """
+        if generation != self._generation:
+            return
+        self.loading = False
+        self.error = error
+        if self.on_change:
+            self.on_change()
+    
+    def _add_page(self, generation, cursor, at_end, result):
+        """Insert a loaded page and drop the page on the opposite edge.
+        
+        Args:
+            generation: Generation the load was started in
+            cursor: Cursor the page was loaded from
+            at_end: True to append the page, False to prepend it
+            result: (rows, next_cursor) returned by the row source
+        """
+        if generation != self._generation:
+            return
+        
+        self.loading = False
+        rows, next_cursor = result
+        
+        # Rows that moved between pages since they were first shown stay where
+        # they are, and rows removed since the page was fetched stay removed
+        rows = [
+            row for row in rows
+            if not self.tree.exists(self.row_key(row)) and self.row_key(row) not in self._removed
+        ]
+        page = {"cursor": cursor, "rows": rows, "next": next_cursor}
+        
+        # Remember the first visible row so the view does not jump
+        total_before = self.row_count
+        first_visible = int(round(self.tree.yview()[0] * total_before)) if total_before else 0
+        
+        if at_end:
+            for row in rows:
+                self.tree.insert("", "end", iid=self.row_key(row), values=self.row_values(row))
+            self._pages.append(page)
+            if len(self._pages) > self.max_pages:
+                dropped = self._pages.popleft()
+                self._trimmed.append(dropped["cursor"])
+                self._delete_rows(dropped["rows"])
+                first_visible -= len(dropped["rows"])
+        else:
+            self._trimmed.pop()
+            for index, row in enumerate(rows):
+                self.tree.insert("", index, iid=self.row_key(row), values=self.row_values(row))
+            self._pages.appendleft(page)
+            first_visible += len(rows)
+            if len(self._pages) > self.max_pages:
+                dropped = self._pages.pop()
+                self._prefetched = None
+                self._delete_rows(dropped["rows"])
+        
+        total_after = self.row_count
+        if total_before and total_after:
+            self.tree.yview_moveto(max(0, first_visible) / total_after)
+        
+        if at_end and not rows and next_cursor is not None:
+            # Every row of the page was filtered out; keep going so the
+            # window does not stall with nothing to scroll
+            self._load_page(next_cursor, at_end=True)
+        elif at_end:
+            self._prefetch()
+        
+        if self.on_change:
+            self.on_change()
+    
+    def _delete_rows(self, rows):
+        """Remove rows of a dropped page from the treeview.
+        
+        Args:
+            rows: Rows to remove
+        """
+        if rows:
+            self.tree.delete(*[self.row_key(row) for row in rows])
 
 
 class UserListView:
@@ -20,12 +479,20 @@ class UserListView:
         self.parent = parent
         self.db_manager = db_manager
         self.main_app = main_app
+        self.search_text = ""
+        self._search_job = None
+        self.sort_column = "userId"
+        self.sort_descending = False
         
         # Create widgets
         self._create_widgets()
         
         # Load users
         self._load_users()
+        
+        # Build the client-side search index once per load
+        if self.main_app.search_index is None:
+            self._build_search_index()
     
     def _create_widgets(self):
         """Create view widgets."""
@@ -43,10 +510,24 @@ class UserListView:
         refresh_btn = ttk.Button(
             title_frame,
             text="Refresh",
-            command=self._load_users
+            command=self._refresh
         )
         refresh_btn.pack(side=tk.RIGHT, padx=5)
         
+        export_btn = ttk.Button(
+            title_frame,
+            text="Export...",
+            command=self._export_users
+        )
+        export_btn.pack(side=tk.RIGHT, padx=5)
+        
+        import_btn = ttk.Button(
+            title_frame,
+            text="Import...",
+            command=self._import_users
+        )
+        import_btn.pack(side=tk.RIGHT, padx=5)
+        
         add_btn = ttk.Button(
             title_frame,
             text="Add New User",
@@ -72,15 +553,12 @@ class UserListView:
         tree_frame.pack(fill=tk.BOTH, expand=True)
         
         # Create treeview columns
-        columns = ("userId", "firstName", "lastName", "email", "accessLevel")
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        self.tree = ttk.Treeview(tree_frame, columns=tuple(USER_COLUMNS), show="headings")
         
-        # Define column headings
-        self.tree.heading("userId", text="ID")
-        self.tree.heading("firstName", text="First Name")
-        self.tree.heading("lastName", text="Last Name")
-        self.tree.heading("email", text="Email")
-        self.tree.heading("accessLevel", text="Access Level")
+        # Define column headings; clicking one sorts by that column
+        for column in USER_COLUMNS:
+            self.tree.heading(column, command=lambda column=column: self._sort_by(column))
+        self._update_headings()
         
         # Define column widths
         self.tree.column("userId", width=50, anchor=tk.CENTER)
@@ -89,9 +567,22 @@ class UserListView:
         self.tree.column("email", width=250)
         self.tree.column("accessLevel", width=100, anchor=tk.CENTER)
         
-        # Add vertical scrollbar
+        # Add vertical scrollbar; the paged treeview forwards scroll updates to it
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        self.pages = PagedTreeview(
+            self.tree,
+            vsb,
+            self.main_app.executor,
+            row_key=lambda user: str(user["userId"]),
+            row_values=lambda user: (
+                user["userId"],
+                user["firstName"],
+                user["lastName"],
+                user["email"],
+                user["accessLevel"]
+            ),
+            on_change=self._update_list_status
+        )
         
         # Add horizontal scrollbar
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
@@ -120,21 +611,24 @@ class UserListView:
         
         delete_btn = ttk.Button(
             action_frame,
-            text="Delete User",
-            command=self._delete_selected_user,
+            text="Delete Selected",
+            command=self._delete_selected_users,
             style="Danger.TButton"
         )
         delete_btn.pack(side=tk.LEFT, padx=5)
         
+        # Shift- and Ctrl-click select several users for deletion
+        self.tree.configure(selectmode="extended")
+        
         # Double-click to edit
         self.tree.bind("<Double-1>", lambda event: self._edit_selected_user())
         
         # Right-click context menu
         self.context_menu = tk.Menu(self.tree, tearoff=0)
         self.context_menu.add_command(label="Edit User", command=self._edit_selected_user)
-        self.context_menu.add_command(label="Delete User", command=self._delete_selected_user)
+        self.context_menu.add_command(label="Delete Selected", command=self._delete_selected_users)
         self.context_menu.add_separator()
-        self.context_menu.add_command(label="Refresh List", command=self._load_users)
+        self.context_menu.add_command(label="Refresh List", command=self._refresh)
         
         self.tree.bind("<Button-3>", self._show_context_menu)
     
@@ -144,69 +638,286 @@ class UserListView:
         Args:
             event: Mouse event
         """
-        # Select row under mouse
+        # Select row under mouse, keeping a multi-selection it belongs to
         iid = self.tree.identify_row(event.y)
         if iid:
-            self.tree.selection_set(iid)
+            if iid not in self.tree.selection():
+                self.tree.selection_set(iid)
             self.context_menu.post(event.x_root, event.y_root)
     
+    def show(self):
+        """Show the view again after another view was displayed in its place."""
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.refresh_list()
+    
+    def hide(self):
+        """Hide the view while keeping its rows, selection and scroll position."""
+        if self._search_job is not None:
+            self.frame.after_cancel(self._search_job)
+            self._search_job = None
+        self.frame.pack_forget()
+    
+    def _sort_by(self, column):
+        """Sort the list by a column, or reverse the order if it is already sorted by it.
+        
+        Args:
+            column: Column to sort by
+        """
+        if column == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = False
+        self._update_headings()
+        self._load_users()
+    
+    def _update_headings(self):
+        """Mark the sorted column and its direction in the headings."""
+        for column, text in USER_COLUMNS.items():
+            if column == self.sort_column:
+                text += SORT_MARKERS[self.sort_descending]
+            self.tree.heading(column, text=text)
+    
+    def _sorted_by_id(self):
+        """Whether the list is in its default order, ascending by user ID."""
+        return self.sort_column == "userId" and not self.sort_descending
+    
+    def _row_source(self):
+        """Pick the row source for the current search text and sort order.
+        
+        Browsing pushes the sort order down to the server. Searches answered
+        from the index are sorted in memory; searches sent to the server stay
+        ranked by relevance.
+        
+        Returns:
+            Row source callable for the paged treeview
+        """
+        self.search_text = self.search_var.get().lower()
+        
+        if not self.search_text:
+            return self._fetch_page if self._sorted_by_id() else self._fetch_sorted_page
+        if self.main_app.search_index is not None:
+            # Answer the search from memory, without a database round trip
+            matches = self.main_app.search_index.search(self.search_text)
+            if not self._sorted_by_id():
+                matches.sort(key=user_sort_key(self.sort_column), reverse=self.sort_descending)
+            return lambda offset, limit: self._fetch_matches(matches, offset, limit)
+        # Too large to index, or the index is still being built
+        return self._fetch_search_page
+    
     def _load_users(self):
         """Load users from database into treeview."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.main_app._update_status("Loading users...")
+        self.pages.reset(self._row_source())
+    
+    def refresh_list(self):
+        """Re-read the displayed users and update only the rows that changed."""
+        self.pages.refresh(self._row_source())
+    
+    def _refresh(self):
+        """Refresh the list and rebuild the search index."""
+        self.refresh_list()
+        self._rebuild_search_index()
+    
+    def apply_changes(self, users, refresh_needed):
+        """Bring the list in line with changes made by other operators.
         
-        # Get users from database
-        users = self.db_manager.select_all_users()
+        Args:
+            users: Users inserted or updated since the last poll
+            refresh_needed: True if users were deleted or too many changed to list
+        """
+        index = self.main_app.search_index
+        if refresh_needed:
+            if index is not None:
+                # Deleted users cannot be told apart, so rebuild the index
+                self._rebuild_search_index()
+        elif index is not None:
+            for user in users:
+                index.update(user)
+        
+        if not self.frame.winfo_ismapped():
+            # show() re-reads the window anyway
+            return
+        
+        if refresh_needed or self.search_text:
+            # Changes may move users in or out of the search results
+            self.refresh_list()
+            return
+        
+        if not self._sorted_by_id():
+            # Changed users may have moved within the sort order
+            self.refresh_list()
+            return
+        
+        missing = self.pages.update_rows(users)
+        first, after_last = self.pages.window_bounds()
+        if any((first is None or user["userId"] > first) and (after_last is None or user["userId"] <= after_last)
+               for user in missing):
+            # New users fall inside the window
+            self.refresh_list()
+    
+    def _rebuild_search_index(self):
+        """Drop the search index and build it again from the current rows.
         
-        # Add users to treeview
-        for user in users:
-            self.tree.insert("", "end", values=(
-                user["userId"],
-                user["firstName"],
-                user["lastName"],
-                user["email"],
-                user["accessLevel"]
-            ))
+        A build that is still running read rows from before the rebuild, so
+        it is superseded rather than waited for.
+        """
+        self.main_app.search_index_generation += 1
+        self.main_app.search_index = None
+        self._build_search_index()
+    
+    def _build_search_index(self):
+        """Build the client-side search index in the background.
         
-        # Update status
-        self.main_app._update_status(f"Loaded {len(users)} users")
+        Tables larger than the configured limit are not indexed; searches on
+        them are pushed down to the server instead.
+        """
+        generation = self.main_app.search_index_generation
+        if self.main_app.search_index_building == generation:
+            return
+        
+        limit = self.main_app.config.get("search_index_limit", 500000)
+        
+        def build():
+            if self.db_manager.count_users() > limit:
+                return None
+            index = UserSearchIndex()
+            index.add_many(self._iter_all_users())
+            return index
+        
+        self.main_app.search_index_building = generation
+        self.main_app.executor.submit(
+            build,
+            on_success=lambda index: self._on_search_index_built(generation, index),
+            on_error=lambda error: self._on_search_index_built(generation, None),
+            key="search_index"
+        )
     
-    def _filter_users(self, *args):
-        """Filter users based on search text."""
-        search_text = self.search_var.get().lower()
-        
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get all users
-        users = self.db_manager.select_all_users()
-        
-        # Filter and add users to treeview
-        filtered_count = 0
-        for user in users:
-            # Check if search text is in any field
-            if (search_text in str(user["userId"]).lower() or
-                search_text in user["firstName"].lower() or
-                search_text in user["lastName"].lower() or
-                search_text in user["email"].lower() or
-                search_text in user["accessLevel"].lower()):
-                
-                self.tree.insert("", "end", values=(
-                    user["userId"],
-                    user["firstName"],
-                    user["lastName"],
-                    user["email"],
-                    user["accessLevel"]
-                ))
-                filtered_count += 1
-        
-        # Update status
-        if search_text:
-            self.main_app._update_status(f"Found {filtered_count} users matching '{search_text}'")
+    def _iter_all_users(self):
+        """Stream every user in batches (runs on a worker thread).
+        
+        Yields:
+            Dict: User dictionary
+        """
+        after_id = None
+        while True:
+            users = self.db_manager.select_users_page(after_id, INDEX_BATCH_SIZE)
+            yield from users
+            if len(users) < INDEX_BATCH_SIZE:
+                return
+            after_id = users[-1]["userId"]
+    
+    def _on_search_index_built(self, generation, index):
+        """Start using a freshly built search index.
+        
+        Args:
+            generation: Search index generation the build was started in
+            index: The built index, or None if the table is too large to index
+        """
+        if generation != self.main_app.search_index_generation:
+            # The index was rebuilt since; this one may miss later changes
+            return
+        self.main_app.search_index_building = None
+        self.main_app.search_index = index
+        
+        # Re-run a search that went to the server while the index was built
+        if index is not None and self.search_text and self.frame.winfo_exists():
+            self.refresh_list()
+    
+    @staticmethod
+    def _fetch_matches(matches, offset, limit):
+        """Row source over an in-memory list of search results.
+        
+        Args:
+            matches: Matching users
+            offset: Index of the first user of the page, or None
+            limit: Maximum number of users to return
+        
+        Returns:
+            tuple: (users, next_cursor)
+        """
+        offset = offset or 0
+        end = offset + limit
+        return matches[offset:end], end if end < len(matches) else None
+    
+    def _fetch_page(self, after_id, limit):
+        """Row source for browsing all users by ID (runs on a worker thread).
+        
+        Args:
+            after_id: Last user ID of the previous page, or None
+            limit: Maximum number of users to return
+        
+        Returns:
+            tuple: (users, next_cursor)
+        """
+        users = self.db_manager.select_users_page(after_id, limit)
+        next_cursor = users[-1]["userId"] if len(users) == limit else None
+        return users, next_cursor
+    
+    def _fetch_sorted_page(self, cursor, limit):
+        """Row source for browsing all users in the chosen order (runs on a worker thread).
+        
+        Args:
+            cursor: Cursor returned with the previous page, or None
+            limit: Maximum number of users to return
+        
+        Returns:
+            tuple: (users, next_cursor)
+        """
+        return self.db_manager.select_users_sorted(self.sort_column, self.sort_descending, cursor, limit)
+    
+    def _fetch_search_page(self, cursor, limit):
+        """Row source for a search pushed down to the server (runs on a worker thread).
+        
+        Args:
+            cursor: Cursor returned with the previous page, or None
+            limit: Maximum number of users to return
+        
+        Returns:
+            tuple: (users, next_cursor)
+        """
+        return self.db_manager.search_users(self.search_text, limit, cursor)
+    
+    def _update_list_status(self):
+        """Show how many users are in the list."""
+        if not self.frame.winfo_ismapped():
+            # Another view is showing its own status
+            return
+        
+        if self.pages.error is not None:
+            self.main_app._update_status(f"Failed to load users: {self.pages.error}")
+            return
+        
+        count = self.pages.row_count
+        more = " (scroll for more)" if self.pages.has_more else ""
+        if self.search_text:
+            self.main_app._update_status(f"Found {count} users matching '{self.search_text}'{more}")
         else:
-            self.main_app._update_status(f"Loaded {filtered_count} users")
+            self.main_app._update_status(f"Loaded {count} users{more}")
+    
+    def _filter_users(self, *args):
+        """Filter users based on search text, once typing has paused."""
+        if self._search_job is not None:
+            self.frame.after_cancel(self._search_job)
+        self._search_job = self.frame.after(SEARCH_DELAY, self._run_search)
+    
+    def _run_search(self):
+        """Run the debounced search."""
+        self._search_job = None
+        self._load_users()
+    
+    def _import_users(self):
+        """Import users from a CSV or JSON Lines file."""
+        ImportDialog(
+            self.frame.winfo_toplevel(),
+            self.db_manager,
+            self.main_app,
+            on_done=lambda: self.frame.winfo_exists() and self._refresh()
+        )
+    
+    def _export_users(self):
+        """Export users to a CSV or JSON Lines file."""
+        ExportDialog(self.frame.winfo_toplevel(), self.db_manager, self.main_app)
     
     def _get_selected_user_id(self):
         """Get the selected user ID.
@@ -229,15 +940,59 @@ class UserListView:
         if user_id:
             self.main_app._show_user_form(user_id)
     
-    def _delete_selected_user(self):
-        """Delete the selected user."""
-        user_id = self._get_selected_user_id()
-        if user_id:
-            # Confirm deletion
-            if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete user ID {user_id}?\nThis will also delete their login information."):
-                # Delete user
-                if self.db_manager.delete_user(user_id):
-                    messagebox.showinfo("Success", f"User ID {user_id} deleted successfully")
-                    self._load_users()
-                else:
-                    messagebox.showerror("Error", f"Failed to delete user ID {user_id}")
\ No newline at end of file
+    def _get_selected_user_ids(self):
+        """Get the IDs of all selected users.
+        
+        Returns:
+            List[int]: Selected user IDs, empty if there is no selection
+        """
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showinfo("Information", "Please select a user first")
+            return []
+        
+        return [int(iid) for iid in selection]
+    
+    def _delete_selected_users(self):
+        """Delete the selected users."""
+        user_ids = self._get_selected_user_ids()
+        if not user_ids:
+            return
+        
+        if len(user_ids) == 1:
+            question = f"Are you sure you want to delete user ID {user_ids[0]}?"
+        else:
+            question = f"Are you sure you want to delete {len(user_ids):,} users?"
+        # Confirm deletion
+        if not messagebox.askyesno("Confirm Delete", f"{question}\nThis will also delete their login information."):
+            return
+        
+        self.main_app._update_status(f"Deleting {len(user_ids):,} users...")
+        self.main_app.executor.submit(
+            self.db_manager.delete_users, user_ids,
+            on_success=lambda deleted: self._on_users_deleted(user_ids, deleted),
+            on_error=lambda error: messagebox.showerror("Error", f"Failed to delete users: {error}"),
+            owner=self.frame
+        )
+    
+    def _on_users_deleted(self, user_ids, deleted):
+        """Report the result of a deletion and remove the users from the list.
+        
+        Args:
+            user_ids: IDs of the users that were deleted
+            deleted: Number of users deleted, or -1 if the deletion failed
+        """
+        if deleted < 0:
+            messagebox.showerror("Error", "Failed to delete users; no users were deleted")
+            self._update_list_status()
+            return
+        
+        if self.main_app.search_index is not None:
+            for user_id in user_ids:
+                self.main_app.search_index.remove(user_id)
+        self.pages.remove_rows(str(user_id) for user_id in user_ids)
+        
+        if len(user_ids) == 1:
+            messagebox.showinfo("Success", f"User ID {user_ids[0]} deleted successfully")
+        else:
+            messagebox.showinfo("Success", f"{deleted:,} users deleted successfully")
@@ -0,0 +1,119 @@
+"""
+Tests for the read-through record cache.
+"""
+
+from database.cache import RecordCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_get_returns_put_value():
+    cache = RecordCache()
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = RecordCache(ttl=30.0, clock=clock)
+    cache.put("a", 1)
+    clock.now = 29.9
+    assert cache.get("a") == 1
+    clock.now = 30.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 1
+
+
+def test_no_ttl_keeps_entries():
+    clock = FakeClock()
+    cache = RecordCache(ttl=None, clock=clock)
+    cache.put("a", 1)
+    clock.now = 1e9
+    assert cache.get("a") == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = RecordCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_drops_every_entry_with_the_tag():
+    cache = RecordCache()
+    cache.put("user:1", "one", tags=[("user", 1)])
+    cache.put("login:john", "john", tags=[("user", 1), ("login", 7)])
+    cache.put("user:2", "two", tags=[("user", 2)])
+    cache.invalidate([("user", 1)])
+    assert cache.get("user:1") is None
+    assert cache.get("login:john") is None
+    assert cache.get("user:2") == "two"
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_put_after_invalidation_during_read_is_skipped():
+    cache = RecordCache()
+    token = cache.begin_read()
+    cache.invalidate([("user", 1)])
+    cache.put("user:1", "stale", tags=[("user", 1)], token=token)
+    assert cache.get("user:1") is None
+    
+    token = cache.begin_read()
+    cache.put("user:1", "fresh", tags=[("user", 1)], token=token)
+    assert cache.get("user:1") == "fresh"
+
+
+def test_write_through_updates_the_written_entry():
+    cache = RecordCache()
+    cache.put("user:1", {"name": "old"}, tags=[("user", 1)])
+    cache.put("list", ["old"], tags=[("user", 1)])
+    token = cache.begin_read()
+    cache.write_through("user:1", lambda value: {**value, "name": "new"}, [("user", 1)], token)
+    assert cache.get("user:1") == {"name": "new"}
+    assert cache.get("list") is None
+    
+    # The kept entry still carries its tags
+    cache.invalidate([("user", 1)])
+    assert cache.get("user:1") is None
+
+
+def test_write_through_drops_entry_after_concurrent_write():
+    cache = RecordCache()
+    cache.put("user:1", {"name": "old"}, tags=[("user", 1)])
+    token = cache.begin_read()
+    cache.invalidate([("user", 2)])
+    cache.write_through("user:1", lambda value: {**value, "name": "new"}, [("user", 1)], token)
+    assert cache.get("user:1") is None
+
+
+def test_write_through_invalidates_reads_in_flight():
+    cache = RecordCache()
+    read_token = cache.begin_read()
+    cache.write_through("user:1", lambda value: value, [("user", 1)], cache.begin_read())
+    cache.put("user:1", "stale", tags=[("user", 1)], token=read_token)
+    assert cache.get("user:1") is None
+
+
+def test_clear_drops_everything():
+    cache = RecordCache()
+    cache.put("a", 1, tags=["t"])
+    token = cache.begin_read()
+    cache.clear()
+    cache.put("b", 2, token=token)
+    assert len(cache) == 0
+    assert cache.get("a") is None
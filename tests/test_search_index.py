@@ -0,0 +1,86 @@
+"""
+Tests for the in-memory user search index.
+"""
+
+from utils.search_index import UserSearchIndex, tokenize
+
+
+def make_user(user_id, first, last, email, level="basic"):
+    return {"userId": user_id, "firstName": first, "lastName": last, "email": email, "accessLevel": level}
+
+
+def build_index():
+    index = UserSearchIndex()
+    index.add_many([
+        make_user(1, "John", "Doe", "john.doe@example.com"),
+        make_user(2, "Jane", "Doe", "jane@example.org", "admin"),
+        make_user(3, "Johanna", "Smith", "jsmith@example.com"),
+        make_user(12, "Bob", "Jones", "bob@test.net")
+    ])
+    return index
+
+
+def ids(users):
+    return [user["userId"] for user in users]
+
+
+def test_tokenize_keeps_whole_value_and_parts():
+    assert tokenize("John.Doe@Example.com") == {"john", "doe", "example", "com", "john.doe@example.com"}
+
+
+def test_prefix_search_matches_any_field():
+    index = build_index()
+    assert ids(index.search("joh")) == [1, 3]
+    assert ids(index.search("doe")) == [1, 2]
+    assert ids(index.search("example.org")) == [2]
+    assert ids(index.search("admin")) == [2]
+
+
+def test_every_word_must_match():
+    index = build_index()
+    assert ids(index.search("jo doe")) == [1]
+    assert ids(index.search("JANE smith")) == []
+
+
+def test_user_id_is_searchable_as_prefix():
+    index = build_index()
+    assert ids(index.search("1")) == [1, 12]
+
+
+def test_empty_text_returns_everyone_in_id_order():
+    index = build_index()
+    assert ids(index.search("  ")) == [1, 2, 3, 12]
+
+
+def test_edited_user_no_longer_matches_old_values():
+    index = build_index()
+    index.update(make_user(1, "Jim", "Doe", "jim.doe@example.com"))
+    assert ids(index.search("john")) == []
+    assert ids(index.search("jim")) == [1]
+    assert ids(index.search("doe")) == [1, 2]
+    assert index.get(1)["firstName"] == "Jim"
+
+
+def test_edit_to_new_token_keeps_index_sorted():
+    index = build_index()
+    index.update(make_user(3, "Aaron", "Smith", "jsmith@example.com"))
+    index.update(make_user(20, "Zed", "Zulu", "zed@example.com"))
+    assert ids(index.search("aar")) == [3]
+    assert ids(index.search("zu")) == [20]
+    assert ids(index.search("joh")) == [1]
+
+
+def test_removed_user_is_not_found():
+    index = build_index()
+    index.remove(2)
+    assert 2 not in index
+    assert len(index) == 3
+    assert ids(index.search("doe")) == [1]
+    assert ids(index.search("admin")) == []
+
+
+def test_removed_then_readded_user_is_found_again():
+    index = build_index()
+    index.remove(12)
+    index.update(make_user(12, "Bob", "Jones", "bob@test.net"))
+    assert ids(index.search("bob")) == [12]
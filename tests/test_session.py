@@ -0,0 +1,155 @@
+"""
+Tests for the transaction handling of DatabaseManager sessions and bulk writes.
+"""
+
+import threading
+
+import pytest
+
+from database.db_manager import DatabaseManager
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+    
+    def execute(self, query, params=None):
+        # InnoDB opens a transaction with the first statement
+        self.connection.in_transaction = True
+        self.connection.events.append("execute")
+    
+    def executemany(self, query, rows):
+        self.connection.in_transaction = True
+        self.connection.events.append("executemany")
+    
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.in_transaction = False
+        self.events = []
+    
+    def cursor(self, **options):
+        return FakeCursor(self)
+    
+    def commit(self):
+        self.in_transaction = False
+        self.events.append("commit")
+    
+    def rollback(self):
+        self.in_transaction = False
+        self.events.append("rollback")
+    
+    def close(self):
+        self.events.append("close")
+
+
+class FakePool:
+    def __init__(self):
+        self.connection = FakeConnection()
+    
+    def get_connection(self):
+        return self.connection
+
+
+def shared_manager():
+    db = DatabaseManager()
+    db._connection = FakeConnection()
+    db._cursor = db._connection.cursor()
+    return db, db._connection
+
+
+def pooled_manager():
+    db = DatabaseManager(pool_size=1)
+    db._pool = FakePool()
+    db._pool_slots = threading.BoundedSemaphore(1)
+    return db, db._pool.connection
+
+
+@pytest.mark.parametrize("make_manager", [shared_manager, pooled_manager])
+def test_failed_session_is_rolled_back(make_manager):
+    db, connection = make_manager()
+    with pytest.raises(ValueError):
+        with db.session() as cursor:
+            cursor.execute("INSERT INTO User VALUES (1)")
+            raise ValueError("bad row")
+    assert connection.events[:2] == ["execute", "rollback"]
+    assert not connection.in_transaction
+
+
+@pytest.mark.parametrize("make_manager", [shared_manager, pooled_manager])
+def test_nested_session_rolls_back_once_at_the_outer_exit(make_manager):
+    db, connection = make_manager()
+    with pytest.raises(ValueError):
+        with db.session():
+            with db.session() as cursor:
+                cursor.execute("INSERT INTO User VALUES (1)")
+                raise ValueError("bad row")
+    assert connection.events.count("rollback") == 1
+
+
+def test_committed_session_is_not_rolled_back():
+    db, connection = pooled_manager()
+    with db.session() as cursor:
+        cursor.execute("INSERT INTO User VALUES (1)")
+        db.connection.commit()
+    assert connection.events == ["execute", "commit", "close"]
+
+
+@pytest.mark.parametrize("make_manager", [shared_manager, pooled_manager])
+def test_read_snapshot_ends_with_the_session(make_manager):
+    db, connection = make_manager()
+    for _ in range(2):
+        with db.session() as cursor:
+            cursor.execute("SELECT MAX(updatedAt) FROM User")
+        assert not connection.in_transaction
+    assert connection.events.count("rollback") == 2
+
+
+def test_pooled_connection_is_returned_without_a_transaction():
+    db, connection = pooled_manager()
+    with db.session() as cursor:
+        cursor.execute("INSERT INTO User VALUES (1)")
+    assert connection.events == ["execute", "rollback", "close"]
+
+
+def test_next_borrower_gets_a_clean_connection():
+    db, connection = pooled_manager()
+    with pytest.raises(ValueError):
+        with db.session() as cursor:
+            cursor.execute("UPDATE User SET email = NULL")
+            raise ValueError("bad row")
+    with db.session():
+        assert not db.connection.in_transaction
+    assert connection.events == ["execute", "rollback", "close", "close"]
+
+
+def test_insert_logins_bulk_rolls_back_on_an_overlong_password():
+    db, connection = shared_manager()
+    # The minimum cost is slow; the hashes themselves are not under test
+    db.bcrypt_rounds = 4
+    logins = [(1, "a", "pw"), (2, "b", "pw"), (3, "c", "x" * 73), (4, "d", "pw")]
+    # Inside a caller's session the rollback cannot be left to session()
+    with db.session():
+        with pytest.raises(ValueError):
+            db.insert_logins_bulk(logins, batch_size=1, workers=1)
+        assert not connection.in_transaction
+    assert "executemany" in connection.events
+    assert "commit" not in connection.events
+
+
+def test_delete_users_rolls_back_when_the_ids_fail():
+    db, connection = shared_manager()
+    
+    def user_ids():
+        yield from (1, 2, 3)
+        raise TypeError("not an ID")
+    
+    with db.session():
+        with pytest.raises(TypeError):
+            db.delete_users(user_ids(), chunk_size=2)
+        assert not connection.in_transaction
+    assert connection.events[:2] == ["execute", "rollback"]
@@ -0,0 +1,97 @@
+"""
+Tests for the failed login throttle.
+"""
+
+from database.throttle import LoginThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_throttle(**kwargs):
+    clock = FakeClock()
+    options = {"free_attempts": 3, "base_delay": 1.0, "max_delay": 8.0}
+    options.update(kwargs)
+    return LoginThrottle(clock=clock, **options), clock
+
+
+def test_free_attempts_are_not_locked():
+    throttle, _ = make_throttle()
+    assert [throttle.failure("john") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert throttle.retry_after("john") == 0.0
+
+
+def test_delay_doubles_up_to_max_delay():
+    throttle, _ = make_throttle()
+    delays = [throttle.failure("john") for _ in range(8)]
+    assert delays == [0.0, 0.0, 0.0, 1.0, 2.0, 4.0, 8.0, 8.0]
+
+
+def test_retry_after_counts_down():
+    throttle, clock = make_throttle(free_attempts=0, base_delay=5.0)
+    throttle.failure("john")
+    clock.now = 2.0
+    assert throttle.retry_after("john") == 3.0
+    clock.now = 5.0
+    assert throttle.retry_after("john") == 0.0
+
+
+def test_usernames_are_case_folded():
+    throttle, _ = make_throttle(free_attempts=0)
+    throttle.failure("John")
+    assert throttle.retry_after(" JOHN ") == 1.0
+    assert throttle.retry_after("jane") == 0.0
+
+
+def test_success_forgets_failures():
+    throttle, _ = make_throttle(free_attempts=1)
+    throttle.failure("john")
+    throttle.success("JOHN")
+    assert throttle.failure("john") == 0.0
+
+
+def test_failures_are_forgotten_after_max_delay():
+    throttle, clock = make_throttle(free_attempts=1)
+    throttle.failure("john")
+    assert throttle.failure("john") == 1.0
+    clock.now = 1.0 + 8.0
+    assert throttle.failure("john") == 0.0
+
+
+def test_eviction_keeps_locked_usernames():
+    throttle, _ = make_throttle(free_attempts=1, max_entries=2)
+    throttle.failure("john")
+    throttle.failure("john")
+    for i in range(10):
+        throttle.failure(f"other{i}")
+    assert throttle.retry_after("john") == 1.0
+
+
+def test_eviction_forgets_least_recently_failed_usernames():
+    throttle, clock = make_throttle(free_attempts=1, max_entries=2)
+    throttle.failure("john")
+    clock.now = 1.0
+    throttle.failure("jane")
+    clock.now = 2.0
+    throttle.failure("bob")
+    # john was forgotten, so this is his first failure again
+    assert throttle.failure("john") == 0.0
+    # which in turn pushed out jane, but not bob
+    assert throttle.failure("bob") == 1.0
+
+
+def test_memory_is_bounded_when_every_username_is_locked():
+    throttle, _ = make_throttle(free_attempts=0, max_entries=3)
+    for _ in range(3):
+        throttle.failure("john")
+    for i in range(1000):
+        throttle.failure(f"other{i}")
+    assert len(throttle._entries) == 3
+    assert len(throttle._expiry) <= 2 * 3 + 1
+    # The shorter locks of the other names run out first and go first
+    assert throttle.retry_after("john") == 4.0
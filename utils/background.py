@@ -0,0 +1,257 @@
+"""
+Background executor for running blocking database calls off the Tk thread.
+"""
+
+import queue
+import threading
+import traceback
+
+
+class BackgroundTask:
+    """Handle for a call submitted to the BackgroundExecutor."""
+    
+    def __init__(self, func, args, kwargs, on_success, on_error, key, owner, quiet=False):
+        """Initialize a task.
+        
+        Args:
+            func: Callable to run on a worker thread
+            args: Positional arguments for func
+            kwargs: Keyword arguments for func
+            on_success: Callback receiving the result on the Tk thread
+            on_error: Callback receiving the exception on the Tk thread
+            key: Optional key; a newer task with the same key supersedes this one
+            owner: Optional widget; callbacks are dropped once it is destroyed
+            quiet: Do not report the task to busy listeners
+        """
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.on_success = on_success
+        self.on_error = on_error
+        self.key = key
+        self.owner = owner
+        self.quiet = quiet
+        self.cancelled = False
+    
+    def cancel(self):
+        """Cancel the task.
+        
+        A task that has not started yet is skipped; a running task finishes,
+        but its callbacks are not invoked.
+        """
+        self.cancelled = True
+
+
+class BackgroundExecutor:
+    """Run callables on worker threads and deliver results on the Tk thread.
+    
+    Tkinter is not thread-safe, so workers never touch widgets. Finished
+    results are put on a queue that the Tk thread drains with ``root.after``
+    and the success or error callbacks run there.
+    """
+    
+    def __init__(self, root, max_workers: int = 4, poll_interval: int = 50):
+        """Initialize the executor and start its worker threads.
+        
+        Args:
+            root: Tkinter root window
+            max_workers: Number of worker threads
+            poll_interval: Milliseconds between checks for finished tasks
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._latest = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._busy_listeners = []
+        self._running = True
+        self._workers = []
+        
+        for index in range(max_workers):
+            worker = threading.Thread(
+                target=self._worker,
+                name=f"db-worker-{index + 1}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        
+        self._poll()
+    
+    def submit(self, func, *args, on_success=None, on_error=None, key=None, owner=None, quiet=False, **kwargs):
+        """Run func(*args, **kwargs) on a worker thread.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            on_success: Callback receiving the result on the Tk thread
+            on_error: Callback receiving the exception on the Tk thread
+            key: Optional key; submitting a new task with the same key cancels the older one
+            owner: Optional widget; callbacks are dropped once it is destroyed
+            quiet: Do not report the task to busy listeners, e.g. for periodic polling
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            BackgroundTask: Handle that can be used to cancel the task
+        """
+        task = BackgroundTask(func, args, kwargs, on_success, on_error, key, owner, quiet)
+        
+        with self._lock:
+            if key is not None:
+                previous = self._latest.get(key)
+                if previous is not None:
+                    previous.cancel()
+                self._latest[key] = task
+            if not quiet:
+                self._pending += 1
+            pending = self._pending
+        
+        if pending == 1 and not quiet:
+            self._notify_busy(True)
+        
+        self._tasks.put(task)
+        return task
+    
+    def post(self, callback, *args):
+        """Schedule callback(*args) on the Tk thread; safe to call from any thread.
+        
+        Args:
+            callback: Callable to run on the Tk thread
+            *args: Arguments for callback
+        """
+        self._results.put((callback, args))
+    
+    def cancel(self, key):
+        """Cancel the latest task submitted with the given key.
+        
+        Args:
+            key: Task key
+        """
+        with self._lock:
+            task = self._latest.pop(key, None)
+        if task is not None:
+            task.cancel()
+    
+    def add_busy_listener(self, callback):
+        """Register a callback invoked with True/False as work starts and stops.
+        
+        Args:
+            callback: Callable receiving a bool on the Tk thread
+        """
+        self._busy_listeners.append(callback)
+    
+    def remove_busy_listener(self, callback):
+        """Unregister a busy listener.
+        
+        Args:
+            callback: Previously registered callable
+        """
+        if callback in self._busy_listeners:
+            self._busy_listeners.remove(callback)
+    
+    @property
+    def busy(self) -> bool:
+        """Whether any submitted task has not been delivered yet."""
+        return self._pending > 0
+    
+    def shutdown(self):
+        """Stop delivering results and let the worker threads exit."""
+        self._running = False
+        for _ in self._workers:
+            self._tasks.put(None)
+    
+    def _worker(self):
+        """Worker thread loop."""
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            
+            if task.cancelled:
+                self._results.put((self._finish, (task, None, None)))
+                continue
+            
+            try:
+                result = task.func(*task.args, **task.kwargs)
+                self._results.put((self._finish, (task, result, None)))
+            except Exception as error:
+                self._results.put((self._finish, (task, None, error)))
+    
+    def _finish(self, task, result, error):
+        """Deliver a finished task's outcome on the Tk thread.
+        
+        Args:
+            task: The finished task
+            result: Return value of the task's callable
+            error: Exception raised by the callable, if any
+        """
+        with self._lock:
+            if task.key is not None and self._latest.get(task.key) is task:
+                del self._latest[task.key]
+            if not task.quiet:
+                self._pending -= 1
+            pending = self._pending
+        
+        if pending == 0 and not task.quiet:
+            self._notify_busy(False)
+        
+        if task.cancelled:
+            return
+        
+        if task.owner is not None and not self._widget_exists(task.owner):
+            return
+        
+        if error is not None:
+            if task.on_error:
+                task.on_error(error)
+        elif task.on_success:
+            task.on_success(result)
+    
+    def _notify_busy(self, busy: bool):
+        """Notify busy listeners, deferring to the Tk thread when needed.
+        
+        Args:
+            busy: Whether work is in progress
+        """
+        for listener in list(self._busy_listeners):
+            self._results.put((listener, (busy,)))
+    
+    def _poll(self):
+        """Drain finished results and reschedule itself."""
+        if not self._running:
+            return
+        
+        while True:
+            try:
+                callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                callback(*args)
+            except Exception:
+                # A failing callback must not stop result delivery
+                traceback.print_exc()
+        
+        try:
+            self.root.after(self.poll_interval, self._poll)
+        except Exception:
+            # Root window has been destroyed
+            self._running = False
+    
+    @staticmethod
+    def _widget_exists(widget) -> bool:
+        """Check whether a Tk widget still exists.
+        
+        Args:
+            widget: Tk widget
+        
+        Returns:
+            bool: True if the widget has not been destroyed
+        """
+        try:
+            return bool(widget.winfo_exists())
+        except Exception:
+            return False
@@ -2,14 +2,26 @@
 Configuration settings for the application.
 """
 
-import tkinter as tk
-from tkinter import ttk
+from contextlib import contextmanager
+import atexit
 import os
 import json
+import tempfile
+import threading
+
+
+# Seconds to wait after the last change before writing the configuration file
+SAVE_DELAY = 0.5
 
 
 class AppConfig:
-    """Class to handle application configuration settings."""
+    """Class to handle application configuration settings.
+    
+    Changes are kept in memory and written shortly after the last one, on a
+    background thread, so UI event handlers never wait for the disk. The
+    file is replaced atomically and any pending changes are written when
+    the application exits.
+    """
     
     def __init__(self):
         """Initialize configuration with default settings."""
@@ -19,15 +31,37 @@ class AppConfig:
             "host": "localhost",
             "user": "root",
             "last_database": "",
-            "window_size": "800x600"
+            "window_size": "800x600",
+            "pool_size": 4,
+            "search_index_limit": 500000,
+            "import_batch_size": 1000,
+            "import_commit_interval": 10000,
+            "allow_local_infile": False,
+            "bcrypt_rounds": None,
+            "bcrypt_target_ms": 250,
+            "instrumentation": True,
+            "slow_query_ms": 200,
+            "slow_query_log": "~/.user_management_system/slow_queries.log",
+            "change_poll_interval_ms": 5000,
+            "point_cache_size": 1024,
+            "point_cache_ttl": 30
         }
         
         # Create config directory if it doesn't exist
         os.makedirs(os.path.expanduser("~/.user_management_system"), exist_ok=True)
         self.config_file = os.path.expanduser("~/.user_management_system/config.json")
         
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._batch_depth = 0
+        self._timer = None
+        
         # Load existing configuration if available
         self.load_config()
+        
+        # Write changes still waiting for their delay on exit
+        atexit.register(self.flush)
     
     def load_config(self):
         """Load configuration from file."""
@@ -42,13 +76,77 @@ class AppConfig:
             pass
     
     def save_config(self):
-        """Save current configuration to file."""
+        """Save current configuration to file now.
+        
+        The configuration is written to a temporary file that then replaces
+        the old one, so a crash mid-write never leaves a truncated file.
+        """
+        # Serialize writers, and snapshot under the same lock, so an older
+        # snapshot never replaces a newer one
+        with self._save_lock:
+            with self._lock:
+                self._cancel_timer()
+                self._dirty = False
+                data = json.dumps(self.config)
+            
+            temp_path = None
+            try:
+                directory = os.path.dirname(self.config_file)
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".config-", suffix=".tmp")
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.config_file)
+            except Exception:
+                # If saving fails, continue silently but keep the changes
+                # pending so the next save or the exit flush retries them
+                with self._lock:
+                    self._dirty = True
+                if temp_path is not None and os.path.exists(temp_path):
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+    
+    def flush(self):
+        """Write pending changes now, if there are any."""
+        with self._lock:
+            if not self._dirty:
+                return
+        self.save_config()
+    
+    @contextmanager
+    def batch(self):
+        """Group several changes into one write.
+        
+        Example:
+            with config.batch():
+                config.set("host", host)
+                config.set("user", user)
+        """
+        with self._lock:
+            self._batch_depth += 1
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f)
-        except Exception:
-            # If saving fails, continue silently
-            pass
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self._schedule_save()
+    
+    def _schedule_save(self):
+        """Restart the save delay; the caller holds the lock."""
+        self._cancel_timer()
+        self._timer = threading.Timer(SAVE_DELAY, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _cancel_timer(self):
+        """Cancel a scheduled save; the caller holds the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
     
     def get(self, key, default=None):
         """Get a configuration value.
@@ -63,14 +161,19 @@ class AppConfig:
         return self.config.get(key, default)
     
     def set(self, key, value):
-        """Set a configuration value and save configuration.
+        """Set a configuration value and schedule saving the configuration.
         
         Args:
             key: Configuration key
             value: Value to set
         """
-        self.config[key] = value
-        self.save_config()
+        with self._lock:
+            if key in self.config and self.config[key] == value:
+                return
+            self.config[key] = value
+            self._dirty = True
+            if self._batch_depth == 0:
+                self._schedule_save()
     
     def apply_theme(self, root):
         """Apply the configured theme to the application.
@@ -81,6 +184,9 @@ class AppConfig:
         Returns:
             ttk.Style: The configured style object
         """
+        # Imported here so that headless tools can use the configuration
+        from tkinter import ttk
+        
         style = ttk.Style(root)
         
         if self.get("theme") == "dark":
@@ -0,0 +1,241 @@
+"""
+In-memory prefix index for searching users without querying the database.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+import re
+
+
+# Fields of a user record that are searchable
+SEARCH_FIELDS = ("userId", "firstName", "lastName", "email", "accessLevel")
+
+_TOKEN_SPLIT = re.compile(r"[^0-9a-z]+")
+
+
+def tokenize(text):
+    """Split text into lowercase search tokens.
+
+    The whole lowercased value is kept as a token as well, so a query such as
+    ``john.doe@ex`` still matches an email address as a prefix.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        set: Set of tokens
+    """
+    text = str(text).lower()
+    tokens = {part for part in _TOKEN_SPLIT.split(text) if part}
+    if text:
+        tokens.add(text)
+    return tokens
+
+
+def user_tokens(user):
+    """Collect the search tokens of a user record.
+
+    Args:
+        user: User dictionary
+
+    Returns:
+        set: Set of tokens
+    """
+    tokens = set()
+    for field in SEARCH_FIELDS:
+        value = user[field]
+        if value is not None:
+            tokens.update(tokenize(value))
+    return tokens
+
+
+class UserSearchIndex:
+    """Prefix index over the searchable fields of users.
+
+    Every token maps to a compact array of user IDs, and the sorted list of
+    distinct tokens lets a query word find all tokens it is a prefix of with
+    two binary searches. Edits and removals only touch the affected record;
+    postings of edited users may go stale, so their candidates are checked
+    against the current record when a query is answered.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._records = {}
+        self._postings = {}
+        self._tokens = []
+        self._sorted = True
+        # IDs whose postings may be stale because they were edited or removed
+        self._edited = set()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, user_id):
+        return user_id in self._records
+
+    def add_many(self, users):
+        """Add users in bulk, e.g. while the index is being built.
+
+        The token list is sorted once at the end, so pass the whole stream of
+        users in a single call rather than calling this once per batch.
+
+        Args:
+            users: Iterable of user dictionaries
+        """
+        self._sorted = False
+        for user in users:
+            self._add(user)
+        self._ensure_sorted()
+
+    def update(self, user):
+        """Add a new user or replace the indexed copy of an edited one.
+
+        Args:
+            user: User dictionary
+        """
+        self._ensure_sorted()
+        if user["userId"] in self._records:
+            self._edited.add(user["userId"])
+        for token in self._add(user):
+            insort(self._tokens, token)
+
+    def remove(self, user_id):
+        """Remove a user from the index.
+
+        Args:
+            user_id: ID of the user to remove
+        """
+        if self._records.pop(user_id, None) is not None:
+            self._edited.add(user_id)
+
+    def get(self, user_id):
+        """Return the indexed copy of a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dict: User dictionary, or None if the user is not indexed
+        """
+        return self._records.get(user_id)
+
+    def search(self, text):
+        """Find users matching every word of the search text.
+
+        A word matches when it is a prefix of any token of the user's ID,
+        names, email or access level.
+
+        Args:
+            text: Search text
+
+        Returns:
+            List[Dict]: Matching users ordered by user ID
+        """
+        words = {part for part in _TOKEN_SPLIT.split(str(text).lower()) if part}
+        if not words:
+            return [self._records[user_id] for user_id in sorted(self._records)]
+
+        self._ensure_sorted()
+
+        # Start with the rarest word so the candidate set stays small
+        candidates = None
+        for word in sorted(words, key=self._estimate):
+            ids = self._prefix_ids(word)
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        # Postings of edited users may be stale, so check their current record
+        stale = candidates & self._edited
+        for user_id in stale:
+            user = self._records.get(user_id)
+            if user is None or not self._matches(user, words):
+                candidates.discard(user_id)
+
+        return [self._records[user_id] for user_id in sorted(candidates)]
+
+    def _add(self, user):
+        """Store a record and its postings.
+
+        Args:
+            user: User dictionary
+
+        Returns:
+            list: Tokens that were not in the index before
+        """
+        user_id = user["userId"]
+        self._records[user_id] = user
+
+        new_tokens = []
+        for token in user_tokens(user):
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = array("q")
+                new_tokens.append(token)
+            posting.append(user_id)
+
+        if not self._sorted:
+            self._tokens.extend(new_tokens)
+            return []
+        return new_tokens
+
+    def _ensure_sorted(self):
+        """Sort the token list after a bulk load."""
+        if not self._sorted:
+            self._tokens.sort()
+            self._sorted = True
+
+    def _token_range(self, word):
+        """Find the slice of the sorted token list that starts with word.
+
+        Args:
+            word: Query word
+
+        Returns:
+            tuple: (start, end) indexes into the token list
+        """
+        start = bisect_left(self._tokens, word)
+        end = bisect_left(self._tokens, word + "\uffff", start)
+        return start, end
+
+    def _estimate(self, word):
+        """Estimate how many postings a word expands to.
+
+        Args:
+            word: Query word
+
+        Returns:
+            int: Number of matching tokens
+        """
+        start, end = self._token_range(word)
+        return end - start
+
+    def _prefix_ids(self, word):
+        """Collect the IDs of all users with a token starting with word.
+
+        Args:
+            word: Query word
+
+        Returns:
+            set: Set of user IDs
+        """
+        start, end = self._token_range(word)
+        ids = set()
+        for token in self._tokens[start:end]:
+            ids.update(self._postings[token])
+        return ids
+
+    @staticmethod
+    def _matches(user, words):
+        """Check a record against all query words.
+
+        Args:
+            user: User dictionary
+            words: Query words
+
+        Returns:
+            bool: True if every word is a prefix of one of the record's tokens
+        """
+        tokens = user_tokens(user)
+        return all(any(token.startswith(word) for token in tokens) for word in words)
@@ -0,0 +1,134 @@
+"""
+Startup profiling: import times per module and durations of startup phases.
+
+Enabled with ``--profile-startup``. Works in packaged builds too, where
+``python -X importtime`` is not available.
+"""
+
+from contextlib import contextmanager
+import sys
+import threading
+import time
+
+
+class _TimedLoader:
+    """Loader proxy that times module execution."""
+    
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+    
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+    
+    def exec_module(self, module):
+        if threading.current_thread() is not threading.main_thread():
+            self._loader.exec_module(module)
+            return
+        self._profiler._begin_import()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end_import(module.__name__)
+
+
+class _TimingFinder:
+    """Meta path finder that wraps the loaders found by the other finders."""
+    
+    def __init__(self, profiler):
+        self._profiler = profiler
+    
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Records import times of modules and durations of named phases.
+    
+    Import times are measured on the main thread only, so modules loaded
+    in the background after the window is shown do not distort the report.
+    """
+    
+    def __init__(self):
+        """Start the clock."""
+        self.started = time.perf_counter()
+        self.phases = []
+        # Module name -> (cumulative seconds, self seconds)
+        self.imports = {}
+        self._stack = []
+        self._finder = None
+    
+    def install(self):
+        """Start timing imports."""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+    
+    def uninstall(self):
+        """Stop timing imports."""
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+    
+    def _begin_import(self):
+        self._stack.append([time.perf_counter(), 0.0])
+    
+    def _end_import(self, name):
+        started, children = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        self.imports[name] = (elapsed, elapsed - children)
+        if self._stack:
+            self._stack[-1][1] += elapsed
+    
+    @contextmanager
+    def phase(self, name):
+        """Time a startup phase.
+        
+        Args:
+            name: Phase name shown in the report
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, started - self.started, time.perf_counter() - started))
+    
+    def mark(self, name):
+        """Record a point in time, e.g. the window becoming visible.
+        
+        Args:
+            name: Event name shown in the report
+        """
+        self.phases.append((name, time.perf_counter() - self.started, None))
+    
+    def report(self, file=None, top=25):
+        """Print the phases and the slowest imports.
+        
+        Args:
+            file: Stream to write to, standard error by default
+            top: Number of modules to list
+        """
+        file = file or sys.stderr
+        print("Startup profile", file=file)
+        print(f"{'phase':<36}{'at ms':>10}{'took ms':>10}", file=file)
+        for name, at, took in self.phases:
+            took_text = f"{took * 1000:>10.1f}" if took is not None else f"{'':>10}"
+            print(f"{name:<36}{at * 1000:>10.1f}{took_text}", file=file)
+        
+        total_self = sum(own for _, own in self.imports.values())
+        print(f"\n{len(self.imports)} modules imported in {total_self * 1000:.1f} ms; slowest by cumulative time:",
+              file=file)
+        print(f"{'module':<48}{'cumul ms':>10}{'self ms':>10}", file=file)
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        for name, (cumulative, own) in slowest:
+            print(f"{name:<48}{cumulative * 1000:>10.1f}{own * 1000:>10.1f}", file=file)
+        file.flush()